@@ -1,30 +1,30 @@
+import sys
 import json
-import re
 from collections import Counter
 
-def analyze_others():
-    with open('rescue-app/src/data.json', 'r', encoding='utf-8') as f:
+from rescue_parser.miner import PhraseMiner
+from rescue_parser.store import CaseStore
+
+def load_others(path):
+    # Kho SQLite (--store): chỉ đọc các ca 'Khác' qua index, không tải cả data.json
+    if path.endswith('.db'):
+        with CaseStore(path) as store:
+            return store.by_area('Khác')
+    with open(path, 'r', encoding='utf-8') as f:
         data = json.load(f)
-    
-    others = [item for item in data if item['area'] == 'Khác']
+    return [item for item in data if item['area'] == 'Khác']
+
+def analyze_others(path='rescue-app/src/data.json'):
+    others = load_others(path)
     print(f"Tổng số ca 'Khác': {len(others)}")
-    
-    # Phân tích từ khóa trong content của 'Khác'
-    words = []
+
+    # Cụm 1-4 từ viết hoa hay gặp trong 'Khác' (gợi ý tên đường/thôn/xã còn thiếu)
+    miner = PhraseMiner()
     for item in others:
-        # Lấy 10 từ đầu tiên của content (thường là địa chỉ)
-        content = item['content'].lower()
-        # Loại bỏ các từ thông thường
-        content = re.sub(r'khẩn cấp|ưu tiên|cần|cứu|hộ|người|nhà|bị|ngập|nước|lên|cao|số|điện|thoại|liên|hệ', '', content)
-        tokens = re.findall(r'\b\w+\b', content)
-        words.extend(tokens)
-    
-    # Đếm các từ xuất hiện nhiều nhất (gợi ý tên đường/thôn/xã)
-    common_words = Counter(words).most_common(50)
-    print("\nTop từ khóa xuất hiện trong 'Khác':")
-    for word, count in common_words:
-        if len(word) > 2: # Bỏ từ quá ngắn
-            print(f"{word}: {count}")
+        miner.add_case(item)
+    print("\nTop cụm gợi ý trong 'Khác' (số ca):")
+    for candidate in miner.candidates(top=50):
+        print(f"{candidate['keyword']}: {candidate['count']}")
 
     # Kiểm tra Priority của 'Khác'
     priorities = Counter([item['priority'] for item in others])
@@ -36,4 +36,4 @@ def analyze_others():
         print(f"- [{item['priority']}] {item['content'][:100]}...")
 
 if __name__ == "__main__":
-    analyze_others()
+    analyze_others(*sys.argv[1:2])
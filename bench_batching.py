@@ -0,0 +1,92 @@
+import json
+import math
+import time
+import random
+import argparse
+
+from rescue_parser import batching
+from rescue_parser.geocode import DEFAULT_PLACES
+from rescue_parser.spatial import KM_PER_DEGREE
+from rescue_parser.synthetic import parse_size
+
+PRIORITIES = [('HIGH', 68), ('MEDIUM', 19), ('CRITICAL', 8), ('LOW', 5)]
+
+
+def make_cases(n, seed):
+    """Case giả lập đã geocode, tụ quanh các địa danh trong places.json"""
+    rng = random.Random(seed)
+    with open(DEFAULT_PLACES, 'r', encoding='utf-8') as f:
+        places = json.load(f)['places']
+    cases = []
+    for i in range(n):
+        place = rng.choice(places)
+        cases.append({
+            'id': i + 1,
+            'priority': rng.choices([p for p, _ in PRIORITIES], [w for _, w in PRIORITIES])[0],
+            'isRescued': rng.random() < 0.3,
+            'location': {
+                'lat': place['lat'] + rng.gauss(0, 0.01),
+                'lng': place['lng'] + rng.gauss(0, 0.01),
+                'precision': place['kind'],
+            },
+        })
+    return cases
+
+
+def nn_only(members, xs, ys, start):
+    """Chỉ láng giềng gần nhất (không 2-opt), để đo phần 2-opt rút ngắn được"""
+    remaining = set(members) - {start}
+    path = [start]
+    while remaining:
+        last = path[-1]
+        nxt = min(remaining, key=lambda j: (batching._dist(last, j, xs, ys), j))
+        path.append(nxt)
+        remaining.remove(nxt)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark gom đợt điều phối (DBSCAN + tuyến NN/2-opt)")
+    parser.add_argument('--sizes', default='1k,5k,10k')
+    parser.add_argument('--capacity', type=int, default=batching.DEFAULT_CAPACITY)
+    parser.add_argument('--eps', type=float, default=batching.DEFAULT_EPS_KM)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="Ghi kết quả ra JSON")
+    args = parser.parse_args()
+
+    print(f"  {'case':>7} {'giây':>7} {'đợt':>6} {'từ cụm':>7} {'km/đợt':>7} {'km NN':>9} {'km 2-opt':>9}")
+    results = []
+    for size in args.sizes.split(','):
+        n = parse_size(size)
+        cases = make_cases(n, args.seed)
+        start = time.perf_counter()
+        result = batching.batch_cases(cases, args.eps, batching.DEFAULT_MIN_WEIGHT, args.capacity)
+        elapsed = time.perf_counter() - start
+
+        # Tổng quãng đường nếu chỉ dùng NN, trên đúng các đợt đã chọn
+        by_id = {c['id']: c for c in cases}
+        ref_lat = sum(c['location']['lat'] for c in cases) / len(cases)
+        kx = KM_PER_DEGREE * math.cos(math.radians(ref_lat))
+        nn_km = 0.0
+        for batch in result['batches']:
+            members = batch['cases']
+            xs = {i: by_id[i]['location']['lng'] * kx for i in members}
+            ys = {i: by_id[i]['location']['lat'] * KM_PER_DEGREE for i in members}
+            nn_km += batching.path_length(nn_only(members, xs, ys, members[0]), xs, ys)
+        opt_km = sum(b['distance_km'] for b in result['batches'])
+        batches = result['batches']
+        clustered = sum(1 for b in batches if b['clustered'])
+        print(f"  {n:>7} {elapsed:7.2f} {len(batches):>6} {clustered:>7} {opt_km / len(batches):7.2f}"
+              f" {nn_km:9.1f} {opt_km:9.1f}")
+        results.append({'cases': n, 'seconds': elapsed, 'batches': len(batches), 'clustered': clustered,
+                        'nn_km': nn_km, 'two_opt_km': opt_km})
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'capacity': args.capacity, 'eps_km': args.eps, 'results': results},
+                      f, ensure_ascii=False, indent=2)
+        print(f"\n💾 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
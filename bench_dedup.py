@@ -0,0 +1,72 @@
+import time
+import argparse
+from difflib import SequenceMatcher
+
+from rescue_parser.dedup_index import find_duplicate_groups
+from rescue_parser.full import parse_line, case_features, is_duplicate, is_duplicate_features
+from rescue_parser.similarity import BACKENDS
+
+
+def collect_pairs(cases):
+    """Các cặp ứng viên mà chỉ mục blocking đưa ra chấm điểm"""
+    owner = {}
+    pairs = []
+
+    def features_of(case):
+        f = case_features(case)
+        owner[id(f)] = case
+        return f
+
+    def record(f1, f2):
+        pairs.append((owner[id(f1)], owner[id(f2)]))
+        return False
+
+    find_duplicate_groups(cases, features_of, record, block_of=lambda c: c['area'])
+    return pairs
+
+
+def bench(name, func, n, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"  {name:<36} {best * 1000:9.2f} ms  {best / n * 1e6:7.2f} µs/cặp")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark chi phí so sánh từng cặp trong lọc trùng")
+    parser.add_argument('input', nargs='?', default='pdf_content.txt')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--threshold', type=float, default=0.8)
+    args = parser.parse_args()
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        cases = [c for c in (parse_line(line) for line in f) if c is not None]
+    pairs = collect_pairs(cases)
+    print(f"⏱️ {len(cases)} case, {len(pairs)} cặp ứng viên, best of {args.repeat}")
+
+    # Trước: is_duplicate chuẩn hóa lại SĐT + địa chỉ ở mỗi cặp
+    before = bench("is_duplicate (dict, chuẩn hóa mỗi cặp)",
+                   lambda: [is_duplicate(c1, c2) for c1, c2 in pairs], len(pairs), args.repeat)
+
+    # Sau: đặc trưng tính 1 lần cho mỗi case (tính cả chi phí này)
+    def with_features():
+        features = {id(c): case_features(c) for c in cases}
+        return [is_duplicate_features(features[id(c1)], features[id(c2)]) for c1, c2 in pairs]
+
+    after = bench("is_duplicate_features (+ tính đặc trưng)", with_features, len(pairs), args.repeat)
+    print(f"\n🚀 Nhanh hơn {before / after:.2f} lần")
+
+    # Chỉ phần so sánh địa chỉ: ratio() đầy đủ so với các backend có cắt tỉa sớm
+    keys = [(case_features(c1).key, case_features(c2).key) for c1, c2 in pairs]
+    print(f"\n📊 So sánh địa chỉ, ngưỡng {args.threshold}:")
+    bench("SequenceMatcher.ratio() đầy đủ",
+          lambda: [SequenceMatcher(None, a, b).ratio() >= args.threshold for a, b in keys], len(pairs), args.repeat)
+    for name, func in sorted(BACKENDS.items()):
+        bench(name, lambda: [func(a, b, args.threshold) for a, b in keys], len(pairs), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
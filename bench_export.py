@@ -0,0 +1,66 @@
+import gzip
+import json
+import time
+import argparse
+
+from rescue_parser.formats import SUFFIXES, decode, encode
+from rescue_parser.pipeline import DEFAULT_OUTPUT
+
+
+def best_of(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def parse_only(text, fmt):
+    """Chỉ parse JSON (chưa dựng lại dict từng case), như JSON.parse phía frontend"""
+    if fmt == 'jsonl':
+        return [json.loads(line) for line in text.splitlines()]
+    return json.loads(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="So sánh kích thước + thời gian ghi/đọc các định dạng xuất")
+    parser.add_argument('input', nargs='?', default=DEFAULT_OUTPUT, help="data.json (pretty) để chuyển đổi")
+    parser.add_argument('--scale', type=int, default=1, help="Nhân bản số case (giả lập file lớn hơn)")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help="Ghi kết quả ra JSON")
+    args = parser.parse_args()
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        base = json.load(f)
+    cases = [dict(c, id=i * len(base) + c['id']) for i in range(args.scale) for c in base]
+
+    results = []
+    print(f"📦 {len(cases)} case, best of {args.repeat}")
+    print(f"  {'định dạng':<10} {'byte':>10} {'gzip':>9} {'xN':>5} {'ghi (ms)':>9} {'parse (ms)':>10} {'xN':>5} {'giải mã (ms)':>12}")
+    for fmt in SUFFIXES:
+        text = encode(cases, fmt)
+        assert decode(text) == cases, fmt
+        data = text.encode('utf-8')
+        r = {
+            'format': fmt,
+            'bytes': len(data),
+            'gzip_bytes': len(gzip.compress(data)),
+            'encode_ms': best_of(lambda: encode(cases, fmt), args.repeat) * 1000,
+            'parse_ms': best_of(lambda: parse_only(text, fmt), args.repeat) * 1000,
+            # Giải mã = parse JSON + dựng lại danh sách dict như data.json
+            'decode_ms': best_of(lambda: decode(text), args.repeat) * 1000,
+        }
+        results.append(r)
+        pretty = results[0]
+        print(f"  {fmt:<10} {r['bytes']:>10} {r['gzip_bytes']:>9} {pretty['bytes'] / r['bytes']:5.2f}"
+              f" {r['encode_ms']:9.2f} {r['parse_ms']:10.2f} {pretty['parse_ms'] / r['parse_ms']:5.2f} {r['decode_ms']:12.2f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'input': args.input, 'cases': len(cases), 'results': results}, f, indent=2)
+        print(f"\n💾 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
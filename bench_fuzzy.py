@@ -0,0 +1,89 @@
+import time
+import random
+import argparse
+
+from rescue_parser.fuzzy import MIN_LENGTH, FuzzyGazetteer, _distance, _initials, max_distance
+from rescue_parser.gazetteer import AREA_GAZETTEER, AREA_KEYWORDS
+from rescue_parser.normalize import fold
+from rescue_parser.synthetic import parse_size
+
+# Âm tiết để ghép tên địa danh giả lập (thôn / xóm / đường)
+SYLLABLES = ['Vĩnh', 'Phú', 'Diên', 'Xuân', 'Phước', 'Hòa', 'Tân', 'Bình', 'Trung', 'Đông', 'Tây', 'Nam',
+             'Thạnh', 'Lộc', 'Khánh', 'Sơn', 'Thọ', 'Điềm', 'Cầu', 'Gò', 'Lương', 'Ngọc', 'Hiệp', 'Thái',
+             'Long', 'Hải', 'Quang', 'Mỹ', 'An', 'Lạc', 'Đồng', 'Hưng', 'Thuận', 'Kim', 'Bồng', 'Thượng']
+
+
+def make_mapping(n, seed):
+    """AREA_KEYWORDS + n tên giả lập 2-4 âm tiết (không trùng tên thật)"""
+    rng = random.Random(seed)
+    mapping = dict(AREA_KEYWORDS)
+    while len(mapping) < len(AREA_KEYWORDS) + n:
+        name = ' '.join(rng.choice(SYLLABLES) for _ in range(rng.choice((2, 2, 3, 3, 4))))
+        mapping.setdefault(name, 'Giả lập')
+    return mapping
+
+
+def brute_force(gazetteer, text):
+    """Tham chiếu: so mọi cửa sổ với mọi tên (cùng luật với FuzzyGazetteer), để kiểm tra kết quả"""
+    best = None
+    tokens = fold(text).split()
+    names = list(gazetteer.names)
+    for name in names:
+        size = len(name.split())
+        for i in range(len(tokens) - size + 1):
+            window = tokens[i:i + size]
+            if len(' '.join(window)) < MIN_LENGTH - 1 or _initials(' '.join(window)) != _initials(name):
+                continue
+            d = _distance(window, name.split(), max_distance(len(name)))
+            if d is not None and (best is None or (d, -len(name), names.index(name)) <
+                                  (best[0], -len(best[1]), names.index(best[1]))):
+                best = (d, name)
+    if best is None:
+        return gazetteer.find_abbreviation(text)
+    return gazetteer.names[best[1]], best[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tra địa danh gần đúng (SymSpell) cho dòng 'Khác'")
+    parser.add_argument('input', nargs='?', default='pdf_content.txt')
+    parser.add_argument('--sizes', default='0,1k,5k,20k', help="Số tên giả lập thêm vào từ điển")
+    parser.add_argument('--check', type=int, default=200, help="Số dòng so với brute force")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        lines = [line.strip() for line in f if len(line.strip()) >= 5]
+
+    # Dòng nào khớp chính xác không ra khu vực thì tra gần đúng
+    others = [line for line in lines if AREA_GAZETTEER.lookup(line) == 'Khác']
+    fuzzy = FuzzyGazetteer(AREA_KEYWORDS)
+    recovered = [(line, fuzzy.find(line)) for line in others]
+    recovered = [(line, found) for line, found in recovered if found]
+    print(f"📍 {len(lines)} dòng, {len(others)} dòng 'Khác', tra gần đúng được {len(recovered)}")
+    for line, (keyword, distance) in recovered:
+        print(f"  d={distance} {keyword:<16} | {line[:90]}")
+
+    print(f"\n  {'tên':>7} {'xây (ms)':>9} {'µs/dòng':>8} {'µs/Khác':>8} {'khớp brute':>11}")
+    for size in args.sizes.split(','):
+        mapping = make_mapping(parse_size(size), args.seed)
+        start = time.perf_counter()
+        gazetteer = FuzzyGazetteer(mapping)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for line in lines:
+            gazetteer.find(line)
+        per_line = (time.perf_counter() - start) / len(lines)
+        start = time.perf_counter()
+        for line in others:
+            gazetteer.find(line)
+        per_other = (time.perf_counter() - start) / max(len(others), 1)
+
+        sample = lines[:args.check]
+        same = sum(gazetteer.find(line) == brute_force(gazetteer, line) for line in sample)
+        print(f"  {len(mapping):>7} {build * 1000:9.1f} {per_line * 1e6:8.1f} {per_other * 1e6:8.1f}"
+              f" {same:>5}/{len(sample)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import resource
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from rescue_parser.pipeline import export, run
+from rescue_parser.profiling import PipelineProfiler, stage_of
+from rescue_parser.synthetic import DEFAULT_DUP_RATE, parse_size, write_corpus
+
+REAL_CORPUS = 'pdf_content.txt'
+DEFAULT_SIZES = 'real,10k'
+DEFAULT_OUTPUT = 'bench_results.json'
+
+
+def run_one(input_file, strategy, workers):
+    """Chạy 1 lần pipeline (kể cả export) trong process con, trả về thời gian từng stage + RSS đỉnh"""
+    profiler = PipelineProfiler()
+    start = time.perf_counter()
+    cases, raw_count = run(input_file, strategy=strategy, workers=workers, profiler=profiler)
+    fd, output = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    try:
+        with stage_of(profiler, 'export'):
+            export(cases, output)
+    finally:
+        os.remove(output)
+    return {
+        'seconds': time.perf_counter() - start,
+        'stages': {s['stage']: s['seconds'] for s in profiler.stages},
+        'counters': profiler.counters,
+        'raw_cases': raw_count,
+        'unique_cases': len(cases),
+        # Linux: KB
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def measure(input_file, strategy, workers, repeat):
+    """Mỗi lần chạy một process mới (spawn) để RSS đỉnh không bị lần trước ảnh hưởng; giữ lần nhanh nhất"""
+    best = None
+    context = multiprocessing.get_context('spawn')
+    for _ in range(repeat):
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            result = executor.submit(run_one, input_file, strategy, workers).result()
+        if best is None or result['seconds'] < best['seconds']:
+            best = result
+    return best
+
+
+def count_lines(path):
+    with open(path, 'rb') as f:
+        return sum(1 for _ in f)
+
+
+def prepare_corpora(sizes, corpus_dir, seed, dup_rate):
+    """Danh sách (tên, đường dẫn): 'real' là file thật, còn lại sinh giả lập (có cache theo tên file)"""
+    corpora = []
+    for size in sizes:
+        if size == 'real':
+            corpora.append(('real', REAL_CORPUS))
+            continue
+        path = os.path.join(corpus_dir, f"synthetic_{size}_seed{seed}_dup{dup_rate}.txt")
+        if not os.path.exists(path):
+            print(f"🧪 Sinh corpus {size} -> {path}")
+            write_corpus(path, parse_size(size), seed, dup_rate)
+        corpora.append((size, path))
+    return corpora
+
+
+def compare(results, baseline_file, tolerance):
+    """So với lần chạy trước: đánh dấu chậm hơn / tốn bộ nhớ hơn quá tolerance. Trả về số hồi quy"""
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        baseline = {(r['corpus'], r['strategy']): r for r in json.load(f)['results']}
+    regressions = 0
+    print(f"\n📈 So với {baseline_file} (ngưỡng {tolerance:.0%}):")
+    for r in results:
+        old = baseline.get((r['corpus'], r['strategy']))
+        if old is None:
+            continue
+        for metric in ('seconds', 'peak_rss_kb'):
+            ratio = r[metric] / old[metric] if old[metric] else 1.0
+            flag = ''
+            if ratio > 1 + tolerance:
+                flag = '  ❌ hồi quy'
+                regressions += 1
+            print(f"  {r['corpus']:<8} {r['strategy']:<7} {metric:<12} {old[metric]:>12.2f} -> {r[metric]:>12.2f}  x{ratio:.2f}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pipeline parse trên corpus thật và giả lập")
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help="VD: real,10k,100k,1M")
+    parser.add_argument('--strategies', default='full,strict')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--dup-rate', type=float, default=DEFAULT_DUP_RATE)
+    parser.add_argument('--corpus-dir', default=tempfile.gettempdir(), help="Nơi lưu (cache) corpus giả lập")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="File kết quả JSON")
+    parser.add_argument('--compare', metavar='BASELINE', help="File kết quả cũ để so sánh")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Cho phép chậm hơn / tốn hơn bao nhiêu trước khi báo hồi quy")
+    args = parser.parse_args()
+
+    corpora = prepare_corpora(args.sizes.split(','), args.corpus_dir, args.seed, args.dup_rate)
+    strategies = args.strategies.split(',')
+
+    results = []
+    print(f"\n⏱️ best of {args.repeat}, workers={args.workers}")
+    print(f"  {'corpus':<8} {'chiến lược':<10} {'dòng':>9} {'giây':>8} {'dòng/s':>9} {'RSS đỉnh':>10}  stage (giây)")
+    for name, path in corpora:
+        lines = count_lines(path)
+        for strategy in strategies:
+            r = measure(path, strategy, args.workers, args.repeat)
+            r.update(corpus=name, strategy=strategy, lines=lines, lines_per_second=lines / r['seconds'])
+            results.append(r)
+            stages = ' '.join(f"{stage}={seconds:.2f}" for stage, seconds in r['stages'].items())
+            print(f"  {name:<8} {strategy:<10} {lines:>9} {r['seconds']:8.2f} {r['lines_per_second']:9.0f}"
+                  f" {r['peak_rss_kb'] / 1024:8.1f}MB  {stages}")
+
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'workers': args.workers,
+        'repeat': args.repeat,
+        'seed': args.seed,
+        'dup_rate': args.dup_rate,
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 {args.output}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.tolerance)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import re
+import time
+import argparse
+
+from rescue_parser.priority import FINAL_CLASSIFIER, SITUATION_CLASSIFIER
+
+# Bản cũ (trước khi có priority.py) để so sánh tốc độ và kết quả
+
+def legacy_final_priority(line):
+    priority = 'MEDIUM'
+    line_lower = line.lower()
+    if line_lower.startswith('khẩn cấp') or 'khẩn cấp' in line_lower or 'nguy kịch' in line_lower or 'sắp đẻ' in line_lower or 'vỡ ối' in line_lower or 'tai biến' in line_lower:
+        priority = 'CRITICAL'
+    elif line_lower.startswith('ưu tiên cao') or 'ưu tiên cao' in line_lower or 'người già' in line_lower or 'trẻ em' in line_lower or 'trẻ nhỏ' in line_lower or 'bà bầu' in line_lower or 'mang thai' in line_lower:
+        priority = 'HIGH'
+    elif line_lower.startswith('thường') or 'thường' in line_lower:
+        priority = 'MEDIUM'
+    return priority
+
+
+def legacy_situation_priority(content):
+    content_lower = content.lower()
+    critical_keywords = [
+        'lên mái', 'trên mái', 'leo mái', 'qua đầu', 'gần lút', 'gần mái',
+        'lút nó',
+        'mất liên lạc', 'pin hết', 'gần hết pin',
+        'bệnh nặng', 'tai biến', 'chạy thận', 'không đi lại',
+        'bà bầu', 'mới đẻ', 'sơ sinh',
+        'em bé', 'bé nhỏ', 'con nít', 'trẻ nhỏ', 'cháu nhỏ',
+        'khẩn cấp', 'khẩn thiết', 'gấp'
+    ]
+    high_keywords = [
+        'người già', 'lớn tuổi', '70t', '80t', '90t', '97 tuổi',
+        'trẻ em', '1t', '2t', '3t', '4t', '5t',
+        'nước dâng', 'ngập sâu', 'ngang ngực', 'tới ngực',
+        'thiếu lương thực', 'thiếu nước', 'hết đồ ăn'
+    ]
+    for keyword in critical_keywords:
+        if keyword in content_lower:
+            return 'CRITICAL'
+    if re.search(r'nước.{0,30}(2|3|4) ?m', content_lower):
+        return 'CRITICAL'
+    for keyword in high_keywords:
+        if keyword in content_lower:
+            return 'HIGH'
+    people_match = re.search(r'(\d+)\s*(người|em|đứa|con)', content_lower)
+    if people_match and int(people_match.group(1)) >= 5:
+        return 'HIGH'
+    return None
+
+
+def bench(name, func, lines, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(lines)
+        best = min(best, time.perf_counter() - start)
+    print(f"  {name:<32} {best * 1000:8.2f} ms  {best / len(lines) * 1e6:6.2f} µs/dòng")
+    return result
+
+
+def report_diff(lines, old, new, limit=5):
+    diffs = [(line, o, n, rule) for line, o, (n, rule) in zip(lines, old, new) if o != n]
+    print(f"  Khác biệt kết quả: {len(diffs)}")
+    for line, o, n, rule in diffs[:limit]:
+        print(f"    {o} -> {n} [{rule}] {line[:80]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmark bộ phân loại priority")
+    parser.add_argument('input', nargs='?', default='pdf_content.txt')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        lines = [line.strip() for line in f if line.strip()]
+    print(f"⏱️ {len(lines)} dòng, best of {args.repeat}")
+
+    print("\n📊 parse_final (từ khóa cột + câu):")
+    old = bench("legacy chuỗi or", lambda ls: [legacy_final_priority(l) for l in ls], lines, args.repeat)
+    new = bench("FINAL_CLASSIFIER.classify_batch", FINAL_CLASSIFIER.classify_batch, lines, args.repeat)
+    report_diff(lines, old, new)
+
+    print("\n📊 determine_priority (tình hình):")
+    old = bench("legacy vòng lặp in", lambda ls: [legacy_situation_priority(l) for l in ls], lines, args.repeat)
+    new = bench("SITUATION_CLASSIFIER.classify_batch", SITUATION_CLASSIFIER.classify_batch, lines, args.repeat)
+    report_diff(lines, old, new)
+
+
+if __name__ == "__main__":
+    main()
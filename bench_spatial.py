@@ -0,0 +1,127 @@
+import os
+import json
+import math
+import time
+import random
+import argparse
+import tempfile
+
+from rescue_parser.geocode import DEFAULT_PLACES
+from rescue_parser.spatial import SpatialIndex
+from rescue_parser.synthetic import parse_size
+
+PRIORITIES = [('HIGH', 68), ('MEDIUM', 19), ('CRITICAL', 8), ('LOW', 5)]
+
+
+def make_points(n, seed):
+    """Điểm giả lập tụ quanh các địa danh trong places.json (giống dữ liệu đã geocode)"""
+    rng = random.Random(seed)
+    with open(DEFAULT_PLACES, 'r', encoding='utf-8') as f:
+        places = json.load(f)['places']
+    ids, lats, lngs, priorities, rescued = [], [], [], [], []
+    for i in range(n):
+        place = rng.choice(places)
+        ids.append(i)
+        lats.append(place['lat'] + rng.gauss(0, 0.01))
+        lngs.append(place['lng'] + rng.gauss(0, 0.01))
+        priorities.append(rng.choices([p for p, _ in PRIORITIES], [w for _, w in PRIORITIES])[0])
+        rescued.append(rng.random() < 0.3)
+    return ids, lats, lngs, priorities, rescued
+
+
+class LinearScan:
+    """Cách hiện tại: lọc tuyến tính cả danh sách (cùng phép chiếu để so kết quả)"""
+
+    def __init__(self, index):
+        self.index = index
+
+    def within_radius(self, lat, lng, radius_km, priorities=None, rescued=None):
+        ix = self.index
+        x, y = ix._project(lat, lng)
+        found = []
+        for i in range(len(ix)):
+            d2 = (ix.xs[i] - x) ** 2 + (ix.ys[i] - y) ** 2
+            if d2 <= radius_km * radius_km and ix._accept(i, priorities, rescued):
+                found.append((d2, i))
+        found.sort()
+        return [(ix.ids[i], math.sqrt(d2)) for d2, i in found]
+
+    def nearest(self, lat, lng, k=1, priorities=None, rescued=None):
+        ix = self.index
+        x, y = ix._project(lat, lng)
+        found = sorted(((ix.xs[i] - x) ** 2 + (ix.ys[i] - y) ** 2, i)
+                       for i in range(len(ix)) if ix._accept(i, priorities, rescued))
+        return [(ix.ids[i], math.sqrt(d2)) for d2, i in found[:k]]
+
+    def bbox(self, min_lat, min_lng, max_lat, max_lng, priorities=None, rescued=None):
+        ix = self.index
+        return [ix.ids[i] for i in range(len(ix))
+                if min_lat <= ix.lats[i] <= max_lat and min_lng <= ix.lngs[i] <= max_lng
+                and ix._accept(i, priorities, rescued)]
+
+
+def timed(func, queries):
+    start = time.perf_counter()
+    results = [func(q) for q in queries]
+    return (time.perf_counter() - start) / len(queries), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark chỉ mục không gian so với lọc tuyến tính")
+    parser.add_argument('--sizes', default='10k,100k')
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--cell-km', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="Ghi kết quả ra JSON")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed + 1)
+    results = []
+    for size in args.sizes.split(','):
+        n = parse_size(size)
+        points = make_points(n, args.seed)
+        start = time.perf_counter()
+        index = SpatialIndex(*points, cell_km=args.cell_km)
+        build = time.perf_counter() - start
+        fd, path = tempfile.mkstemp(suffix='.spatial.json')
+        os.close(fd)
+        try:
+            index.save(path)
+            size_bytes = os.path.getsize(path)
+            start = time.perf_counter()
+            SpatialIndex.load(path)
+            load = time.perf_counter() - start
+        finally:
+            os.remove(path)
+
+        linear = LinearScan(index)
+        queries = [(index.lats[i], index.lngs[i]) for i in rng.sample(range(n), args.queries)]
+        box = 0.01  # ~1 km
+        cases = {
+            'within 2km CRITICAL chưa cứu': (
+                lambda q, s: s.within_radius(q[0], q[1], 2.0, priorities={'CRITICAL'}, rescued=False)),
+            'nearest k=10': lambda q, s: s.nearest(q[0], q[1], k=10),
+            'nearest k=5 CRITICAL': lambda q, s: s.nearest(q[0], q[1], k=5, priorities={'CRITICAL'}),
+            'bbox ~2km': lambda q, s: s.bbox(q[0] - box, q[1] - box, q[0] + box, q[1] + box),
+        }
+        print(f"\n📍 {n} điểm: dựng {build * 1000:.1f} ms, file {size_bytes / 1024:.0f} KB, load {load * 1000:.1f} ms")
+        print(f"  {'truy vấn':<30} {'lưới (µs)':>10} {'tuyến tính (µs)':>16} {'xN':>7}")
+        row = {'points': n, 'build_ms': build * 1000, 'file_bytes': size_bytes, 'load_ms': load * 1000, 'queries': {}}
+        for name, query in cases.items():
+            grid_time, grid_results = timed(lambda q: query(q, index), queries)
+            scan_time, scan_results = timed(lambda q: query(q, linear), queries)
+            # Kết quả phải giống hệt (chỉ so id khi có thể bằng khoảng cách)
+            assert [[r if isinstance(r, int) else r[0] for r in res] for res in grid_results] == \
+                [[r if isinstance(r, int) else r[0] for r in res] for res in scan_results], name
+            print(f"  {name:<30} {grid_time * 1e6:10.1f} {scan_time * 1e6:16.1f} {scan_time / grid_time:7.1f}")
+            row['queries'][name] = {'grid_us': grid_time * 1e6, 'linear_us': scan_time * 1e6}
+        results.append(row)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'cell_km': args.cell_km, 'results': results}, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import os
+import json
+import time
+import random
+import argparse
+import tempfile
+
+from rescue_parser.gazetteer import AREA_KEYWORDS
+from rescue_parser.normalize import fold
+from rescue_parser.store import CaseStore, phone_key
+from rescue_parser.synthetic import STREETS, SITUATIONS, UNKNOWN_PLACES, _new_phone, parse_size
+from rescue_parser.text import format_phone
+
+PRIORITIES = [('HIGH', 68), ('MEDIUM', 19), ('CRITICAL', 8), ('LOW', 5)]
+
+
+def make_cases(n, seed):
+    """Case đã parse giả lập (đúng shape data.json), tạo thẳng không qua pipeline cho nhanh"""
+    rng = random.Random(seed)
+    places = list(AREA_KEYWORDS) + UNKNOWN_PLACES
+    cases = []
+    for i in range(n):
+        place = rng.choice(places)
+        street = rng.choice(STREETS)[0]
+        content = f"{place} {rng.randint(1, 500)}/{rng.randint(1, 80)} {street}, {place}. {rng.choice(SITUATIONS)}"
+        cases.append({
+            'id': i + 1,
+            'content': content,
+            'phones': [format_phone(_new_phone(rng)) for _ in range(rng.choice([0, 1, 1, 2]))],
+            'area': AREA_KEYWORDS.get(place, 'Khác'),
+            'priority': rng.choices([p for p, _ in PRIORITIES], [w for _, w in PRIORITIES])[0],
+            'isRescued': rng.random() < 0.3,
+        })
+    return cases
+
+
+def timed(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark kho SQLite (store.py) so với quét toàn bộ data.json")
+    parser.add_argument('--sizes', default='10k,100k,300k')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"  {'case':>7} {'sync (s)':>9} {'resync':>8} {'nạp json':>9} | {'tra cứu':<10} {'quét (ms)':>10} {'kho (ms)':>9} {'kết quả':>8}")
+    for size in args.sizes.split(','):
+        n = parse_size(size)
+        cases = make_cases(n, args.seed)
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = os.path.join(tmp, 'data.json')
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(cases, f, ensure_ascii=False)
+            load_seconds, _ = timed(lambda: json.load(open(json_path, encoding='utf-8')), 1)
+
+            store = CaseStore(os.path.join(tmp, 'cases.db'))
+            sync_seconds, _ = timed(lambda: store.sync(cases), 1)
+            # Lần 2 không có gì đổi: chỉ so data, không đánh lại FTS
+            resync_seconds, _ = timed(lambda: store.sync(cases), 1)
+
+            phone = next(c['phones'][0] for c in cases if c['phones'])
+            lookups = [
+                ('SĐT', lambda: [c for c in cases if phone_key(phone) in map(phone_key, c['phones'])],
+                 lambda: store.by_phone(phone)),
+                ('area', lambda: [c for c in cases if c['area'] == 'Diên Phú' and c['priority'] == 'CRITICAL'],
+                 lambda: store.by_area('Diên Phú', 'CRITICAL')),
+                ('text', lambda: [c for c in cases if 'hon ro' in fold(c['content'])][:50],
+                 lambda: store.search('hòn rớ', limit=50)),
+            ]
+            print(f"  {n:>7} {sync_seconds:9.2f} {resync_seconds:8.2f} {load_seconds:9.2f} |")
+            for name, scan, indexed in lookups:
+                scan_seconds, expected = timed(scan, args.repeat)
+                store_seconds, found = timed(indexed, args.repeat)
+                same = 'khớp' if name == 'text' or found == expected else 'LỆCH'
+                print(f"  {'':>37} | {name:<10} {scan_seconds * 1000:10.2f} {store_seconds * 1000:9.2f} {len(found):>5} {same}")
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import json
+import time
+import argparse
+
+from rescue_parser import strict
+from rescue_parser.repeats import cut_repeated_prefix
+
+CORPUS_FILE = 'repeated_prefix_corpus.json'
+
+
+def legacy_cut_repeated_prefix(text):
+    """Bước 4 cũ của extract_location_strict (thử mọi độ dài, O(n^2) trở lên)"""
+    n = len(text)
+    for length in range(10, n // 2 + 1):
+        substr = text[:length]
+        rest = text[length:]
+        if substr in rest:
+            if rest.startswith(substr):
+                return substr
+            elif rest.strip().startswith(substr):
+                return substr
+    return text
+
+
+def collect_inputs(input_file):
+    """
+    Input thật của bước 4 khi parse file theo chiến lược strict, cộng với các dòng đầy đủ
+    (đã bỏ SĐT) mà đoạn 10 ký tự đầu xuất hiện lại, để có cả chuỗi dài đáng kiểm tra.
+    """
+    inputs = []
+    original = strict.cut_repeated_prefix
+
+    def record(text):
+        inputs.append(text)
+        return original(text)
+
+    strict.cut_repeated_prefix = record
+    try:
+        with open(input_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                case = strict.parse_line(line)
+                if case is None:
+                    continue
+                text = case['original_content']
+                if text.find(text[:10], 10) != -1:
+                    inputs.append(text)
+    finally:
+        strict.cut_repeated_prefix = original
+    return list(dict.fromkeys(inputs))
+
+
+def rebuild(input_file, corpus_file):
+    inputs = collect_inputs(input_file)
+    corpus = [{'input': text, 'expected': legacy_cut_repeated_prefix(text)} for text in inputs]
+    with open(corpus_file, 'w', encoding='utf-8') as f:
+        json.dump(corpus, f, ensure_ascii=False, indent=0)
+        f.write('\n')
+    cut = sum(1 for c in corpus if c['input'] != c['expected'])
+    print(f"💾 {len(corpus)} mẫu ({cut} mẫu bị cắt) -> {corpus_file}")
+
+
+def bench(name, func, texts, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    print(f"  {name:<28} {best * 1000:8.2f} ms  {best / len(texts) * 1e6:7.2f} µs/mẫu")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kiểm tra hồi quy + benchmark bộ dò tiền tố lặp")
+    parser.add_argument('--corpus', default=CORPUS_FILE)
+    parser.add_argument('--rebuild', metavar='INPUT', help="Dựng lại corpus từ file dữ liệu thật (VD: pdf_content.txt)")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.rebuild:
+        rebuild(args.rebuild, args.corpus)
+
+    with open(args.corpus, 'r', encoding='utf-8') as f:
+        corpus = json.load(f)
+
+    failures = [c for c in corpus if cut_repeated_prefix(c['input']) != c['expected']]
+    print(f"🔍 {len(corpus)} mẫu, sai khác: {len(failures)}")
+    for c in failures[:5]:
+        print(f"  ❌ {c['input'][:60]!r}: {cut_repeated_prefix(c['input'])!r} != {c['expected']!r}")
+
+    texts = [c['input'] for c in corpus]
+    long_texts = [t for t in texts if len(t) >= 100]
+    print(f"\n⏱️ Tất cả mẫu, best of {args.repeat}:")
+    old = bench("legacy", legacy_cut_repeated_prefix, texts, args.repeat)
+    new = bench("find + Z-array", cut_repeated_prefix, texts, args.repeat)
+    print(f"  🚀 Nhanh hơn {old / new:.1f} lần")
+    if long_texts:
+        print(f"\n⏱️ {len(long_texts)} mẫu dài (>= 100 ký tự):")
+        old = bench("legacy", legacy_cut_repeated_prefix, long_texts, args.repeat)
+        new = bench("find + Z-array", cut_repeated_prefix, long_texts, args.repeat)
+        print(f"  🚀 Nhanh hơn {old / new:.1f} lần")
+
+    raise SystemExit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+import json
+import time
+import random
+import argparse
+from itertools import combinations
+
+from rescue_parser.dedup_index import DedupIndex, UnionFind, find_duplicate_groups
+from rescue_parser.pipeline import STRATEGIES
+from rescue_parser.similarity import BACKENDS
+from rescue_parser.synthetic import generate_rows, parse_size
+
+# File cặp có nhãn: mỗi dòng 1 JSON {"a": dòng gốc, "b": dòng gốc, "duplicate": true/false/null}
+# null = chưa gán nhãn (bỏ qua khi đánh giá)
+DEFAULT_THRESHOLDS = '0.7,0.75,0.8,0.85,0.9'
+DEFAULT_GENERATORS = 'index,index:0.4,window:15,window:20'
+
+
+def load_pairs(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def write_pairs(path, pairs):
+    with open(path, 'w', encoding='utf-8') as f:
+        for pair in pairs:
+            f.write(json.dumps(pair, ensure_ascii=False) + '\n')
+
+
+def make_synthetic(size, seed, corpus_path, pairs_path, per_cluster=3):
+    """
+    Corpus giả lập + cặp có nhãn từ cluster thật của bộ sinh: cặp trùng trong cùng
+    cluster, cặp khác nhau là các dòng kề nhau sau khi sắp xếp (khó phân biệt nhất)
+    """
+    rng = random.Random(seed)
+    rows = [(line, cluster) for line, cluster in generate_rows(parse_size(size), seed) if cluster is not None]
+    with open(corpus_path, 'w', encoding='utf-8') as f:
+        for line, _ in rows:
+            f.write(line + '\n')
+
+    by_cluster = {}
+    for line, cluster in rows:
+        by_cluster.setdefault(cluster, []).append(line)
+    positives = []
+    for lines in by_cluster.values():
+        pairs = [p for p in combinations(lines, 2) if p[0] != p[1]]
+        positives.extend(rng.sample(pairs, min(per_cluster, len(pairs))))
+
+    ordered = sorted(rows)
+    negatives = [(a[0], b[0]) for a, b in zip(ordered, ordered[1:]) if a[1] != b[1]]
+    negatives = rng.sample(negatives, min(len(negatives), len(positives)))
+
+    pairs = [{'a': a, 'b': b, 'duplicate': True} for a, b in positives]
+    pairs += [{'a': a, 'b': b, 'duplicate': False} for a, b in negatives]
+    rng.shuffle(pairs)
+    write_pairs(pairs_path, pairs)
+    print(f"🧪 {len(rows)} dòng -> {corpus_path}, {len(positives)} cặp trùng + {len(negatives)} cặp khác -> {pairs_path}")
+
+
+def parse_corpus(lines, strategy):
+    """Parse các dòng, trả về (cases, dòng gốc -> chỉ số case đầu tiên)"""
+    cases, position = [], {}
+    for line in lines:
+        line = line.strip()
+        if line in position:
+            continue
+        case = strategy.parse_line(line)
+        if case is not None:
+            position[line] = len(cases)
+            cases.append(case)
+    return cases, position
+
+
+def make_candidates(corpus_path, pairs_path, strategy, limit, seed):
+    """
+    Cặp ứng viên từ dữ liệu thật để gán nhãn tay (duplicate = null): các cặp mà
+    chỉ mục đưa ra chấm điểm, gồm cả cặp sẽ được gộp lẫn cặp bị loại
+    """
+    strategy = STRATEGIES[strategy]
+    with open(corpus_path, 'r', encoding='utf-8') as f:
+        cases, position = parse_corpus(f, strategy)
+    raws = {i: line for line, i in position.items()}
+    features = [strategy.case_features(c) for c in cases]
+    owner = {id(f): i for i, f in enumerate(features)}
+    scored = []
+
+    def record(f1, f2):
+        scored.append((owner[id(f1)], owner[id(f2)]))
+        return False
+
+    find_duplicate_groups(list(range(len(cases))), lambda i: features[i], record,
+                          block_of=lambda i: cases[i]['area'], index=strategy.new_index())
+    picked = random.Random(seed).sample(scored, min(limit, len(scored)))
+    write_pairs(pairs_path, [{'a': raws[i], 'b': raws[j], 'duplicate': None} for i, j in picked])
+    print(f"📝 {len(picked)}/{len(scored)} cặp ứng viên chưa gán nhãn -> {pairs_path}")
+
+
+def window_groups(cases, features, is_duplicate, window):
+    """
+    Cách sinh ứng viên cũ (trước chỉ mục blocking): trong mỗi Area sắp xếp theo
+    content, so mỗi case với window - 1 case kế tiếp
+    """
+    uf = UnionFind(len(cases))
+    by_area = {}
+    for i, case in enumerate(cases):
+        by_area.setdefault(case['area'], []).append(i)
+    for members in by_area.values():
+        members.sort(key=lambda i: cases[i]['content'])
+        for a, i in enumerate(members):
+            for j in members[a + 1:a + window]:
+                if uf.find(i) != uf.find(j) and is_duplicate(features[i], features[j]):
+                    uf.union(i, j)
+    return uf.groups()
+
+
+def run_config(cases, features, strategy, generator, backend, threshold):
+    """
+    Lọc trùng cả corpus với 1 cấu hình, trả về (nhóm của từng case, số cặp chấm điểm,
+    số giây)
+    """
+    scored = 0
+
+    def is_duplicate(f1, f2):
+        nonlocal scored
+        scored += 1
+        return strategy.is_duplicate_features(f1, f2, threshold, backend)
+
+    start = time.perf_counter()
+    kind, _, arg = generator.partition(':')
+    if kind == 'window':
+        groups = window_groups(cases, features, is_duplicate, int(arg))
+    else:
+        index = DedupIndex(min_agreement=float(arg)) if arg else strategy.new_index()
+        groups = find_duplicate_groups(list(range(len(cases))), lambda i: features[i], is_duplicate,
+                                       block_of=lambda i: cases[i]['area'], index=index)
+    seconds = time.perf_counter() - start
+
+    group_of = [0] * len(cases)
+    for g, members in enumerate(groups):
+        for i in members:
+            group_of[i] = g
+    return group_of, scored, seconds
+
+
+def score(pairs, position, group_of, features):
+    """
+    Precision / recall trên các cặp có nhãn: dự đoán trùng = 2 dòng nằm chung nhóm.
+    phone_fp / phone_fn: FP / FN riêng trên các cặp chung SĐT (gộp nhầm 2 hộ báo qua
+    cùng 1 người / bỏ sót bản gửi lại của cùng 1 hộ)
+    """
+    tp = fp = fn = tn = phone_fp = phone_fn = 0
+    for pair in pairs:
+        a, b = position[pair['a']], position[pair['b']]
+        same = group_of[a] == group_of[b]
+        shared_phone = bool(features[a].phones & features[b].phones)
+        if pair['duplicate']:
+            tp += same
+            fn += not same
+            phone_fn += shared_phone and not same
+        else:
+            fp += same
+            tn += not same
+            phone_fp += shared_phone and same
+    precision = tp / (tp + fp) if tp + fp else 1.0
+    recall = tp / (tp + fn) if tp + fn else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {'tp': tp, 'fp': fp, 'fn': fn, 'tn': tn, 'precision': precision, 'recall': recall, 'f1': f1,
+            'phone_fp': phone_fp, 'phone_fn': phone_fn}
+
+
+def evaluate(pairs_path, corpus_path, strategies, generators, backends, thresholds):
+    labelled = [p for p in load_pairs(pairs_path) if p.get('duplicate') is not None]
+    for p in labelled:
+        p['a'], p['b'] = p['a'].strip(), p['b'].strip()
+    lines = []
+    if corpus_path:
+        with open(corpus_path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    # Dòng trong file cặp nhưng không có trong corpus vẫn được đưa vào lọc trùng
+    lines += [p[k] for p in labelled for k in ('a', 'b')]
+
+    results = []
+    for name in strategies:
+        strategy = STRATEGIES[name]
+        cases, position = parse_corpus(lines, strategy)
+        pairs = [p for p in labelled if p['a'] in position and p['b'] in position]
+        print(f"\n🔎 {name}: {len(cases)} case, {len(pairs)} cặp có nhãn"
+              f" (bỏ {len(labelled) - len(pairs)} cặp không parse được)")
+        print(f"  {'sinh ứng viên':<14} {'backend':<16} {'ngưỡng':>6} {'precision':>9} {'recall':>7}"
+              f" {'F1':>6} {'FP':>5} {'FN':>5} {'FP SĐT':>6} {'FN SĐT':>6} {'cặp chấm':>9} {'giây':>7}")
+        for generator in generators:
+            for backend in backends:
+                for threshold in thresholds:
+                    # Đặc trưng tính lại mỗi cấu hình để thời gian gồm cả bước này như khi chạy thật
+                    start = time.perf_counter()
+                    features = [strategy.case_features(c) for c in cases]
+                    feature_seconds = time.perf_counter() - start
+                    group_of, scored, seconds = run_config(cases, features, strategy, generator, backend, threshold)
+                    r = score(pairs, position, group_of, features)
+                    r.update(strategy=name, generator=generator, backend=backend, threshold=threshold,
+                             pairs_scored=scored, seconds=seconds + feature_seconds)
+                    results.append(r)
+                    print(f"  {generator:<14} {backend:<16} {threshold:>6.2f} {r['precision']:9.3f} {r['recall']:7.3f}"
+                          f" {r['f1']:6.3f} {r['fp']:>5} {r['fn']:>5} {r['phone_fp']:>6} {r['phone_fn']:>6} {scored:>9}"
+                          f" {r['seconds']:7.2f}")
+    return results
+
+
+def recommend(results, min_precision):
+    """
+    Cấu hình nhanh nhất không gộp nhầm quá mức cho phép (precision >= min_precision),
+    ưu tiên recall
+    """
+    print(f"\n🏁 Đề xuất (precision >= {min_precision}):")
+    for name in sorted({r['strategy'] for r in results}):
+        ok = [r for r in results if r['strategy'] == name and r['precision'] >= min_precision]
+        if not ok:
+            print(f"  {name}: không cấu hình nào đạt")
+            continue
+        best_recall = max(r['recall'] for r in ok)
+        # Trong nhóm recall gần tốt nhất (kém <= 1 điểm %), chọn cấu hình nhanh nhất
+        r = min((r for r in ok if r['recall'] >= best_recall - 0.01), key=lambda r: r['seconds'])
+        print(f"  {name}: {r['generator']} / {r['backend']} / {r['threshold']}"
+              f" -> precision {r['precision']:.3f}, recall {r['recall']:.3f}"
+              f" (chung SĐT: FP {r['phone_fp']}, FN {r['phone_fn']}), {r['seconds']:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Đánh giá chất lượng / tốc độ lọc trùng trên các cặp có nhãn")
+    parser.add_argument('pairs', help="File cặp có nhãn (JSON lines)")
+    parser.add_argument('--corpus', help="File dữ liệu chứa các dòng trong file cặp (lọc trùng chạy trên cả file)")
+    parser.add_argument('--make-synthetic', metavar='SIZE', help="Sinh corpus giả lập (ghi ra --corpus) + cặp có nhãn rồi đánh giá")
+    parser.add_argument('--make-candidates', action='store_true',
+                        help="Chỉ ghi các cặp ứng viên từ --corpus (chưa gán nhãn) để gán nhãn tay")
+    parser.add_argument('--limit', type=int, default=500, help="Số cặp ứng viên tối đa khi --make-candidates")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--strategies', default='full,strict')
+    parser.add_argument('--generators', default=DEFAULT_GENERATORS,
+                        help="index = chỉ mục mặc định của chiến lược, index:X = min_agreement X, window:K = cửa sổ cũ")
+    parser.add_argument('--backends', default=','.join(sorted(BACKENDS)))
+    parser.add_argument('--thresholds', default=DEFAULT_THRESHOLDS)
+    parser.add_argument('--min-precision', type=float, default=0.99)
+    parser.add_argument('--output', help="Ghi toàn bộ kết quả ra JSON")
+    args = parser.parse_args()
+
+    if args.make_candidates:
+        make_candidates(args.corpus or 'pdf_content.txt', args.pairs, args.strategies.split(',')[0], args.limit, args.seed)
+        return
+    if args.make_synthetic:
+        if not args.corpus:
+            parser.error("--make-synthetic cần --corpus để ghi corpus giả lập")
+        make_synthetic(args.make_synthetic, args.seed, args.corpus, args.pairs)
+
+    results = evaluate(
+        args.pairs,
+        args.corpus,
+        args.strategies.split(','),
+        args.generators.split(','),
+        args.backends.split(','),
+        [float(t) for t in args.thresholds.split(',')],
+    )
+    recommend(results, args.min_precision)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
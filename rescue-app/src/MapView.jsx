@@ -31,6 +31,14 @@ const MapView = ({ data, onCaseClick }) => {
         return data
             .filter(item => !item.isRescued) // Only show pending cases
             .map(item => {
+                // Toạ độ offline do parser gắn sẵn (rescue-parse --geocode)
+                if (item.location) {
+                    return {
+                        ...item,
+                        position: { lat: item.location.lat, lng: item.location.lng }
+                    };
+                }
+
                 // Simple coordinate assignment based on area
                 let lat = 12.2388;
                 let lng = 109.1967;
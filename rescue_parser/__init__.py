@@ -0,0 +1,5 @@
+from .pipeline import STRATEGIES, classify_situation, dedup, export, extract, parse, run
+from .shards import export_shards, load_shards
+
+__all__ = ['STRATEGIES', 'classify_situation', 'dedup', 'export', 'export_shards', 'extract', 'load_shards', 'parse',
+           'run']
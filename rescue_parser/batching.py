@@ -0,0 +1,180 @@
+import os
+import json
+import math
+
+from .changes import atomic_write
+from .spatial import SpatialIndex
+
+BATCHES_VERSION = 1
+PRIORITY_WEIGHT = {'CRITICAL': 8, 'HIGH': 4, 'MEDIUM': 2, 'LOW': 1}
+PRIORITY_ORDER = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
+DEFAULT_EPS_KM = 0.5
+DEFAULT_MIN_WEIGHT = 8
+DEFAULT_CAPACITY = 8
+
+
+def dbscan(index, weights, eps_km=DEFAULT_EPS_KM, min_weight=DEFAULT_MIN_WEIGHT):
+    """
+    DBSCAN có trọng số trên chỉ mục lưới (ids của index là chỉ số 0..n-1):
+    điểm lõi khi tổng trọng số priority các điểm trong bán kính eps >= min_weight,
+    nên 1 case CRITICAL đủ tạo cụm còn case LOW cần nhiều hàng xóm.
+    Trả về nhãn cụm cho từng điểm, -1 = điểm lẻ.
+    """
+    n = len(index)
+    labels = [None] * n
+    neighbours = {}
+
+    def region(i):
+        if i not in neighbours:
+            neighbours[i] = [j for j, _ in index.within_radius(index.lats[i], index.lngs[i], eps_km)]
+        return neighbours[i]
+
+    def is_core(i):
+        return sum(weights[j] for j in region(i)) >= min_weight
+
+    cluster = 0
+    for i in range(n):
+        if labels[i] is not None:
+            continue
+        if not is_core(i):
+            labels[i] = -1
+            continue
+        labels[i] = cluster
+        stack = list(region(i))
+        while stack:
+            j = stack.pop()
+            if labels[j] == -1:
+                labels[j] = cluster  # điểm biên
+            if labels[j] is not None:
+                continue
+            labels[j] = cluster
+            if is_core(j):
+                stack.extend(region(j))
+        # Bỏ cache hàng xóm của cụm đã xong để giữ bộ nhớ thấp
+        neighbours.clear()
+        cluster += 1
+    return labels
+
+
+def split_capacity(members, xs, ys, capacity):
+    """Chia đôi theo trung vị trục dài hơn cho tới khi mỗi nhóm <= capacity (nhóm gọn, đều)"""
+    if len(members) <= capacity:
+        return [members]
+    spread_x = max(xs[i] for i in members) - min(xs[i] for i in members)
+    spread_y = max(ys[i] for i in members) - min(ys[i] for i in members)
+    coord = xs if spread_x >= spread_y else ys
+    ordered = sorted(members, key=lambda i: coord[i])
+    # Cắt theo bội số capacity để các nhóm con đầy nhất có thể
+    parts = math.ceil(len(ordered) / capacity)
+    cut = (parts // 2) * capacity
+    return split_capacity(ordered[:cut], xs, ys, capacity) + split_capacity(ordered[cut:], xs, ys, capacity)
+
+
+def _dist(a, b, xs, ys):
+    return math.hypot(xs[a] - xs[b], ys[a] - ys[b])
+
+
+def route(members, xs, ys, start):
+    """
+    Thứ tự đi (đường mở, không quay về): láng giềng gần nhất từ điểm start,
+    sau đó 2-opt tới khi không cải thiện được nữa
+    """
+    remaining = set(members)
+    remaining.discard(start)
+    path = [start]
+    while remaining:
+        last = path[-1]
+        nxt = min(remaining, key=lambda j: (_dist(last, j, xs, ys), j))
+        path.append(nxt)
+        remaining.remove(nxt)
+
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, len(path) - 1):
+            for j in range(i + 1, len(path)):
+                a, b = path[i - 1], path[i]
+                c = path[j]
+                d = path[j + 1] if j + 1 < len(path) else None
+                before = _dist(a, b, xs, ys) + (_dist(c, d, xs, ys) if d is not None else 0.0)
+                after = _dist(a, c, xs, ys) + (_dist(b, d, xs, ys) if d is not None else 0.0)
+                if after < before - 1e-9:
+                    path[i:j + 1] = reversed(path[i:j + 1])
+                    improved = True
+    return path
+
+
+def path_length(path, xs, ys):
+    return sum((_dist(a, b, xs, ys) for a, b in zip(path, path[1:])), 0.0)
+
+
+def batch_cases(cases, eps_km=DEFAULT_EPS_KM, min_weight=DEFAULT_MIN_WEIGHT, capacity=DEFAULT_CAPACITY):
+    """
+    Gom các case chưa cứu đã có toạ độ thành các đợt điều phối: cụm DBSCAN
+    (điểm lẻ đứng riêng) -> chia theo sức chứa -> thứ tự đi trong mỗi đợt bắt đầu
+    từ case khẩn cấp nhất. Đợt khẩn cấp hơn (priority cao nhất, tổng trọng số) xếp trước.
+    """
+    # Case chỉ có toạ độ mặc định (không nhận ra địa danh / Area) không đủ tin cậy để xếp tuyến
+    pending, unlocated = [], []
+    for case in cases:
+        if case.get('isRescued'):
+            continue
+        if case.get('location') and case['location']['precision'] != 'default':
+            pending.append(case)
+        else:
+            unlocated.append(case['id'])
+    index = SpatialIndex(
+        range(len(pending)),
+        [c['location']['lat'] for c in pending],
+        [c['location']['lng'] for c in pending],
+        [c['priority'] for c in pending],
+        [False] * len(pending),
+    )
+    weights = [PRIORITY_WEIGHT.get(c['priority'], 1) for c in pending]
+    labels = dbscan(index, weights, eps_km, min_weight)
+
+    clusters = {}
+    singles = []
+    for i, label in enumerate(labels):
+        if label == -1:
+            singles.append([i])
+        else:
+            clusters.setdefault(label, []).append(i)
+
+    batches = []
+    for members in list(clusters.values()) + singles:
+        for group in split_capacity(members, index.xs, index.ys, capacity):
+            start = min(group, key=lambda i: (PRIORITY_ORDER.get(pending[i]['priority'], 9), i))
+            path = route(group, index.xs, index.ys, start)
+            best = min((pending[i]['priority'] for i in group), key=lambda p: PRIORITY_ORDER.get(p, 9))
+            batches.append({
+                'id': None,
+                'priority': best,
+                'weight': sum(weights[i] for i in group),
+                'cases': [pending[i]['id'] for i in path],
+                'distance_km': round(path_length(path, index.xs, index.ys), 3),
+                'centroid': {
+                    'lat': round(sum(index.lats[i] for i in group) / len(group), 6),
+                    'lng': round(sum(index.lngs[i] for i in group) / len(group), 6),
+                },
+                'clustered': len(members) > 1,
+            })
+
+    batches.sort(key=lambda b: (PRIORITY_ORDER.get(b['priority'], 9), -b['weight']))
+    for i, batch in enumerate(batches, 1):
+        batch['id'] = i
+    return {
+        'version': BATCHES_VERSION,
+        'params': {'eps_km': eps_km, 'min_weight': min_weight, 'capacity': capacity},
+        'batches': batches,
+        'unlocated': unlocated,
+    }
+
+
+def batches_path(output):
+    """data.json -> data.batches.json"""
+    return os.path.splitext(output)[0] + '.batches.json'
+
+
+def write_batches(result, path):
+    atomic_write(path, json.dumps(result, ensure_ascii=False, indent=2).encode('utf-8'))
@@ -0,0 +1,113 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+
+from .text import normalize_phone, normalize_text
+
+ID_LENGTH = 12
+
+
+def content_id(case):
+    """
+    Id ổn định suy ra từ nội dung 1 case (trước khi gộp): area + dòng gốc đã
+    chuẩn hóa + SĐT. Cùng dòng dữ liệu -> cùng id ở mọi lần chạy.
+    """
+    text = normalize_text(case.get('original_content') or case['content'])
+    phones = ','.join(sorted(normalize_phone(p) for p in case['phones']))
+    key = f"{case['area']}\n{text}\n{phones}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:ID_LENGTH]
+
+
+def stable_group_ids(groups):
+    """
+    Id cho từng nhóm trùng = content_id của thành viên xuất hiện đầu tiên, nên id
+    giữ nguyên khi có thêm tin gửi lại ở sau. Trả về [(id, [id các thành viên])].
+    Hai nhóm trùng id (dòng giống hệt nhưng không được gộp) -> thêm hậu tố -2, -3...
+    """
+    result = []
+    used = {}
+    for members in groups:
+        member_ids = [content_id(case) for case in members]
+        group_id = member_ids[0]
+        if group_id in used:
+            used[group_id] += 1
+            group_id = f"{group_id}-{used[group_id]}"
+        else:
+            used[group_id] = 1
+        result.append((group_id, member_ids))
+    return result
+
+
+def _file_mode(path):
+    """Quyền cho file path: của file đang có, không có thì mặc định 0666 & ~umask"""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        # umask chỉ đọc được bằng cách đặt rồi trả lại
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def atomic_write(path, data):
+    """
+    Ghi ra file tạm cùng thư mục rồi os.replace: người đọc không bao giờ thấy file ghi dở.
+    Giữ quyền của file cũ (file mới: 0666 trừ umask như open()), vì mkstemp tạo file 0600.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, _file_mode(path))
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def diff_cases(old_cases, new_cases, members=None):
+    """
+    So sánh output cũ và mới theo id:
+    - added: id mới; updated: cùng id nhưng nội dung khác
+    - merged: id cũ biến mất vì đã bị gộp vào case khác (cần members: id -> id thành viên)
+    - removed: id cũ biến mất hẳn
+    """
+    old = {c['id']: c for c in old_cases}
+    new = {c['id']: c for c in new_cases}
+    owner = {}
+    for case_id, member_ids in (members or {}).items():
+        for member_id in member_ids:
+            owner.setdefault(member_id, case_id)
+
+    journal = {'added': [], 'updated': [], 'merged': {}, 'removed': [], 'unchanged': 0}
+    for case_id, case in new.items():
+        if case_id not in old:
+            journal['added'].append(case_id)
+        elif case != old[case_id]:
+            journal['updated'].append(case_id)
+        else:
+            journal['unchanged'] += 1
+    for case_id in old:
+        if case_id in new:
+            continue
+        # Id có hậu tố -N (dòng giống hệt nhóm khác) thuộc về nhóm chứa dòng gốc
+        target = owner.get(case_id) or owner.get(str(case_id).split('-')[0])
+        if target in new:
+            journal['merged'][case_id] = target
+        else:
+            journal['removed'].append(case_id)
+    return journal
+
+
+def append_journal(path, journal, **meta):
+    """Thêm 1 dòng JSON (1 lần chạy) vào file journal"""
+    entry = {'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'), **meta, **journal}
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    return entry
@@ -0,0 +1,189 @@
+import os
+import argparse
+from contextlib import nullcontext
+
+from .batching import DEFAULT_CAPACITY, DEFAULT_EPS_KM, DEFAULT_MIN_WEIGHT, batch_cases, batches_path, write_batches
+from .changes import append_journal, diff_cases
+from .formats import SUFFIXES, read_cases
+from .gazetteer import Gazetteer, load_keywords
+from .geocode import DEFAULT_PLACES, Geocoder
+from .pipeline import DEFAULT_OUTPUT, STRATEGIES, export, run
+from .profiling import PipelineProfiler, stage_of
+from .shards import export_shards
+from .spatial import SpatialIndex, index_path
+from .store import CaseStore
+from .similarity import BACKENDS, DEFAULT_BACKEND
+
+
+def build_parser(strategy='full'):
+    parser = argparse.ArgumentParser(
+        prog='rescue-parse',
+        description="Parse dữ liệu cứu hộ: extract -> classify -> dedup -> export",
+    )
+    parser.add_argument('input', nargs='?', default='pdf_content.txt', help="File text hoặc PDF gốc")
+    parser.add_argument('--strategy', choices=sorted(STRATEGIES), default=strategy,
+                        help="full: giữ cả nội dung dòng; strict: chỉ giữ địa chỉ đã làm sạch")
+    parser.add_argument('--rows', action='store_true', help="Tách cột theo bản ghi (ghép dòng tràn) thay vì theo từng dòng")
+    parser.add_argument('--priority', choices=['column', 'situation'], default='column',
+                        help="column: theo cột Mức độ ưu tiên; situation: đánh giá lại theo tình hình")
+    parser.add_argument('--workers', type=int, default=1, help="Số process parse song song")
+    parser.add_argument('--similarity', choices=sorted(BACKENDS), default=DEFAULT_BACKEND, help="Backend so sánh địa chỉ")
+    parser.add_argument('--threshold', type=float, default=None, help="Ngưỡng tương đồng địa chỉ (mặc định theo chiến lược)")
+    parser.add_argument('--area-keywords', metavar='FILE',
+                        help="Từ khóa khu vực bổ sung cho case 'Khác' (file do rescue_parser.miner ghi)")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT)
+    parser.add_argument('--formats', default='pretty',
+                        help=f"Các định dạng ghi ra, cách nhau dấu phẩy: {', '.join(SUFFIXES)} (compact/columnar/jsonl ghi cạnh --output)")
+    parser.add_argument('--ids', choices=['sequential', 'stable'], default='sequential',
+                        help="sequential: 1..N mỗi lần chạy; stable: id suy ra từ nội dung, giữ nguyên giữa các lần chạy")
+    parser.add_argument('--journal', metavar='FILE',
+                        help="Ghi thêm 1 dòng JSON các id added/updated/merged/removed so với --output cũ (cần --ids stable)")
+    parser.add_argument('--geocode', action='store_true', help="Gắn toạ độ offline (case['location']) từ file địa danh")
+    parser.add_argument('--places', default=DEFAULT_PLACES, help="File địa danh + toạ độ cho --geocode")
+    parser.add_argument('--geocode-cache', metavar='FILE', help="Cache kết quả geocode theo địa chỉ đã chuẩn hóa")
+    parser.add_argument('--spatial-index', action='store_true',
+                        help="Ghi chỉ mục không gian (data.spatial.json) cạnh --output, bật --geocode")
+    parser.add_argument('--batches', action='store_true',
+                        help="Gom case chưa cứu thành các đợt điều phối có thứ tự đi (data.batches.json), bật --geocode")
+    parser.add_argument('--batch-capacity', type=int, default=DEFAULT_CAPACITY, help="Số case tối đa mỗi đợt (xuồng/xe)")
+    parser.add_argument('--batch-eps', type=float, default=DEFAULT_EPS_KM, help="Bán kính gom cụm (km)")
+    parser.add_argument('--batch-min-weight', type=int, default=DEFAULT_MIN_WEIGHT,
+                        help="Tổng trọng số priority tối thiểu quanh 1 điểm để thành lõi cụm (CRITICAL=8, HIGH=4, MEDIUM=2, LOW=1)")
+    parser.add_argument('--store', metavar='FILE',
+                        help="Đồng bộ kết quả vào kho SQLite (index area/priority/SĐT + FTS5), xem store.py; cần --ids stable")
+    parser.add_argument('--shards', metavar='DIR', help="Ghi thêm mỗi area một file + manifest.json vào DIR")
+    parser.add_argument('--shard-format', choices=list(SUFFIXES), default='pretty')
+    parser.add_argument('--profile', action='store_true', help="In bảng thời gian và bộ đếm theo stage")
+    parser.add_argument('--profile-functions', action='store_true',
+                        help="Thêm số lần gọi / thời gian từng hàm (cProfile, làm chậm các stage; bật --profile)")
+    parser.add_argument('--profile-memory', action='store_true',
+                        help="Thêm bộ nhớ cấp phát theo stage (tracemalloc, làm chậm các stage; bật --profile)")
+    parser.add_argument('--profile-json', metavar='FILE', help="Ghi metrics profile ra JSON (bật --profile)")
+    parser.add_argument('--profile-pstats', metavar='FILE', help="Ghi file cProfile/pstats (bật --profile-functions)")
+    return parser
+
+
+def print_stats(cases):
+    area_counts = {}
+    priority_counts = {}
+    for c in cases:
+        area_counts[c['area']] = area_counts.get(c['area'], 0) + 1
+        priority_counts[c['priority']] = priority_counts.get(c['priority'], 0) + 1
+
+    print("\n📊 PRIORITY STATS:")
+    for p, c in priority_counts.items():
+        print(f"  {p}: {c}")
+
+    print("\n🗺️ AREA STATS (Top 20):")
+    for a, c in sorted(area_counts.items(), key=lambda x: x[1], reverse=True)[:20]:
+        print(f"  {a}: {c}")
+
+
+def main(argv=None, strategy='full'):
+    parser = build_parser(strategy)
+    args = parser.parse_args(argv)
+    formats = args.formats.split(',')
+    unknown = [fmt for fmt in formats if fmt not in SUFFIXES]
+    if unknown:
+        parser.error(f"định dạng không hỗ trợ: {', '.join(unknown)}")
+    if args.journal and args.ids != 'stable':
+        parser.error("--journal cần --ids stable (id đánh lại 1..N thì không so được)")
+    if args.store and args.ids != 'stable':
+        # Id đánh lại 1..N mỗi lần chạy: isRescued đã đánh dấu trong kho sẽ dính sang case khác
+        parser.error("--store cần --ids stable (id đánh lại 1..N thì không khớp case trong kho)")
+    if args.batch_capacity < 1:
+        parser.error("--batch-capacity phải >= 1")
+    if args.rows and args.input.lower().endswith('.pdf'):
+        # pypdf tách ô bằng dấu cách, rows.split_row chỉ hiểu text dán liền của pdf-parse
+        parser.error("--rows chỉ dùng với pdf_content.txt (pdf-parse), không đọc thẳng file .pdf")
+
+    profiler = None
+    functions = args.profile_functions or bool(args.profile_pstats)
+    if args.profile or args.profile_json or functions or args.profile_memory:
+        profiler = PipelineProfiler(functions=functions, memory=args.profile_memory)
+
+    previous = None
+    if args.journal and os.path.exists(args.output):
+        previous = read_cases(args.output)
+    members = {}
+    geocoder = None
+    if args.geocode or args.geocode_cache or args.spatial_index or args.batches:
+        geocoder = Geocoder(args.places)
+        if args.geocode_cache:
+            geocoder.load_cache(args.geocode_cache)
+
+    areas = Gazetteer(load_keywords(args.area_keywords)) if args.area_keywords else None
+
+    print(f"🚀 STARTING PARSE ({args.strategy})...")
+    with profiler.session() if profiler else nullcontext():
+        cases, raw_count = run(
+            args.input,
+            strategy=args.strategy,
+            workers=args.workers,
+            rows=args.rows,
+            priority=args.priority,
+            address_threshold=args.threshold,
+            backend=args.similarity,
+            profiler=profiler,
+            ids=args.ids,
+            members=members,
+            geocoder=geocoder,
+            areas=areas,
+        )
+        if args.batches:
+            with stage_of(profiler, 'batch'):
+                batches = batch_cases(cases, args.batch_eps, args.batch_min_weight, args.batch_capacity)
+        with stage_of(profiler, 'export'):
+            paths = export(cases, args.output, formats)
+            if args.batches:
+                write_batches(batches, batches_path(args.output))
+                paths.append(batches_path(args.output))
+            if args.spatial_index:
+                SpatialIndex.from_cases(cases).save(index_path(args.output))
+                paths.append(index_path(args.output))
+            if args.shards:
+                shard_stats = export_shards(cases, args.shards, args.shard_format)
+            if args.store:
+                with CaseStore(args.store) as store:
+                    store_stats = store.sync(cases)
+    print(f"📝 Raw cases: {raw_count}")
+    print(f"✅ Unique cases: {len(cases)} (Removed {raw_count - len(cases)})")
+    print_stats(cases)
+    print(f"\n💾 Saved to {', '.join(paths)}")
+    if geocoder is not None:
+        precision = {}
+        for c in cases:
+            precision[c['location']['precision']] = precision.get(c['location']['precision'], 0) + 1
+        print(f"📍 Geocode: {precision} (cache hit {geocoder.hits})")
+        if args.geocode_cache:
+            geocoder.save_cache(args.geocode_cache)
+    if args.batches:
+        clustered = sum(1 for b in batches['batches'] if b['clustered'])
+        print(f"🚤 Batches: {len(batches['batches'])} đợt ({clustered} từ cụm), "
+              f"{sum(len(b['cases']) for b in batches['batches'])} case, chưa định vị {len(batches['unlocated'])}")
+    if args.journal:
+        journal = diff_cases(previous or [], cases, members)
+        append_journal(args.journal, journal, output=args.output, strategy=args.strategy)
+        print(f"📒 Journal -> {args.journal}: thêm {len(journal['added'])}, cập nhật {len(journal['updated'])},"
+              f" gộp {len(journal['merged'])}, xóa {len(journal['removed'])}, không đổi {journal['unchanged']}")
+    if args.store:
+        written, removed = store_stats
+        print(f"🗄️ Store -> {args.store}: ghi {written}, xóa {removed}, tổng {len(cases)}")
+    if args.shards:
+        written, unchanged, removed = shard_stats
+        print(f"🗂️ Shards -> {args.shards}: ghi {written}, giữ nguyên {unchanged}, xóa {removed}")
+
+    if profiler:
+        profiler.print_report()
+        if args.profile_pstats:
+            profiler.dump_stats(args.profile_pstats)
+            print(f"\n💾 pstats -> {args.profile_pstats}")
+        if args.profile_json:
+            profiler.write_json(args.profile_json, input=args.input, strategy=args.strategy,
+                                workers=args.workers, rows=args.rows, raw_cases=raw_count,
+                                unique_cases=len(cases))
+            print(f"💾 metrics -> {args.profile_json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+import re
+import math
+import hashlib
+import struct
+from operator import eq
+
+from .normalize import fold
+
+# Dãy chữ số trong khóa so sánh (số nhà, hẻm, tổ...; normalize_text: "624/67" -> "62467"),
+# kèm đơn vị nếu là số đo / tuổi ("ngập 1m5", "bé 3 tháng", "cụ 80t") hoặc số lượng người
+# ("3 trẻ", "2 người già") - phần mô tả, không phải địa chỉ
+NUMBER = re.compile(
+    r'(\d+)(m\d*\b|t\b|\s*(?:cm|mét|tuổi|tháng|ngày|giờ'
+    r'|người|ng|hộ|em|bé|trẻ|cháu|đứa|con|lớn|nhỏ|già|cụ|ông|bà|vc|gia đình)\b)?'
+)
+
+
+class UnionFind:
+    """Disjoint-set (path compression + union by size) để gộp các cụm trùng"""
+
+    def __init__(self, n=0):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def add(self):
+        """Thêm một phần tử mới, trả về chỉ số của nó"""
+        self.parent.append(len(self.parent))
+        self.size.append(1)
+        return len(self.parent) - 1
+
+    def find(self, x):
+        root = x
+        while self.parent[root] != root:
+            root = self.parent[root]
+        # Nén đường đi
+        while self.parent[x] != root:
+            self.parent[x], x = root, self.parent[x]
+        return root
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return ra
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+        return ra
+
+    def groups(self):
+        """Trả về danh sách các cụm, mỗi cụm theo thứ tự chỉ số tăng dần"""
+        clusters = {}
+        for i in range(len(self.parent)):
+            clusters.setdefault(self.find(i), []).append(i)
+        return sorted(clusters.values(), key=lambda g: g[0])
+
+
+def char_ngrams(text, n=3):
+    """Tập n-gram ký tự của chuỗi đã chuẩn hóa (chuỗi ngắn hơn n -> chính nó)"""
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class DedupIndex:
+    """
+    Chỉ mục blocking cho lọc trùng:
+    - Inverted index theo số điện thoại (trùng SĐT -> ứng viên chắc chắn)
+    - MinHash-LSH trên n-gram ký tự của địa chỉ cốt lõi
+    - Cầu nối không dấu: chữ ký MinHash của khóa đã gấp dấu, chỉ dùng cho cặp có
+      ít nhất 1 bên gõ không dấu ("dien phu" vs "Diên Phú"); cặp cùng có dấu vẫn
+      chỉ qua chữ ký có dấu (gấp dấu làm các địa chỉ khác nhau dễ chung bucket hơn)
+    Chỉ các cặp nằm chung bucket mới được chấm điểm bằng hàm is_duplicate.
+    """
+
+    def __init__(self, num_bands=10, band_size=2, ngram=3, min_agreement=0.2):
+        self.num_bands = num_bands
+        self.band_size = band_size
+        self.ngram = ngram
+        # Tỉ lệ hoán vị MinHash trùng nhau tối thiểu (ước lượng Jaccard) để chấm điểm cặp
+        self.min_agreement = min_agreement
+        num_perm = num_bands * band_size
+        # Số giá trị MinHash phải trùng, so trên cả chữ ký phẳng (map(eq) chạy trong C)
+        self.min_same = math.ceil(min_agreement * num_perm - 1e-9)
+        self._hash_format = '<%dI' % num_perm
+        self._hash_bytes = 4 * num_perm
+        self._shingle_cache = {}
+        self.phone_index = {}
+        self.buckets = {}
+        self.signatures = {}
+        # Chữ ký không dấu: của mọi phần tử / chỉ của phần tử gõ không dấu
+        self.folded_buckets = {}
+        self.unaccented_buckets = {}
+        self.folded_signatures = {}
+
+    def _shingle_hashes(self, shingle):
+        """num_perm giá trị băm 32-bit độc lập của một n-gram (có cache)"""
+        hashes = self._shingle_cache.get(shingle)
+        if hashes is None:
+            # shake_128 cho digest độ dài tùy ý: 1 lần gọi C thay cho num_perm hàm băm,
+            # và ổn định giữa các lần chạy (khác với hash() của Python)
+            digest = hashlib.shake_128(shingle.encode('utf-8')).digest(self._hash_bytes)
+            hashes = struct.unpack(self._hash_format, digest)
+            self._shingle_cache[shingle] = hashes
+        return hashes
+
+    def signature(self, text):
+        """Tính các band key MinHash cho một chuỗi địa chỉ (rỗng nếu không có n-gram)"""
+        shingles = char_ngrams(text, self.ngram)
+        if not shingles:
+            return []
+        # Min theo từng hoán vị = min theo cột của ma trận (n-gram x hoán vị)
+        mins = tuple(map(min, zip(*[self._shingle_hashes(s) for s in shingles])))
+        r = self.band_size
+        return [(band,) + mins[band * r:(band + 1) * r] for band in range(self.num_bands)]
+
+    def candidates(self, phones, bands, block=None, folded=None, unaccented=False):
+        """
+        Các phần tử đã có trong chỉ mục nên chấm điểm với case:
+        chung SĐT, hoặc chung band LSH và ước lượng Jaccard đạt min_agreement.
+        folded: chữ ký không dấu của case; case gõ không dấu (unaccented) so với mọi
+        phần tử qua chữ ký này, case có dấu chỉ so với các phần tử gõ không dấu.
+        """
+        found = set()
+        for phone in phones:
+            found.update(self.phone_index.get((block, phone), ()))
+        self._collect(found, bands, self.buckets, self.signatures, block)
+        if folded:
+            buckets = self.folded_buckets if unaccented else self.unaccented_buckets
+            self._collect(found, folded, buckets, self.folded_signatures, block)
+        return found
+
+    def _collect(self, found, bands, buckets, signatures, block):
+        """Thêm vào found các phần tử chung band với bands và đủ số giá trị MinHash trùng"""
+        values = _values(bands)
+        # Phần tử chung nhiều band chỉ so chữ ký 1 lần
+        checked = set(found)
+        for band in bands:
+            for item in buckets.get((block,) + band, ()):
+                if item in checked:
+                    continue
+                checked.add(item)
+                if sum(map(eq, values, signatures[item])) >= self.min_same:
+                    found.add(item)
+
+    def add(self, item, phones, bands, block=None, folded=None, unaccented=False):
+        """Đưa phần tử vào các bucket SĐT và LSH (và bucket không dấu nếu có folded)"""
+        self.signatures[item] = _values(bands)
+        for phone in phones:
+            self.phone_index.setdefault((block, phone), []).append(item)
+        for band in bands:
+            self.buckets.setdefault((block,) + band, []).append(item)
+        if folded:
+            self.folded_signatures[item] = _values(folded)
+            for band in folded:
+                self.folded_buckets.setdefault((block,) + band, []).append(item)
+                if unaccented:
+                    self.unaccented_buckets.setdefault((block,) + band, []).append(item)
+
+
+def _values(bands):
+    """Chữ ký phẳng (mọi giá trị MinHash theo thứ tự hoán vị) từ các band key"""
+    return tuple(value for band in bands for value in band[1:])
+
+
+class CaseFeatures:
+    """
+    Đặc trưng so sánh của 1 case, tính đúng 1 lần trước khi lọc trùng:
+    tập SĐT đã chuẩn hóa, địa chỉ cốt lõi, khóa so sánh (chuỗi đưa vào
+    similarity), khóa không dấu (đưa vào MinHash, và so sánh khi 1 bên gõ
+    không dấu), tập token và tập số (số nhà, hẻm...) của khóa. other_keys: các cách đọc
+    khác của khóa khi chỉ dùng để lấy số (VD: đã bỏ ô Số người bị pdf-parse dán vào số
+    nhà), mỗi cách đọc cho 1 tập số.
+    """
+    __slots__ = ('phones', 'address', 'key', 'folded', 'tokens', 'numbers')
+
+    def __init__(self, phones, address, key, other_keys=()):
+        self.phones = frozenset(phones)
+        self.address = address
+        self.key = key
+        self.folded = fold(key)
+        self.tokens = frozenset(key.split())
+        # Gồm cả số dính chữ ("Của10184"); "02 Bàu Đế" = "2 Bàu Đế" nên bỏ số 0 ở đầu
+        self.numbers = tuple({
+            frozenset(number.lstrip('0') or '0' for number, unit in NUMBER.findall(text) if not unit)
+            for text in (key, *other_keys)
+        })
+
+    @property
+    def unaccented(self):
+        """Khóa gõ không dấu (str.isascii là O(1))"""
+        return self.key.isascii()
+
+    def compare_keys(self, other):
+        """
+        Cặp khóa để chấm điểm: cả 2 có dấu -> so nguyên dấu (gấp dấu làm các địa chỉ
+        khác nhau giống nhau hơn); 1 bên gõ không dấu -> so trên khóa không dấu
+        """
+        if self.unaccented or other.unaccented:
+            return self.folded, other.folded
+        return self.key, other.key
+
+    def distinct_address(self, other):
+        """
+        2 địa chỉ có vẻ khác nhau: mọi cách đọc của cả 2 đều có số mà không cặp nào chung
+        số nào ("624/67 lương định của" / "585362 lương định của"): tên đường gần giống nhau
+        hoặc chung SĐT (1 người báo giúp nhiều nhà) chưa đủ để gộp. Chỉ là heuristic:
+        is_duplicate của chiến lược vẫn gộp khi chung SĐT và địa chỉ giống hẳn nhau.
+        """
+        return all(a and b and a.isdisjoint(b) for a in self.numbers for b in other.numbers)
+
+
+def member_conflict(member, f, is_duplicate):
+    """Thành viên khác số nhà với case mới và không trùng hẳn với nó (xem distinct_address)"""
+    return member.distinct_address(f) and not is_duplicate(member, f)
+
+
+def find_duplicate_groups(cases, features_of, is_duplicate, block_of=None, index=None, stats=None):
+    """
+    Gom các case trùng lặp bằng chỉ mục blocking + union-find.
+    - features_of(case): CaseFeatures của case, chỉ gọi 1 lần cho mỗi case
+    - is_duplicate(f1, f2): so sánh 2 CaseFeatures
+    - block_of(case): khóa chặn bổ sung (VD: area), None = không chặn
+    Mỗi cụm có 1 case đại diện (case xuất hiện đầu tiên): case mới chỉ vào cụm nếu trùng
+    với chính đại diện và không mâu thuẫn số nhà với thành viên nào (_conflict), không nối qua thành viên
+    bất kỳ (A~B, B~C không kéo A và C về chung cụm). Vì vậy chỉ đại diện cần nằm trong
+    bucket LSH, thành viên chỉ vào bucket SĐT.
+    - stats (dict, tùy chọn): nhận 'proposed' = số cặp (case, case trước đó) chỉ mục đề xuất
+    Trả về danh sách các cụm chỉ số, theo thứ tự xuất hiện đầu tiên.
+    """
+    index = index or DedupIndex()
+    uf = UnionFind(len(cases))
+    features = [features_of(case) for case in cases]
+    blocks = [block_of(case) if block_of else None for case in cases]
+    # Chữ ký không dấu chỉ dùng để nối với case gõ không dấu: block không có case
+    # nào gõ không dấu thì bỏ qua (tiết kiệm 1 lần MinHash mỗi case)
+    bridged = {block for block, f in zip(blocks, features) if f.unaccented}
+    # Gốc union-find -> case đại diện / các thành viên của cụm
+    leader = list(range(len(cases)))
+    members = [[i] for i in range(len(cases))]
+
+    for i, block in enumerate(blocks):
+        f = features[i]
+        bands = index.signature(f.key)
+        folded = None
+        if block in bridged:
+            folded = bands if f.folded == f.key else index.signature(f.folded)
+
+        candidates = index.candidates(f.phones, bands, block, folded, f.unaccented)
+        if stats is not None:
+            stats['proposed'] = stats.get('proposed', 0) + len(candidates)
+        tried = set()
+        # Cụm xuất hiện sớm hơn được thử trước (thứ tự tất định)
+        for j in sorted(candidates):
+            root = uf.find(j)
+            if root in tried:
+                continue
+            tried.add(root)
+            head, group = leader[root], members[root]
+            if is_duplicate(features[head], f) and not any(member_conflict(features[m], f, is_duplicate) for m in group):
+                group.append(i)
+                root = uf.union(root, i)
+                leader[root], members[root] = head, group
+                index.add(i, f.phones, [], block)
+                break
+        else:
+            index.add(i, f.phones, bands, block, folded, f.unaccented)
+
+    return uf.groups()
@@ -0,0 +1,114 @@
+import json
+import os
+
+from .changes import atomic_write
+
+# Định dạng xuất:
+# - pretty: mảng object, indent=2 (data.json mà rescue-app đang import)
+# - compact: JSON rút gọn, area/priority thay bằng chỉ số vào bảng từ điển ở header
+# - columnar: mỗi trường một mảng song song
+# - jsonl: dòng đầu là header (trường + từ điển), mỗi dòng sau là 1 case dạng mảng
+FORMAT_VERSION = 1
+CODED_FIELDS = ('area', 'priority')
+SUFFIXES = {
+    'pretty': '.json',
+    'compact': '.compact.json',
+    'columnar': '.columnar.json',
+    'jsonl': '.jsonl',
+}
+_MINIFIED = {'ensure_ascii': False, 'separators': (',', ':')}
+
+
+def output_path(output, fmt):
+    """data.json -> data.compact.json / data.columnar.json / data.jsonl"""
+    if fmt == 'pretty':
+        return output
+    root, _ = os.path.splitext(output)
+    return root + SUFFIXES[fmt]
+
+
+def _fields(cases):
+    """Các trường theo thứ tự xuất hiện (chiến lược full không có original_content)"""
+    fields = {}
+    for case in cases:
+        fields.update(dict.fromkeys(case))
+    return list(fields)
+
+
+def _dictionaries(cases):
+    """Bảng từ điển cho các trường lặp nhiều (area, priority), theo thứ tự xuất hiện"""
+    return {field: list(dict.fromkeys(case[field] for case in cases)) for field in CODED_FIELDS}
+
+
+def _row(case, fields, codes):
+    return [codes[f][case[f]] if f in codes else case.get(f) for f in fields]
+
+
+def encode(cases, fmt):
+    """Chuỗi đầu ra của cases theo định dạng fmt"""
+    if fmt == 'pretty':
+        return json.dumps(cases, ensure_ascii=False, indent=2)
+
+    fields = _fields(cases)
+    dictionaries = _dictionaries(cases)
+    codes = {f: {value: i for i, value in enumerate(values)} for f, values in dictionaries.items()}
+    header = {'format': fmt, 'version': FORMAT_VERSION, 'fields': fields, 'dictionaries': dictionaries}
+
+    if fmt == 'compact':
+        rows = [{f: codes[f][c[f]] if f in codes else c.get(f) for f in fields} for c in cases]
+        return json.dumps({**header, 'cases': rows}, **_MINIFIED)
+    if fmt == 'columnar':
+        columns = {f: [codes[f][c[f]] if f in codes else c.get(f) for c in cases] for f in fields}
+        return json.dumps({**header, 'count': len(cases), 'columns': columns}, **_MINIFIED)
+    if fmt == 'jsonl':
+        lines = [json.dumps(header, **_MINIFIED)]
+        lines.extend(json.dumps(_row(c, fields, codes), **_MINIFIED) for c in cases)
+        return '\n'.join(lines) + '\n'
+    raise ValueError(f"Định dạng không hỗ trợ: {fmt}")
+
+
+def decode(text):
+    """Đọc lại cases (danh sách dict như data.json) từ bất kỳ định dạng nào ở trên"""
+    if text.lstrip().startswith('['):
+        return json.loads(text)
+
+    first, _, rest = text.partition('\n')
+    # Header jsonl do encode ghi luôn mở đầu bằng trường format: nhận ra không cần parse
+    if first.lstrip().startswith('{"format":"jsonl"'):
+        header = json.loads(first)
+        rows = [json.loads(line) for line in rest.splitlines() if line]
+    else:
+        # compact / columnar là JSON 1 dòng: chỉ parse cả text khi file bị xuống dòng
+        header = json.loads(text if rest.strip() else first)
+    if header.get('version') != FORMAT_VERSION:
+        raise ValueError(f"Phiên bản định dạng không hỗ trợ: {header.get('version')}")
+
+    fields = header['fields']
+    dictionaries = header['dictionaries']
+    if header['format'] == 'compact':
+        cases = header['cases']
+        for case in cases:
+            for f, values in dictionaries.items():
+                case[f] = values[case[f]]
+        return cases
+    if header['format'] == 'columnar':
+        columns = header['columns']
+        for f, values in dictionaries.items():
+            columns[f] = [values[code] for code in columns[f]]
+        return [dict(zip(fields, values)) for values in zip(*(columns[f] for f in fields))]
+    decoders = [dictionaries.get(f) for f in fields]
+    return [
+        {f: (d[v] if d is not None else v) for f, d, v in zip(fields, decoders, row)}
+        for row in rows
+    ]
+
+
+def write_cases(cases, output, fmt='pretty'):
+    path = output_path(output, fmt)
+    atomic_write(path, encode(cases, fmt).encode('utf-8'))
+    return path
+
+
+def read_cases(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return decode(f.read())
@@ -0,0 +1,126 @@
+import re
+from .dedup_index import CaseFeatures, DedupIndex
+from .fuzzy import AREA_FUZZY
+from .gazetteer import AREA_GAZETTEER
+from .priority import FINAL_CLASSIFIER
+from .rows import drop_people_count
+from .similarity import DEFAULT_BACKEND, is_similar
+from .text import extract_phones, normalize_phone, normalize_text, strip_note
+
+# Chiến lược "full": content là cả dòng (địa chỉ + tình hình), bỏ SĐT và tiền tố ưu tiên
+
+# Ngưỡng tương đồng địa chỉ mặc định (theo thang của backend sequencematcher)
+ADDRESS_THRESHOLD = 0.8
+PRIORITY_ORDER = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
+
+def extract_address_core(content):
+    """Trích xuất phần địa chỉ cốt lõi từ content"""
+    # Loại bỏ phần mô tả tình trạng thường gặp
+    clean_content = re.sub(r'\(.*?\)', '', content) # Bỏ ngoặc
+    clean_content = re.sub(r'\d+\s*(người|em|bé|cháu|đứa|con|lớn|nhỏ)', '', clean_content, flags=re.IGNORECASE)
+    
+    # Lấy phần đầu (thường là địa chỉ)
+    words = clean_content.split()
+    if len(words) > 15:
+        address = ' '.join(words[:15])
+    else:
+        address = clean_content
+    return normalize_text(address)
+
+def case_features(case):
+    """Đặc trưng so sánh của case (SĐT, địa chỉ cốt lõi, khóa so sánh), tính 1 lần"""
+    address = extract_address_core(case['content'])
+    # Cách đọc số nhà thứ 2: bỏ ô Số người bị pdf-parse dán vào ("Cầu Bè548/1" -> "Cầu Bè 48/1")
+    other_keys = ()
+    content = drop_people_count(case['content'])
+    if content != case['content']:
+        other_keys = (normalize_text(extract_address_core(content)),)
+    return CaseFeatures([normalize_phone(p) for p in case['phones']], address, normalize_text(address), other_keys)
+
+def is_duplicate_features(f1, f2, address_threshold=ADDRESS_THRESHOLD, backend=DEFAULT_BACKEND):
+    """Kiểm tra trùng lặp trên đặc trưng đã tính sẵn (không chuẩn hóa lại)"""
+    # Khác số nhà -> 2 hộ khác nhau, trừ khi chung SĐT mà địa chỉ vẫn giống nhau
+    # (gửi lại của cùng 1 hộ, số nhà bị gõ / dán khác đi)
+    if f1.distinct_address(f2):
+        return bool(f1.phones & f2.phones) and _similar_address(f1, f2, address_threshold, backend)
+
+    # Check phone numbers
+    if f1.phones & f2.phones:
+        return True
+
+    # Check address similarity
+    return _similar_address(f1, f2, address_threshold, backend)
+
+def _similar_address(f1, f2, address_threshold, backend):
+    return len(f1.address) > 8 and len(f2.address) > 8 and \
+        is_similar(*f1.compare_keys(f2), address_threshold, backend)
+
+def is_duplicate(case1, case2, phone_threshold=0.5, address_threshold=ADDRESS_THRESHOLD):
+    """Kiểm tra 2 case có trùng lặp không"""
+    return is_duplicate_features(case_features(case1), case_features(case2), address_threshold)
+
+def new_index():
+    """Chỉ mục blocking cho bước lọc trùng (tham số mặc định)"""
+    return DedupIndex()
+
+def merge_group(duplicates):
+    """Gộp 1 nhóm trùng: giữ case có priority cao nhất, gộp SĐT, lấy content dài nhất"""
+    # Chọn case có priority cao nhất
+    best_case = min(duplicates, key=lambda c: PRIORITY_ORDER.get(c['priority'], 99))
+    
+    # Merge phones
+    all_phones = set()
+    for dup in duplicates:
+        all_phones.update(dup['phones'])
+    best_case['phones'] = sorted(all_phones)
+    
+    # Merge content (lấy cái dài nhất)
+    longest_content = max(duplicates, key=lambda x: len(x['content']))['content']
+    best_case['content'] = longest_content
+    return best_case
+
+def parse_line(line):
+    """Parse 1 dòng dữ liệu thành case (chưa có id), None nếu dòng không hợp lệ"""
+    line = strip_note(line.strip())
+    if not line or 'Mức độ ưu tiên' in line:
+        return None
+
+    # 1. Parse Priority (Cột 1 hoặc từ khóa trong câu)
+    priority, _ = FINAL_CLASSIFIER.classify(line)
+
+    # 2. Extract Phones + 3. Clean Content (dòng đã bỏ SĐT, cùng 1 lượt quét)
+    phones, content = extract_phones(line)
+
+    # Remove priority prefixes at start
+    content = re.sub(r'^(Khẩn cấp|Ưu tiên cao|Thường)\s*', '', content, flags=re.IGNORECASE)
+    content = re.sub(r'\s+', ' ', content).strip()
+
+    if len(content) < 5: return None
+
+    # 4. Determine Area
+    # Check area keywords (1 lượt Aho–Corasick, từ khóa dài nhất thắng)
+    area = AREA_GAZETTEER.lookup(content)
+
+    # Fallback: Nếu vẫn là Khác, thử tìm "Thôn X", "Xã Y"
+    if area == 'Khác':
+        match = re.search(r'(xã|thôn|phường)\s+([A-ZĐ][a-zà-ỹ]+(\s+[A-ZĐ][a-zà-ỹ]+)+)', content)
+        if match:
+            potential_area = match.group(2)
+            # Map lại nếu có trong DB
+            area = AREA_GAZETTEER.lookup(potential_area)
+
+    # Fallback cuối: địa danh gõ sai / viết tắt (LĐC)
+    if area == 'Khác':
+        area = AREA_FUZZY.lookup(content)
+
+    return {
+        "content": content,
+        "phones": phones,
+        "area": area,
+        "priority": priority,
+        "isRescued": False
+    }
+
+def parse_row(row):
+    """Parse 1 bản ghi của rows.py: dùng toàn bộ bản ghi đã ghép các dòng tràn"""
+    return parse_line(row['raw'])
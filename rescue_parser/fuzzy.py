@@ -0,0 +1,173 @@
+import re
+from functools import lru_cache
+
+from .gazetteer import AREA_GAZETTEER, AREA_KEYWORDS
+from .normalize import fold
+from .similarity import levenshtein_bounded
+
+# SymSpell chỉ sinh chuỗi xóa trên tiền tố, đủ để lọc ứng viên mà từ điển nhỏ đi nhiều
+PREFIX_LENGTH = 7
+MAX_DISTANCE = 2
+# Tên ngắn hơn thì không sửa lỗi (chỉ khớp chính xác)
+MIN_LENGTH = 8
+
+WORD = re.compile(r'\w+')
+# Chữ viết hoa hay gặp trong tin nhắn, không bao giờ là viết tắt địa danh (SĐT, UBND...)
+COMMON_ABBREVIATIONS = {'sdt', 'ubnd', 'thcs', 'thpt', 'sos', 'bds', 'tbt'}
+
+
+def max_distance(length):
+    """
+    Số lỗi cho phép theo độ dài tên không dấu: tên ngắn không sửa (quá dễ trùng
+    nhầm, VD "cau be" / "cau ben"), 8-11 ký tự: 1 lỗi, từ 12 ký tự: 2 lỗi
+    """
+    if length < MIN_LENGTH:
+        return 0
+    if length < 12:
+        return 1
+    return MAX_DISTANCE
+
+
+@lru_cache(maxsize=65536)
+def _deletes(word, distance):
+    """Các chuỗi thu được khi xóa tối đa distance ký tự của word (gồm chính word)"""
+    result = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        result |= frontier
+    return frozenset(result)
+
+
+@lru_cache(maxsize=65536)
+def _initials(name):
+    return ''.join(token[0] for token in name.split())
+
+
+def _distance(tokens, name_tokens, limit):
+    """
+    Tổng khoảng cách sửa theo từng âm tiết, None nếu vượt limit. Âm tiết ngắn (<= 3 chữ)
+    phải khớp đúng: "pho" / "phu" là 2 từ khác hẳn nhau chứ không phải lỗi gõ.
+    """
+    total = 0
+    for token, expected in zip(tokens, name_tokens):
+        if token == expected:
+            continue
+        if len(expected) <= 3:
+            return None
+        total += levenshtein_bounded(token, expected, limit - total)
+        if total > limit:
+            return None
+    return total
+
+
+class FuzzyGazetteer:
+    """
+    Tra địa danh gõ sai: từ điển xóa ký tự kiểu SymSpell trên tên không dấu
+    (normalize.fold) của các từ khóa. Mỗi cửa sổ token liên tiếp của dòng (số token
+    bằng số token của các tên) được so với tên gần nhất trong khoảng max_distance;
+    viết tắt chữ cái đầu (LĐC -> Lương Định Của) chỉ nhận khi viết hoa trong text gốc.
+    Dùng làm fallback sau Gazetteer khớp chính xác.
+    """
+
+    def __init__(self, mapping, prefix_length=PREFIX_LENGTH):
+        self.mapping = dict(mapping)
+        self.prefix_length = prefix_length
+        # Tên không dấu -> từ khóa gốc (trùng tên thì từ khóa khai báo trước thắng)
+        self.names = {}
+        for keyword in self.mapping:
+            self.names.setdefault(fold(keyword), keyword)
+        # Hòa thì tên dài hơn, rồi tên khai báo trước thắng
+        self.rank = {name: (-len(name), i) for i, name in enumerate(self.names)}
+
+        # (chữ cái đầu các âm tiết, chuỗi xóa của tiền tố) -> tên; chữ cái đầu phải trùng
+        # nên gộp vào khóa, cửa sổ không có chữ cái đầu nào khớp bị loại sau 1 lần tra set
+        self.deletes = {}
+        self.initials = set()
+        # Số token -> (độ dài ngắn nhất, dài nhất) của các tên, để bỏ sớm cửa sổ không thể khớp
+        self.windows = {}
+        for name in self.names:
+            size = len(name.split())
+            lo, hi = self.windows.get(size, (len(name), len(name)))
+            self.windows[size] = (min(lo, len(name)), max(hi, len(name)))
+            initials = _initials(name)
+            self.initials.add(initials)
+            for variant in _deletes(name[:prefix_length], max_distance(len(name))):
+                self.deletes.setdefault((initials, variant), []).append(name)
+
+        # Viết tắt chữ cái đầu của tên >= 3 âm tiết chữ (không tính tên có số / đã chứa
+        # viết tắt như "BV Đường Sắt"); viết tắt trùng giữa 2 khu vực thì bỏ
+        areas = {}
+        for name, keyword in self.names.items():
+            abbr = _initials(name)
+            if len(abbr) < 3 or not abbr.isalpha() or abbr in COMMON_ABBREVIATIONS:
+                continue
+            if any(len(word) > 1 and word.isupper() for word in keyword.split()):
+                continue
+            areas.setdefault(abbr, {})[self.mapping[keyword]] = keyword
+        self.abbreviations = {abbr: next(iter(found.values())) for abbr, found in areas.items() if len(found) == 1}
+
+    def _better(self, distance, name, best):
+        return best is None or (distance, self.rank[name]) < (best[0], self.rank[best[1]])
+
+    def _nearest(self, tokens, window, initials):
+        """(khoảng cách, tên) gần nhất của 1 cửa sổ, None nếu không có tên trong ngưỡng"""
+        best = None
+        seen = set()
+        reach = max_distance(len(window) + MAX_DISTANCE)
+        for variant in _deletes(window[:self.prefix_length], reach):
+            for name in self.deletes.get((initials, variant), ()):
+                # 1 tên có thể gặp lại qua nhiều chuỗi xóa khác nhau
+                if name in seen:
+                    continue
+                seen.add(name)
+                d = _distance(tokens, name.split(), max_distance(len(name)))
+                if d is not None and self._better(d, name, best):
+                    best = (d, name)
+        return best
+
+    def find(self, text):
+        """(từ khóa, khoảng cách) tốt nhất trong text, None nếu không có"""
+        best = None
+        tokens = fold(text).split()
+        initial = [token[0] for token in tokens]
+        for size, (lo, hi) in self.windows.items():
+            for i in range(len(tokens) - size + 1):
+                # Chữ cái đầu từng âm tiết phải trùng: lỗi gõ hiếm khi rơi vào phụ âm đầu,
+                # còn tên khác nhau đúng 1 phụ âm đầu là 2 địa danh khác (Diên Thạnh / Diên Khánh)
+                initials = ''.join(initial[i:i + size])
+                if initials not in self.initials:
+                    continue
+                window = ' '.join(tokens[i:i + size])
+                # Cửa sổ quá ngắn thì không tên nào được phép sửa lỗi tới nó
+                if len(window) < MIN_LENGTH - 1 or not lo - MAX_DISTANCE <= len(window) <= hi + MAX_DISTANCE:
+                    continue
+                found = self._nearest(tokens[i:i + size], window, initials)
+                if found and self._better(*found, best):
+                    best = found
+        if best is not None:
+            return self.names[best[1]], best[0]
+        return self.find_abbreviation(text)
+
+    def find_abbreviation(self, text):
+        """Viết tắt: token viết hoa toàn bộ trong text gốc (LĐC), tính như sai 1 lỗi"""
+        for word in WORD.findall(text):
+            if len(word) >= 3 and word.isupper():
+                keyword = self.abbreviations.get(fold(word))
+                if keyword is not None:
+                    return keyword, 1
+        return None
+
+    def lookup(self, text, default='Khác'):
+        """Khu vực ứng với địa danh gần nhất trong text"""
+        found = self.find(text)
+        return default if found is None else self.mapping[found[0]]
+
+
+AREA_FUZZY = FuzzyGazetteer(AREA_KEYWORDS)
+
+
+def lookup_area(text):
+    """Khu vực: khớp chính xác (AREA_GAZETTEER) trước, không có mới tra gần đúng"""
+    area = AREA_GAZETTEER.lookup(text)
+    return AREA_FUZZY.lookup(text) if area == 'Khác' else area
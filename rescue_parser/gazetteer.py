@@ -0,0 +1,169 @@
+import json
+import unicodedata
+from collections import deque
+
+from .normalize import fold_chars
+
+# Danh sách khu vực MỞ RỘNG: từ khóa địa danh -> khu vực
+AREA_KEYWORDS = {
+    # Nha Trang & Vùng ven
+    'Vĩnh Thạnh': 'Vĩnh Thạnh',
+    'Chợ Ga': 'Vĩnh Thạnh',
+    'Phú Bình': 'Vĩnh Thạnh',
+    'Vĩnh Ngọc': 'Vĩnh Ngọc',
+    'Lương Định Của': 'Vĩnh Ngọc',
+    'Xuân Lạc': 'Vĩnh Ngọc',
+    'Vĩnh Hiệp': 'Vĩnh Hiệp',
+    'Vĩnh Thái': 'Vĩnh Thái',
+    'Thái Thông': 'Vĩnh Thái',
+    'Vĩnh Trung': 'Vĩnh Trung',
+    'Vĩnh Phương': 'Vĩnh Phương',
+    'Vĩnh Hải': 'Vĩnh Hải',
+    'Bắc Nha Trang': 'Bắc Nha Trang',
+    'Đường 23/10': 'Đường 23/10',
+    'Cầu Bè': 'Cầu Bè',
+    'Cầu Dứa': 'Cầu Dứa',
+    'Cầu Ké': 'Cầu Ké',
+    'Cầu Gỗ': 'Cầu Gỗ',
+    'Cây Dầu Đôi': 'Cây Dầu Đôi',
+    'Gò Cây Sung': 'Gò Cây Sung',
+    'Phú Nông': 'Phú Nông',
+    'Bệnh Viện Đường Sắt': 'BV Đường Sắt',
+    'BV Đường Sắt': 'BV Đường Sắt',
+    'Ngọc Hiệp': 'Ngọc Hiệp',
+    'Phước Đồng': 'Phước Đồng',
+    'Đồng Muối': 'Phước Long',
+
+    # Diên Khánh (Chi tiết)
+    'Diên An': 'Diên An',
+    'Phú Ân Nam': 'Diên An',
+    'Diên Toàn': 'Diên Toàn',
+    'Diên Thọ': 'Diên Thọ',
+    'Diên Phước': 'Diên Phước',
+    'Diên Lạc': 'Diên Lạc',
+    'Diên Sơn': 'Diên Sơn',
+    'Diên Lâm': 'Diên Lâm',
+    'Diên Tân': 'Diên Tân',
+    'Diên Điền': 'Diên Điền',
+    'Diên Phú': 'Diên Phú',
+    'Diên Hòa': 'Diên Hòa',
+    'Bình Khánh': 'Diên Hòa',
+    'Diên Khánh': 'Diên Khánh',
+    'Suối Hiệp': 'Suối Hiệp',
+
+    # Khác
+    'Bàn Thạch': 'Bàn Thạch',
+    'Võ Cạnh': 'Võ Cạnh',
+    'Võ Dõng': 'Võ Dõng',
+    'Xuân Sơn': 'Xuân Sơn',
+}
+
+_NO_MATCH = float('inf')
+
+
+class Gazetteer:
+    """
+    Bộ so khớp địa danh biên dịch toàn bộ từ khóa thành 1 automaton Aho–Corasick.
+    Mỗi dòng chỉ cần 1 lượt duyệt tuyến tính, không phụ thuộc số lượng từ khóa.
+    Ngữ nghĩa longest-match: từ khóa dài nhất xuất hiện trong dòng thắng,
+    bằng độ dài thì từ khóa khai báo trước thắng (giống vòng lặp sorted cũ).
+    priority(keyword) (tùy chọn) thay thứ tự mặc định, giá trị nhỏ hơn thắng.
+    normalize: chuẩn hóa từng ký tự cho cả từ khóa lẫn text, phải giữ nguyên độ dài
+    (mặc định gấp dấu: 'Dien Phu' khớp 'Diên Phú').
+    Khớp chỉ nhờ chuẩn hóa (text gốc khác dấu với từ khóa) phải kết thúc ở ranh giới
+    từ: ký tự gốc ngay sau không phải chữ thường (gấp dấu thì 'dien tho' nằm trong
+    'điện thoại'); chữ hoa / số dính liền vẫn nhận vì pdf-parse dán liền các ô
+    ("Diên Lạc33", "Vĩnh ThạnhHẻm"). Khớp đúng nguyên văn thì nhận như trước.
+    """
+
+    def __init__(self, mapping, priority=None, normalize=fold_chars):
+        # Văn bản NFD (chữ + dấu rời) ngắn đi khi gấp dấu: đưa về NFC để vị trí khớp đúng
+        self.mapping = {unicodedata.normalize('NFC', k): v for k, v in mapping.items()}
+        self.normalize = normalize
+        # Thứ hạng = vị trí sau khi sort theo độ dài giảm dần (sort ổn định)
+        self.keywords = sorted(self.mapping, key=priority or (lambda k: -len(k)))
+
+        self._goto = [{}]
+        self._fail = [0]
+        self._best = [_NO_MATCH]
+        # Node kết thúc đúng 1 từ khóa (không gộp theo fail link) -> thứ hạng
+        self._ends = {}
+        for rank, keyword in enumerate(self.keywords):
+            self._insert(normalize(keyword), rank)
+        self._build_failure_links()
+
+    def _insert(self, word, rank):
+        node = 0
+        for ch in word:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._best.append(_NO_MATCH)
+            node = nxt
+        self._best[node] = min(self._best[node], rank)
+        self._ends[node] = min(self._ends.get(node, rank), rank)
+
+    def _build_failure_links(self):
+        """BFS dựng fail link, gộp sẵn kết quả tốt nhất dọc theo chuỗi fail"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[child] = self._goto[f].get(ch, 0)
+                self._best[child] = min(self._best[child], self._best[self._fail[child]])
+                queue.append(child)
+
+    def _accept(self, text, end, rank):
+        """Từ khóa thứ hạng rank kết thúc tại end: khớp nguyên văn, hoặc đứng ở ranh giới từ"""
+        keyword = self.keywords[rank]
+        if text[end - len(keyword):end].lower() == keyword.lower():
+            return True
+        return not text[end:end + 1].islower()
+
+    def find(self, text):
+        """Từ khóa tốt nhất (dài nhất) xuất hiện trong text, None nếu không có"""
+        goto, fail, best_of = self._goto, self._fail, self._best
+        state = 0
+        best = _NO_MATCH
+        text = unicodedata.normalize('NFC', text)
+        for i, ch in enumerate(self.normalize(text), 1):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if best_of[state] < best and self._accept(text, i, best_of[state]):
+                best = best_of[state]
+        return None if best == _NO_MATCH else self.keywords[best]
+
+    def match_prefix(self, text):
+        """Từ khóa dài nhất mà text bắt đầu bằng nó (chỉ đi theo trie), None nếu không có"""
+        goto, ends = self._goto, self._ends
+        state = 0
+        best = None
+        text = unicodedata.normalize('NFC', text)
+        for i, ch in enumerate(self.normalize(text), 1):
+            state = goto[state].get(ch)
+            if state is None:
+                break
+            if state in ends and self._accept(text, i, ends[state]):
+                best = ends[state]
+        return None if best is None else self.keywords[best]
+
+    def lookup(self, text, default='Khác'):
+        """Khu vực ứng với từ khóa tốt nhất trong text"""
+        keyword = self.find(text)
+        return default if keyword is None else self.mapping[keyword]
+
+
+AREA_GAZETTEER = Gazetteer(AREA_KEYWORDS)
+
+
+def load_keywords(path):
+    """Từ khóa khu vực bổ sung {từ khóa: khu vực}, VD file gợi ý do miner.py ghi (đã duyệt / sửa tay)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)['keywords']
@@ -0,0 +1,107 @@
+import os
+import json
+import math
+import hashlib
+
+from .gazetteer import Gazetteer
+from .normalize import fold, fold_batch
+
+DEFAULT_PLACES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'places.json')
+# 3: tra địa danh trên địa chỉ gốc (cache cũ có kết quả khớp giữa từ)
+CACHE_VERSION = 3
+
+# Địa danh càng cụ thể càng được ưu tiên (không phụ thuộc độ dài tên)
+KIND_ORDER = ['landmark', 'bridge', 'street', 'hamlet', 'ward', 'commune', 'district', 'city']
+
+# Bán kính rải marker (độ) theo độ chính xác, để các case cùng 1 điểm không chồng lên nhau
+SPREAD = {
+    'landmark': 0.001, 'bridge': 0.001, 'street': 0.002, 'hamlet': 0.003,
+    'ward': 0.005, 'commune': 0.005, 'district': 0.008, 'city': 0.01, 'area': 0.005, 'default': 0.01,
+}
+
+
+class Geocoder:
+    """
+    Geocoder offline: tìm địa danh cụ thể nhất trong địa chỉ (Aho–Corasick trên
+    tên + alias không dấu của places.json), không có thì lấy tâm của Area,
+    không nữa thì toạ độ mặc định. Kết quả cache theo địa chỉ không dấu.
+    """
+
+    def __init__(self, places_file=DEFAULT_PLACES):
+        with open(places_file, 'rb') as f:
+            raw = f.read()
+        data = json.loads(raw)
+        # Cache trên đĩa chỉ dùng lại được khi file địa danh không đổi
+        self.version = hashlib.sha1(raw).hexdigest()[:12]
+        self.default = data['default']
+        self.places = {}
+        aliases = {}
+        for place in data['places']:
+            self.places[place['name']] = place
+            names = [place['name']] + place.get('aliases', [])
+            for alias in fold_batch(names):
+                aliases.setdefault(alias, place['name'])
+
+        rank = {kind: i for i, kind in enumerate(KIND_ORDER)}
+        self.gazetteer = Gazetteer(
+            aliases,
+            priority=lambda alias: (rank.get(self.places[aliases[alias]]['kind'], len(rank)), -len(alias)),
+        )
+        self.cache = {}
+        self.hits = 0
+
+    def locate(self, address, area=None):
+        """{lat, lng, place, precision} cho 1 địa chỉ (toạ độ tâm, chưa rải)"""
+        key = f"{fold(address)}|{area or ''}"
+        result = self.cache.get(key)
+        if result is not None:
+            self.hits += 1
+            return result
+
+        # Tìm trên địa chỉ gốc (gazetteer tự gấp dấu): cần chữ hoa / thường để chặn
+        # khớp giữa từ, VD "Điện thoại" không phải "Diên Thọ"
+        alias = self.gazetteer.find(address)
+        if alias is not None:
+            place = self.places[self.gazetteer.mapping[alias]]
+            precision = place['kind']
+        elif area in self.places:
+            place, precision = self.places[area], 'area'
+        else:
+            place, precision = self.default, 'default'
+        result = {'lat': place['lat'], 'lng': place['lng'], 'place': place['name'], 'precision': precision}
+        self.cache[key] = result
+        return result
+
+    def geocode(self, cases):
+        """
+        Ghi case['location'] cho từng case. Toạ độ được rải lệch một chút theo băm
+        nội dung case (tất định: cùng case -> cùng vị trí ở mọi lần chạy / render)
+        """
+        for case in cases:
+            found = self.locate(case['content'], case.get('area'))
+            case['location'] = {**found, **_spread(found, case)}
+        return cases
+
+    def load_cache(self, path):
+        if not os.path.exists(path):
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == CACHE_VERSION and data.get('places') == self.version:
+            self.cache.update(data['entries'])
+
+    def save_cache(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'places': self.version, 'entries': self.cache},
+                      f, ensure_ascii=False)
+
+
+def _spread(found, case):
+    """Lệch theo góc + bán kính suy ra từ băm content (phân bố đều trong hình tròn)"""
+    digest = hashlib.sha1(f"{case['content']}|{','.join(case['phones'])}".encode('utf-8')).digest()
+    angle = int.from_bytes(digest[:4], 'big') / 2 ** 32 * 2 * math.pi
+    radius = math.sqrt(int.from_bytes(digest[4:8], 'big') / 2 ** 32) * SPREAD.get(found['precision'], 0.005)
+    return {
+        'lat': round(found['lat'] + radius * math.sin(angle), 6),
+        'lng': round(found['lng'] + radius * math.cos(angle), 6),
+    }
@@ -0,0 +1,188 @@
+import os
+import json
+import hashlib
+import argparse
+
+from .changes import atomic_write
+from .dedup_index import DedupIndex, member_conflict
+from .pdf_extract import read_input_lines
+from .full import parse_line, case_features, is_duplicate_features
+from .text import normalize_phone
+
+# 2: thêm band MinHash của khóa không dấu (folded_bands, xem DedupIndex)
+STATE_VERSION = 2
+PRIORITY_ORDER = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
+
+
+def line_hash(line):
+    """Băm nội dung dòng (đã strip) để nhận biết dòng đã parse"""
+    return hashlib.sha1(line.strip().encode('utf-8')).hexdigest()
+
+
+class IncrementalParser:
+    """
+    Parser tăng dần: lưu trạng thái (hash các dòng đã thấy, các case thành viên
+    kèm chữ ký MinHash, cụm trùng và id đã cấp) để lần chạy sau chỉ parse dòng mới.
+    Mỗi cụm trùng là một case đầu ra với id cố định giữa các lần chạy.
+    """
+
+    def __init__(self, state=None):
+        state = state or {}
+        self.seen = set(state.get('seen', []))
+        self.members = state.get('members', [])
+        self.clusters = {int(k): v for k, v in state.get('clusters', {}).items()}
+        self.next_id = state.get('next_id', 1)
+
+        # Dựng lại chỉ mục dedup từ chữ ký đã lưu, không cần parse/băm lại
+        self.index = DedupIndex()
+        self._features = {}
+        for i, member in enumerate(self.members):
+            member['bands'] = [tuple(b) for b in member['bands']]
+            member['folded_bands'] = [tuple(b) for b in member['folded_bands']]
+            self.index.add(i, self._phones(member), member['bands'], member['area'],
+                           member['folded_bands'], member['unaccented'])
+
+    @classmethod
+    def load(cls, path):
+        """Đọc trạng thái từ file, trạng thái rỗng nếu chưa có"""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('version') != STATE_VERSION:
+            raise ValueError(f"State version không hỗ trợ: {state.get('version')}")
+        return cls(state)
+
+    def save(self, path):
+        state = {
+            'version': STATE_VERSION,
+            'next_id': self.next_id,
+            'seen': sorted(self.seen),
+            'members': self.members,
+            'clusters': self.clusters,
+        }
+        atomic_write(path, json.dumps(state, ensure_ascii=False).encode('utf-8'))
+
+    @staticmethod
+    def _phones(member):
+        return [normalize_phone(p) for p in member['phones']]
+
+    def features(self, i):
+        """CaseFeatures của thành viên i, chỉ tính khi lần đầu cần so sánh"""
+        f = self._features.get(i)
+        if f is None:
+            f = self._features[i] = case_features(self.members[i])
+        return f
+
+    def process(self, lines):
+        """
+        Parse các dòng chưa thấy, gộp vào cụm có sẵn hoặc tạo cụm mới.
+        Trả về delta: case mới, case được cập nhật và các cụm bị gộp (luôn rỗng từ khi
+        case chỉ vào cụm qua đại diện, giữ key cho định dạng delta cũ).
+        """
+        added, touched = set(), set()
+
+        for line in lines:
+            h = line_hash(line)
+            if h in self.seen:
+                continue
+            self.seen.add(h)
+
+            case = parse_line(line)
+            if case is None:
+                continue
+
+            f = case_features(case)
+            member = {
+                'content': case['content'],
+                'phones': case['phones'],
+                'area': case['area'],
+                'priority': case['priority'],
+                'bands': self.index.signature(f.key),
+                'folded_bands': self.index.signature(f.folded),
+                'unaccented': f.unaccented,
+            }
+
+            # Cụm đầu tiên có case đại diện (thành viên đầu) trùng với case mới và không
+            # mâu thuẫn số nhà với thành viên nào (cùng quy tắc với find_duplicate_groups)
+            target = None
+            tried = set()
+            for j in sorted(self.index.candidates(f.phones, member['bands'], member['area'],
+                                                  member['folded_bands'], member['unaccented'])):
+                cluster_id = self.members[j]['cluster']
+                if cluster_id in tried:
+                    continue
+                tried.add(cluster_id)
+                group = self.clusters[cluster_id]['members']
+                if is_duplicate_features(self.features(group[0]), f) and \
+                        not any(member_conflict(self.features(m), f, is_duplicate_features) for m in group):
+                    target = cluster_id
+                    break
+
+            i = len(self.members)
+            self._features[i] = f
+            if target is None:
+                target = self.next_id
+                self.next_id += 1
+                self.clusters[target] = {'members': [], 'isRescued': False}
+                added.add(target)
+
+            member['cluster'] = target
+            self.members.append(member)
+            self.clusters[target]['members'].append(i)
+            self.index.add(i, f.phones, member['bands'], member['area'],
+                           member['folded_bands'], member['unaccented'])
+            touched.add(target)
+
+        return {
+            'added': [self.case(c) for c in sorted(added)],
+            'updated': [self.case(c) for c in sorted(touched - added)],
+            'merged': [],
+        }
+
+    def case(self, cluster_id):
+        """Dựng case đầu ra của cụm (cùng quy tắc gộp với merge_duplicates)"""
+        cluster = self.clusters[cluster_id]
+        members = [self.members[i] for i in cluster['members']]
+        best = min(members, key=lambda m: PRIORITY_ORDER.get(m['priority'], 99))
+        all_phones = set()
+        for m in members:
+            all_phones.update(m['phones'])
+        return {
+            "id": cluster_id,
+            "content": max(members, key=lambda m: len(m['content']))['content'],
+            "phones": sorted(all_phones),
+            "area": best['area'],
+            "priority": best['priority'],
+            "isRescued": cluster['isRescued'],
+        }
+
+    def cases(self):
+        return [self.case(c) for c in sorted(self.clusters)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse tăng dần: chỉ xử lý các dòng mới của file intake")
+    parser.add_argument('input', nargs='?', default='pdf_content.txt')
+    parser.add_argument('--state', default='parse_state.json', help="File lưu trạng thái giữa các lần chạy")
+    parser.add_argument('--output', default='rescue-app/src/data.json')
+    parser.add_argument('--delta', default='parse_delta.json', help="File ghi delta của lần chạy này")
+    args = parser.parse_args()
+
+    inc = IncrementalParser.load(args.state)
+    before = len(inc.clusters)
+
+    # Đọc từng dòng (text hoặc PDF theo trang), không cần giữ cả file trong bộ nhớ
+    delta = inc.process(read_input_lines(args.input))
+
+    print(f"🆕 Added: {len(delta['added'])} | ✏️ Updated: {len(delta['updated'])} | 🔗 Merged: {len(delta['merged'])}")
+    print(f"✅ Cases: {before} -> {len(inc.clusters)}")
+
+    inc.save(args.state)
+    atomic_write(args.delta, json.dumps(delta, ensure_ascii=False, indent=2).encode('utf-8'))
+    atomic_write(args.output, json.dumps(inc.cases(), ensure_ascii=False, indent=2).encode('utf-8'))
+    print(f"💾 Saved to {args.output} (delta: {args.delta})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+import re
+import json
+import heapq
+import argparse
+
+from .changes import atomic_write, content_id
+from .formats import read_cases
+from .gazetteer import AREA_KEYWORDS
+from .normalize import fold
+
+MINER_VERSION = 1
+KEYWORDS_VERSION = 1
+DEFAULT_CAPACITY = 5000
+MAX_N = 4
+# Cụm con bị gộp vào cụm dài hơn chứa nó nếu cụm dài chiếm >= tỉ lệ này số lần gặp
+SUBSUME_RATIO = 0.8
+
+# Dãy từ chữ cái liền nhau: dấu câu, số cắt cụm (tên địa danh không vắt qua "," hay số nhà)
+SEGMENT = re.compile(r'[^\W\d_]+(?:[^\S\n]+[^\W\d_]+)*')
+
+# Từ không đứng đầu / cuối tên địa danh (đã gấp dấu); tên vẫn có thể chứa chúng ở giữa.
+# Tiền tố hành chính, nhãn cột: loại cả khi viết hoa ("Thôn Xuân Sơn" -> "Xuân Sơn")
+PREFIXES = set('''
+    thon xa phuong duong hem khu kv so ap huyen tinh tp khan uu thuong sdt
+'''.split())
+# Từ thường gặp trong tin nhắn: chỉ loại khi viết thường, vì gấp dấu rồi dễ trùng âm tiết
+# của tên riêng (nam / Nam, be / Bè, con / Cồn, dien / Diên)
+STOPWORDS = set('''
+    to quan vuc p x q dt ql cap tien cao nhieu
+    gan doi dien sau truoc canh trong ngoai tren duoi ben cuoi dau ngay phia qua toi den tu o va voi cua
+    nha nguoi gia tre em be con chau me ba ong co chu anh chi vo chong dinh ho
+    can cuu giup gap dang bi ket ngap nuoc len mai lut lien lac mat khong chua ro the
+    cu moi ca cac nhung mot hai bon nam bay tam chin muoi
+'''.split())
+
+
+class SpaceSaving:
+    """
+    Heavy hitters bộ nhớ cố định (Space-Saving, Metwally và cộng sự): giữ tối đa
+    capacity khóa; khóa mới khi đầy thay khóa nhỏ nhất và thừa hưởng số đếm của nó
+    (ghi vào error). Mọi khóa xuất hiện > N / capacity lần chắc chắn được giữ,
+    số đếm thật nằm trong [count - error, count].
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.counts = {}  # khóa -> [count, error]
+        # Min-heap (count, khóa), mỗi khóa đúng 1 phần tử; count cũ được sửa lúc lấy min
+        self._heap = []
+
+    def __len__(self):
+        return len(self.counts)
+
+    def add(self, key, weight=1):
+        """Tăng số đếm của key; trả về khóa bị đẩy ra (None nếu không có)"""
+        entry = self.counts.get(key)
+        if entry is not None:
+            entry[0] += weight
+            return None
+        evicted, floor = None, 0
+        if len(self.counts) >= self.capacity:
+            evicted, floor = self._pop_min()
+        self.counts[key] = [floor + weight, floor]
+        heapq.heappush(self._heap, (floor + weight, key))
+        return evicted
+
+    def _pop_min(self):
+        while True:
+            count, key = heapq.heappop(self._heap)
+            current = self.counts[key][0]
+            if current != count:
+                heapq.heappush(self._heap, (current, key))
+                continue
+            del self.counts[key]
+            return key, count
+
+    def to_json(self):
+        return {'capacity': self.capacity, 'items': [[k, c, e] for k, (c, e) in self.counts.items()]}
+
+    @classmethod
+    def from_json(cls, data):
+        sketch = cls(data['capacity'])
+        sketch.counts = {k: [c, e] for k, c, e in data['items']}
+        sketch._heap = [(c, k) for k, (c, _) in sketch.counts.items()]
+        heapq.heapify(sketch._heap)
+        return sketch
+
+
+def _runs(text):
+    """Các dãy từ liền nhau trong text; chỗ pdf-parse dán 2 ô ("Vĩnh ThạnhHẻm") cũng cắt cụm"""
+    for segment in SEGMENT.findall(text):
+        run = []
+        for word in segment.split():
+            start = 0
+            for i in range(1, len(word)):
+                if word[i].isupper() and word[i - 1].islower():
+                    run.append(word[start:i])
+                    yield run
+                    run = []
+                    start = i
+            run.append(word[start:])
+        yield run
+
+
+def phrases(text, max_n=MAX_N):
+    """
+    Các cụm 1..max_n từ có thể là tên địa danh: (khóa không dấu, dạng gốc, viết hoa?).
+    Viết hoa = mọi từ viết hoa chữ đầu (dấu hiệu tên riêng).
+    """
+    for run in _runs(text):
+        folded = [fold(word) for word in run]
+        stop = [f in PREFIXES or (w[0].islower() and f in STOPWORDS) for w, f in zip(run, folded)]
+        for i in range(len(run)):
+            if stop[i]:
+                continue
+            for n in range(1, min(max_n, len(run) - i) + 1):
+                if stop[i + n - 1]:
+                    continue
+                words = run[i:i + n]
+                yield ' '.join(folded[i:i + n]), ' '.join(words), all(w[0].isupper() for w in words)
+
+
+class PhraseMiner:
+    """
+    Đếm dần cụm từ trong các case chưa xác định được khu vực ('Khác') để gợi ý
+    từ khóa mới cho gazetteer. Số đếm là số case chứa cụm (mỗi case tính 1 lần),
+    giữ trong SpaceSaving nên bộ nhớ cố định dù chạy qua bao nhiêu dữ liệu.
+    Case đã đếm (theo content_id) được bỏ qua, nên có thể nạp lại state và
+    chạy tiếp trên file mới / file đã cập nhật.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, max_n=MAX_N, known=AREA_KEYWORDS):
+        self.sketch = SpaceSaving(capacity)
+        self.max_n = max_n
+        # Khóa đang theo dõi -> [số case viết hoa, dạng gốc viết hoa gần nhất]
+        self.info = {}
+        self.seen = set()
+        self.known = {fold(keyword) for keyword in known}
+
+    def add_text(self, text):
+        found = {}
+        for key, surface, capitalized in phrases(text, self.max_n):
+            if key not in found or capitalized and not found[key][1]:
+                found[key] = (surface, capitalized)
+        for key, (surface, capitalized) in found.items():
+            evicted = self.sketch.add(key)
+            if evicted is not None:
+                del self.info[evicted]
+            info = self.info.setdefault(key, [0, surface])
+            if capitalized:
+                info[0] += 1
+                info[1] = surface
+
+    def add_case(self, case):
+        """Đếm 1 case 'Khác' chưa gặp; trả về True nếu được đếm"""
+        if case['area'] != 'Khác':
+            return False
+        case_id = content_id(case)
+        if case_id in self.seen:
+            return False
+        self.seen.add(case_id)
+        self.add_text(case.get('original_content') or case['content'])
+        return True
+
+    def candidates(self, min_count=2, min_words=2, min_capitalized=0.5, top=None):
+        """
+        Cụm gợi ý, xếp theo số case chắc chắn giảm dần: đủ min_count case chắc chắn (count - error),
+        >= min_words từ, tỉ lệ viết hoa >= min_capitalized, chưa có trong từ khóa.
+        Cụm con nằm trong cụm dài hơn gần như luôn đi cùng nhau thì bỏ ("Cây Sung" < "Gò Cây Sung").
+        """
+        found = {}
+        for key, (count, error) in self.sketch.counts.items():
+            capitalized, surface = self.info[key]
+            if count - error < min_count or key in self.known or key.count(' ') + 1 < min_words:
+                continue
+            # Số lần viết hoa chỉ đếm từ lúc cụm được theo dõi nên so với phần chắc chắn
+            if capitalized < min_capitalized * (count - error):
+                continue
+            found[key] = {'keyword': surface, 'count': count, 'error': error, 'capitalized': capitalized}
+
+        # Cụm dài hơn có thể là từ khóa đã có: "Đình Của" nằm trong "Lương Đình Của"
+        subsumed = set()
+        for key, (count, _) in self.sketch.counts.items():
+            if key not in found and key not in self.known:
+                continue
+            words = key.split()
+            for n in range(1, len(words)):
+                for i in range(len(words) - n + 1):
+                    sub = ' '.join(words[i:i + n])
+                    if sub in found and count >= SUBSUME_RATIO * found[sub]['count']:
+                        subsumed.add(sub)
+        result = sorted((item for key, item in found.items() if key not in subsumed),
+                        key=lambda item: (item['error'] - item['count'], -item['count'], item['keyword']))
+        return result[:top] if top else result
+
+    def to_json(self):
+        return {
+            'version': MINER_VERSION,
+            'max_n': self.max_n,
+            'sketch': self.sketch.to_json(),
+            'info': self.info,
+            'seen': sorted(self.seen),
+        }
+
+    def save(self, path):
+        atomic_write(path, json.dumps(self.to_json(), ensure_ascii=False).encode('utf-8'))
+
+    @classmethod
+    def load(cls, path, known=AREA_KEYWORDS):
+        """State đã lưu; None nếu khác phiên bản (đếm lại từ đầu)"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != MINER_VERSION:
+            return None
+        miner = cls(data['sketch']['capacity'], data['max_n'], known)
+        miner.sketch = SpaceSaving.from_json(data['sketch'])
+        miner.info = data['info']
+        miner.seen = set(data['seen'])
+        return miner
+
+
+def write_keywords(candidates, path):
+    """
+    File từ khóa gợi ý, nạp thẳng được bằng gazetteer.load_keywords (--area-keywords):
+    keywords = {từ khóa: khu vực} (mặc định khu vực = chính tên đó, sửa tay nếu cần),
+    candidates giữ số liệu để người duyệt xem.
+    """
+    data = {
+        'version': KEYWORDS_VERSION,
+        'keywords': {item['keyword']: item['keyword'] for item in candidates},
+        'candidates': candidates,
+    }
+    atomic_write(path, json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gợi ý từ khóa khu vực mới từ các case 'Khác' (đếm cụm từ theo luồng)")
+    parser.add_argument('inputs', nargs='*', default=['rescue-app/src/data.json'],
+                        help="File case (json / jsonl / columnar...), đọc lần lượt")
+    parser.add_argument('--state', metavar='FILE', help="State của bộ đếm: nạp nếu có, ghi lại sau khi chạy")
+    parser.add_argument('--capacity', type=int, default=DEFAULT_CAPACITY, help="Số cụm tối đa được theo dõi")
+    parser.add_argument('--min-count', type=int, default=2)
+    parser.add_argument('--min-words', type=int, default=2)
+    parser.add_argument('--top', type=int, default=30)
+    parser.add_argument('--output', metavar='FILE', help="Ghi từ khóa gợi ý (dùng với rescue-parse --area-keywords)")
+    args = parser.parse_args()
+
+    miner = None
+    if args.state:
+        try:
+            miner = PhraseMiner.load(args.state)
+        except FileNotFoundError:
+            pass
+    if miner is None:
+        miner = PhraseMiner(args.capacity)
+
+    added = 0
+    for path in args.inputs:
+        for case in read_cases(path):
+            added += miner.add_case(case)
+    print(f"⛏️ Đếm thêm {added} case 'Khác' (tổng {len(miner.seen)}), theo dõi {len(miner.sketch)} cụm")
+
+    candidates = miner.candidates(args.min_count, args.min_words, top=args.top)
+    for item in candidates:
+        print(f"  {item['count']:>4} (±{item['error']}) {item['keyword']}")
+    if args.output:
+        write_keywords(candidates, args.output)
+        print(f"\n💾 {args.output}")
+    if args.state:
+        miner.save(args.state)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import string
+import unicodedata
+from functools import lru_cache
+
+# Dải chữ Latin có dấu (Latin-1, Extended-A/B, Latin Extended Additional chứa ạ ả ấ ầ ...)
+_LATIN_RANGES = [(0x00C0, 0x0250), (0x1E00, 0x1F00)]
+# Dấu rời còn sót sau NFC (không ghép được vào chữ trước): bỏ đi
+_COMBINING = (0x0300, 0x0370)
+_PUNCTUATION = string.punctuation + '–—‘’“”…°•·'
+
+
+def _build_fold_table():
+    """Bảng str.translate: chữ có dấu -> chữ thường không dấu, đ/Đ -> d, hoa -> thường, dấu câu -> ' '"""
+    table = {}
+    for lo, hi in _LATIN_RANGES:
+        for code in range(lo, hi):
+            decomposed = unicodedata.normalize('NFD', chr(code))
+            base = ''.join(ch for ch in decomposed if not unicodedata.combining(ch)).lower()
+            if len(base) == 1 and base.isascii() and base.isalpha():
+                table[code] = base
+    for code in range(*_COMBINING):
+        table[code] = None
+    table[ord('đ')] = table[ord('Đ')] = 'd'
+    for ch in string.ascii_uppercase:
+        table[ord(ch)] = ch.lower()
+    for ch in _PUNCTUATION:
+        table[ord(ch)] = ' '
+    return table
+
+
+FOLD_TABLE = _build_fold_table()
+
+
+def fold_chars(text):
+    """
+    Gấp dấu từng ký tự, giữ nguyên độ dài với bản NFC của text (vị trí khớp trên text
+    đã gấp dùng được cho unicodedata.normalize('NFC', text)). 'Diên Phú, 23/10' -> 'dien phu  23 10'
+    """
+    return unicodedata.normalize('NFC', text).translate(FOLD_TABLE)
+
+
+@lru_cache(maxsize=65536)
+def fold(text):
+    """
+    Khóa so khớp không dấu: gấp dấu + gộp khoảng trắng, 1 lượt translate ở tầng C.
+    'Diên Phú', 'dien phu', 'DIEN  PHÚ' -> 'dien phu'. Có cache LRU cho chuỗi lặp lại.
+    """
+    return ' '.join(unicodedata.normalize('NFC', text).translate(FOLD_TABLE).split())
+
+
+def fold_batch(texts):
+    """
+    fold cho nhiều chuỗi, không qua cache LRU (lô lớn chuỗi ít lặp lại). Gấp từng chuỗi:
+    ghép cả lô bằng 1 ký tự phân cách sẽ vỡ khi chính text chứa ký tự đó
+    """
+    return [' '.join(unicodedata.normalize('NFC', text).translate(FOLD_TABLE).split()) for text in texts]
@@ -0,0 +1,54 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+DEFAULT_CHUNK_SIZE = 5000
+# Số chunk đã gửi nhưng chưa trả kết quả, tính trên mỗi worker: đủ để worker không
+# phải chờ, mà chỉ giữ trong bộ nhớ vài chunk chứ không phải cả input
+CHUNKS_IN_FLIGHT = 2
+
+
+def _parse_chunk(args):
+    func, chunk = args
+    return [func(line) for line in chunk]
+
+
+def _chunks(lines, chunk_size):
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parse_lines(func, lines, workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Áp dụng hàm parse từng dòng (func phải ở cấp module để pickle được) cho mọi dòng.
+    Là generator: lines có thể là 1 stream (VD: đọc PDF theo trang), kết quả ra dần.
+    workers > 1: chia input thành các chunk liên tiếp và chạy trên ProcessPoolExecutor,
+    đọc chunk tiếp theo chỉ khi hàng đợi (CHUNKS_IN_FLIGHT * workers chunk) còn chỗ.
+    Kết quả luôn giữ đúng thứ tự dòng đầu vào, nên id gán sau đó là tất định.
+    """
+    if workers <= 1:
+        for line in lines:
+            yield func(line)
+        return
+
+    chunks = _chunks(iter(lines), chunk_size)
+    first = next(chunks, None)
+    second = next(chunks, None)
+    if second is None:
+        # Ít dòng: chi phí khởi tạo process lớn hơn lợi ích
+        if first:
+            yield from _parse_chunk((func, first))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Future theo đúng thứ tự chunk, lấy kết quả từ đầu hàng đợi
+        pending = deque(executor.submit(_parse_chunk, (func, chunk)) for chunk in (first, second))
+        for chunk in chunks:
+            if len(pending) >= CHUNKS_IN_FLIGHT * workers:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_parse_chunk, (func, chunk)))
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,79 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # pypdf là phụ thuộc tùy chọn, chỉ cần khi đọc thẳng file PDF
+    PdfReader = None
+
+DEFAULT_PDF = 'mở quyền sửa đổi - HOÀN THIỆN - KV.pdf'
+
+# Reader của từng worker process, mở 1 lần trong initializer
+_worker_reader = None
+
+
+def _open_reader(path):
+    if PdfReader is None:
+        raise ImportError("Cần cài pypdf để đọc PDF trực tiếp: pip install pypdf")
+    return PdfReader(path)
+
+
+def _init_worker(path):
+    global _worker_reader
+    _worker_reader = _open_reader(path)
+
+
+def _extract_page(page_no):
+    return _worker_reader.pages[page_no].extract_text()
+
+
+def iter_page_texts(path, workers=1):
+    """
+    Sinh text của từng trang theo đúng thứ tự trang.
+    workers > 1: các trang được trích song song, mỗi process tự mở PDF 1 lần;
+    trang đầu được trả về ngay khi xong, không chờ cả tài liệu.
+    """
+    reader = _open_reader(path)
+    if workers <= 1 or len(reader.pages) <= 1:
+        for page in reader.pages:
+            yield page.extract_text()
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(path,)) as executor:
+        yield from executor.map(_extract_page, range(len(reader.pages)))
+
+
+def iter_rows(path, workers=1):
+    """Sinh từng dòng (không rỗng) của bảng trong PDF, theo thứ tự trang"""
+    for text in iter_page_texts(path, workers):
+        for line in text.splitlines():
+            if line.strip():
+                yield line
+
+
+def read_input_lines(input_file, workers=1):
+    """Nguồn dòng cho parser: file .pdf đọc trực tiếp (stream theo trang), còn lại đọc như file text"""
+    if input_file.lower().endswith('.pdf'):
+        yield from iter_rows(input_file, workers)
+        return
+    with open(input_file, 'r', encoding='utf-8') as f:
+        yield from f
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Trích text từ PDF bằng Python (thay cho extract_pdf.js)")
+    parser.add_argument('pdf', nargs='?', default=DEFAULT_PDF)
+    parser.add_argument('--output', default='pdf_content.txt', help="File text cho các script cũ")
+    parser.add_argument('--workers', type=int, default=1, help="Số process trích trang song song")
+    args = parser.parse_args()
+
+    count = 0
+    with open(args.output, 'w', encoding='utf-8') as f:
+        for line in iter_rows(args.pdf, args.workers):
+            f.write(line + '\n')
+            count += 1
+    print(f"✅ Done: {count} dòng -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import re
+
+# Đầu số di động 10 chữ số hiện hành theo nhà mạng
+CARRIER_PREFIXES = {
+    'Viettel': ['032', '033', '034', '035', '036', '037', '038', '039', '086', '096', '097', '098'],
+    'Mobifone': ['070', '076', '077', '078', '079', '089', '090', '093'],
+    'Vinaphone': ['081', '082', '083', '084', '085', '088', '091', '094'],
+    'Vietnamobile': ['052', '056', '058', '092'],
+    'Gmobile': ['059', '099'],
+    'Itelecom': ['087'],
+    'Reddi': ['055'],
+}
+
+# Đầu số 11 chữ số cũ -> đầu số 10 chữ số (chuyển đổi năm 2018)
+OLD_PREFIXES = {
+    '0162': '032', '0163': '033', '0164': '034', '0165': '035', '0166': '036', '0167': '037',
+    '0168': '038', '0169': '039',
+    '0120': '070', '0121': '079', '0122': '077', '0126': '076', '0128': '078',
+    '0123': '083', '0124': '084', '0125': '085', '0127': '081', '0129': '082',
+    '0186': '056', '0188': '058', '0199': '059',
+}
+
+# Tra đầu số -> nhà mạng (dựng 1 lần)
+MOBILE_PREFIXES = {prefix: carrier for carrier, prefixes in CARRIER_PREFIXES.items() for prefix in prefixes}
+
+# Một dãy số đủ dài để chứa SĐT: các nhóm chữ số cách nhau bởi khoảng trắng / dấu chấm /
+# gạch ngang (VD "0935956607. 0347290079"), có thể mở đầu bằng +84.
+# Dãy ngắn (số nhà, số người...) bị loại ngay trong regex.
+NUMBER_RUN = re.compile(r'\+?\d[\d .\-]{7,}\d')
+DIGIT_GROUP = re.compile(r'\d+')
+
+MAX_DIGITS = 12
+
+
+def normalize_number(digits):
+    """
+    Chuỗi chữ số -> SĐT chuẩn (10 số di động / 11 số cố định 02x), None nếu không hợp lệ.
+    Sửa: 84xxx -> 0xxx, 9 số mất số 0 đầu (ô số của bảng tính) -> thêm 0,
+    đầu số 11 chữ số cũ -> đầu số mới.
+    """
+    if digits.startswith('84') and len(digits) in (11, 12):
+        digits = '0' + digits[2:]
+    elif len(digits) == 9 and digits[0] != '0':
+        digits = '0' + digits
+    if len(digits) == 11 and digits[:4] in OLD_PREFIXES:
+        digits = OLD_PREFIXES[digits[:4]] + digits[4:]
+    if len(digits) == 10 and digits[:3] in MOBILE_PREFIXES:
+        return digits
+    if len(digits) == 11 and digits.startswith('02'):
+        return digits
+    return None
+
+
+def carrier(phone):
+    """Nhà mạng của SĐT đã chuẩn hóa ('Cố định' cho số 02x, None nếu không rõ)"""
+    if len(phone) == 11 and phone.startswith('02'):
+        return 'Cố định'
+    return MOBILE_PREFIXES.get(phone[:3])
+
+
+def _is_float_suffix(text, groups, j):
+    """Nhóm j có đuôi ".0" của số dạng float (905006857.0) ngay sau không"""
+    return j + 1 < len(groups) and groups[j + 1][2] == '0' and text[groups[j][1]:groups[j + 1][0]] == '.'
+
+
+def _phone_at(text, groups, i):
+    """
+    SĐT ngắn nhất ghép từ các nhóm bắt đầu ở nhóm i: (SĐT, số chữ số bỏ ở đầu nhóm i,
+    chỉ số nhóm cuối) hoặc None. Nhóm dài hơn 1 SĐT mà không hợp lệ thì thử các chữ số
+    cuối (SĐT dán liền số nhà / số tầng, VD "đường 23/100977342357"); số float đã mất
+    số 0 đầu nên thử 9 chữ số cuối trước. Số cố định 2xx dạng float (2583850310.0)
+    được thêm số 0 (chỉ với float, để không nhầm toạ độ 12.2588486).
+    """
+    first = groups[i][2]
+    if len(first) == 10 and first[0] == '2' and _is_float_suffix(text, groups, i):
+        return '0' + first, 0, i
+    if len(first) > 10 and normalize_number(first) is None:
+        for size in ((9, 10) if _is_float_suffix(text, groups, i) else (10,)):
+            phone = normalize_number(first[-size:])
+            if phone is not None:
+                return phone, len(first) - size, i
+        return None
+    digits = ''
+    for j in range(i, len(groups)):
+        digits += groups[j][2]
+        if len(digits) > MAX_DIGITS:
+            return None
+        phone = normalize_number(digits)
+        if phone is not None:
+            return phone, 0, j
+    return None
+
+
+def scan_phones(text):
+    """
+    Duyệt text 1 lượt, trả về [(start, end, SĐT chuẩn)].
+    Trong mỗi dãy số, ghép các nhóm liền nhau ngắn nhất thành 1 SĐT hợp lệ;
+    nhóm không thuộc SĐT nào (số nhà, số người...) được giữ lại trong text.
+    Đuôi ".0" của số dạng float (905006857.0) được tính vào span của SĐT.
+    """
+    found = []
+    for run in NUMBER_RUN.finditer(text):
+        groups = [(m.start(), m.end(), m.group()) for m in DIGIT_GROUP.finditer(text, run.start(), run.end())]
+        i = 0
+        while i < len(groups):
+            match = _phone_at(text, groups, i)
+            if match is None:
+                i += 1
+                continue
+            phone, skip, j = match
+            start, end = groups[i][0] + skip, groups[j][1]
+            if i == 0 and not skip and run.group().startswith('+'):
+                start -= 1
+            if _is_float_suffix(text, groups, j):
+                j += 1
+                end = groups[j][1]
+            found.append((start, end, phone))
+            i = j + 1
+    return found
+
+
+def tokenize(text):
+    """
+    Tách SĐT khỏi text trong cùng 1 lượt: ([SĐT chuẩn, không trùng, theo thứ tự], text còn lại).
+    Text còn lại là text gốc bỏ các span SĐT (không chuẩn hóa khoảng trắng).
+    """
+    phones = []
+    parts = []
+    last = 0
+    for start, end, phone in scan_phones(text):
+        parts.append(text[last:start])
+        last = end
+        if phone not in phones:
+            phones.append(phone)
+    parts.append(text[last:])
+    return phones, ''.join(parts)
@@ -0,0 +1,172 @@
+from . import full, strict
+from .changes import stable_group_ids
+from .dedup_index import find_duplicate_groups
+from .formats import write_cases
+from .parallel import parse_lines
+from .pdf_extract import read_input_lines
+from .priority import SITUATION_CLASSIFIER
+from .profiling import stage_of
+from .rows import reconstruct_rows
+from .similarity import DEFAULT_BACKEND
+
+# Chiến lược địa chỉ: module (hoặc object) có parse_line, parse_row, case_features,
+# is_duplicate_features, new_index, merge_group và ADDRESS_THRESHOLD
+STRATEGIES = {
+    'full': full,
+    'strict': strict,
+}
+
+DEFAULT_OUTPUT = 'rescue-app/src/data.json'
+
+
+def extract(input_file, workers=1, rows=False):
+    """
+    Stage 1: nguồn dữ liệu. Sinh từng dòng (text hoặc PDF theo trang), hoặc
+    từng bản ghi đã ghép dòng tràn + tách cột nếu rows=True (chỉ với text pdf-parse:
+    pypdf tách ô bằng dấu cách nên rows.split_row không tách được cột).
+    """
+    if rows and input_file.lower().endswith('.pdf'):
+        raise ValueError("rows=True cần pdf_content.txt (pdf-parse), không đọc thẳng file .pdf")
+    lines = read_input_lines(input_file, workers=workers)
+    return reconstruct_rows(lines) if rows else lines
+
+
+def parse(items, strategy, workers=1, rows=False):
+    """Stage 2: parse theo chiến lược (song song theo chunk nếu workers > 1), gán id theo thứ tự"""
+    func = strategy.parse_row if rows else strategy.parse_line
+    cases = []
+    for case in parse_lines(func, items, workers=workers):
+        if case is None:
+            continue
+        cases.append({"id": len(cases) + 1, **case})
+    return cases
+
+
+def resolve_areas(cases, gazetteer):
+    """
+    Stage 2b (tùy chọn): tra thêm các case 'Khác' trong gazetteer bổ sung
+    (--area-keywords), trước dedup vì dedup chặn theo area
+    """
+    for case in cases:
+        if case['area'] == 'Khác':
+            case['area'] = gazetteer.lookup(case['content'])
+    return cases
+
+
+def classify_situation(cases):
+    """
+    Stage 3 (tùy chọn): đánh giá lại priority theo tình hình trong content
+    thay vì cột Mức độ ưu tiên. Không khớp luật nào: có SĐT -> MEDIUM, không -> LOW.
+    """
+    for case in cases:
+        priority, _ = SITUATION_CLASSIFIER.classify(case['content'])
+        if priority is None:
+            priority = 'MEDIUM' if case['phones'] else 'LOW'
+        case['priority'] = priority
+    return cases
+
+
+def dedup(cases, strategy, address_threshold=None, backend=DEFAULT_BACKEND, profiler=None,
+          ids='sequential', members=None):
+    """
+    Stage 4: gộp các case trùng (blocking index + union-find) rồi đánh lại id.
+    ids='sequential': 1..N theo thứ tự; ids='stable': id suy ra từ nội dung
+    (changes.stable_group_ids), khi đó members (dict) nhận id -> id các thành viên.
+    Có profiler: đếm số cặp chỉ mục đề xuất / được chấm điểm / bị chỉ mục loại / bị gộp.
+    """
+    if address_threshold is None:
+        address_threshold = strategy.ADDRESS_THRESHOLD
+
+    def is_duplicate(f1, f2):
+        return strategy.is_duplicate_features(f1, f2, address_threshold, backend)
+
+    if profiler:
+        block_sizes = {}
+        for c in cases:
+            block_sizes[c['area']] = block_sizes.get(c['area'], 0) + 1
+        possible = sum(k * (k - 1) // 2 for k in block_sizes.values())
+        profiler.count('dedup.pairs_possible', possible)
+        is_duplicate = profiler.counted('dedup.pairs_scored', is_duplicate, hits='dedup.pairs_merged')
+
+    # Chỉ chấm điểm các cặp chung bucket SĐT / MinHash-LSH trong cùng Area
+    stats = {} if profiler else None
+    groups = find_duplicate_groups(
+        cases,
+        strategy.case_features,
+        is_duplicate,
+        block_of=lambda c: c['area'],
+        index=strategy.new_index(),
+        stats=stats,
+    )
+    if profiler:
+        # Bị loại = cặp cùng Area mà chỉ mục không đề xuất; cặp được đề xuất nhưng không
+        # chấm (cùng cụm đã thử / đã vào cụm) không tính là bị loại
+        proposed = stats.get('proposed', 0)
+        profiler.count('dedup.pairs_proposed', proposed)
+        profiler.count('dedup.pairs_pruned', possible - proposed)
+    groups = [[cases[i] for i in group] for group in groups]
+    if ids == 'stable':
+        # Tính id trước khi merge_group sửa case đại diện
+        group_ids = stable_group_ids(groups)
+    unique_cases = [strategy.merge_group(group) for group in groups]
+    if ids == 'stable':
+        for case, (group_id, member_ids) in zip(unique_cases, group_ids):
+            case['id'] = group_id
+            if members is not None:
+                members[group_id] = member_ids
+    else:
+        for i, case in enumerate(unique_cases, 1):
+            case['id'] = i
+    return unique_cases
+
+
+def geocode(cases, geocoder):
+    """Stage 4b (tùy chọn): gắn toạ độ offline cho từng case (xem geocode.py)"""
+    return geocoder.geocode(cases)
+
+
+def export(cases, output=DEFAULT_OUTPUT, formats=('pretty',)):
+    """
+    Stage 5: ghi JSON cho rescue-app (ghi atomic: file tạm + rename). Ngoài data.json
+    (pretty) có thể ghi kèm compact / columnar / jsonl cạnh đó (xem formats.py).
+    Trả về các file đã ghi.
+    """
+    return [write_cases(cases, output, fmt) for fmt in formats]
+
+
+def run(input_file, strategy='full', workers=1, rows=False, priority='column',
+        address_threshold=None, backend=DEFAULT_BACKEND, profiler=None, ids='sequential', members=None,
+        geocoder=None, areas=None):
+    """
+    Chạy extract -> parse -> classify -> dedup, không ghi file.
+    Trả về (các case sau lọc trùng, số case trước lọc trùng).
+    Có profiler: đo từng stage; extract được đọc hết trước để tách thời gian với parse.
+    ids / members: xem dedup. geocoder: Geocoder để gắn toạ độ, None = bỏ qua.
+    areas: Gazetteer từ khóa bổ sung cho case 'Khác', None = bỏ qua.
+    """
+    if isinstance(strategy, str):
+        strategy = STRATEGIES[strategy]
+    with stage_of(profiler, 'extract'):
+        items = extract(input_file, workers=workers, rows=rows)
+        if profiler:
+            items = list(items)
+            profiler.count('extract.items', len(items))
+    with stage_of(profiler, 'parse'):
+        cases = parse(items, strategy, workers=workers, rows=rows)
+    raw_count = len(cases)
+    if profiler:
+        profiler.count('parse.cases', raw_count)
+    if areas is not None:
+        with stage_of(profiler, 'areas'):
+            resolve_areas(cases, areas)
+    if priority == 'situation':
+        with stage_of(profiler, 'classify'):
+            classify_situation(cases)
+    with stage_of(profiler, 'dedup'):
+        unique_cases = dedup(cases, strategy, address_threshold, backend, profiler, ids, members)
+    if profiler:
+        profiler.count('dedup.unique_cases', len(unique_cases))
+    if geocoder is not None:
+        with stage_of(profiler, 'geocode'):
+            geocode(unique_cases, geocoder)
+    return unique_cases, raw_count
@@ -0,0 +1,116 @@
+import re
+
+# Mỗi tầng: (priority, danh sách luật). Luật là từ khóa (so khớp nguyên văn, chữ thường)
+# hoặc tuple (tên luật, regex). Tầng đứng trước thắng.
+
+# Bảng từ khóa của parse_final (cột Mức độ ưu tiên + từ khóa trong câu)
+FINAL_RULES = [
+    ('CRITICAL', ['khẩn cấp', 'nguy kịch', 'sắp đẻ', 'vỡ ối', 'tai biến']),
+    ('HIGH', ['ưu tiên cao', 'người già', 'trẻ em', 'trẻ nhỏ', 'bà bầu', 'mang thai']),
+    ('MEDIUM', ['thường']),
+]
+
+# Bảng rút gọn của parse_strict
+STRICT_RULES = [
+    ('CRITICAL', ['khẩn cấp', 'nguy kịch', 'sắp đẻ', 'vỡ ối', 'tai biến']),
+    ('HIGH', ['ưu tiên cao', 'người già', 'trẻ em', 'bà bầu']),
+]
+
+# Đánh giá theo tình hình thực tế (rescue-parse --priority situation)
+SITUATION_RULES = [
+    ('CRITICAL', [
+        'lên mái', 'trên mái', 'leo mái', 'qua đầu', 'gần lút', 'gần mái',
+        'lút nó',
+        'mất liên lạc', 'pin hết', 'gần hết pin',
+        'bệnh nặng', 'tai biến', 'chạy thận', 'không đi lại',
+        'bà bầu', 'mới đẻ', 'sơ sinh',
+        'em bé', 'bé nhỏ', 'con nít', 'trẻ nhỏ', 'cháu nhỏ',
+        'khẩn cấp', 'khẩn thiết', 'gấp',
+        # Mực nước 2-4m
+        ('nước 2-4m', r'nước.{0,30}(?:2|3|4) ?m'),
+    ]),
+    ('HIGH', [
+        'người già', 'lớn tuổi', '70t', '80t', '90t', '97 tuổi',
+        'trẻ em', '1t', '2t', '3t', '4t', '5t',
+        'nước dâng', 'ngập sâu', 'ngang ngực', 'tới ngực',
+        'thiếu lương thực', 'thiếu nước', 'hết đồ ăn',
+        # Từ 5 người trở lên
+        ('>= 5 người', r'(?<!\d)(?:[5-9]|[1-9]\d+)\s*(?:người|em|đứa|con)'),
+    ]),
+]
+
+
+# Tầng có không quá ngần này từ khóa được so bằng `in` từng từ (nhanh hơn chạy regex
+# trên cả dòng, xem bench_priority.py); tầng dài hơn mới gộp thành regex trie
+MAX_SUBSTRING_KEYWORDS = 8
+
+
+def _trie_regex(words):
+    """
+    Gộp các từ khóa thành regex dạng trie (tiền tố chung được gộp lại).
+    re của Python khớp alternation dạng trie nhanh hơn hẳn danh sách phẳng.
+    """
+    root = {}
+    for word in words:
+        node = root
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = None
+
+    def build(node):
+        alts = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ''
+        body = alts[0] if len(alts) == 1 else '(?:' + '|'.join(alts) + ')'
+        # Từ khóa kết thúc tại đây nhưng vẫn còn nhánh dài hơn -> nhánh tùy chọn (tham lam)
+        return '(?:' + body + ')?' if '' in node else body
+
+    return build(root)
+
+
+class PriorityClassifier:
+    """
+    Phân loại mức độ ưu tiên: tầng ít từ khóa so từng từ bằng `in`, tầng nhiều từ khóa
+    được biên dịch 1 lần thành 1 regex alternation dạng trie; luật regex riêng được
+    compile sẵn và chỉ chạy khi không từ khóa nào của tầng khớp.
+    Trả về (priority, luật khớp) để giải thích.
+    """
+
+    def __init__(self, tiers, default='MEDIUM'):
+        self.default = default
+        self._tiers = []
+        for priority, rules in tiers:
+            keywords = [r.lower() for r in rules if isinstance(r, str)]
+            # Luật regex để riêng: gộp chung alternation sẽ làm mất tối ưu tiền tố
+            # literal của re và chậm cả tầng
+            patterns = [(name, re.compile(p)) for name, p in (r for r in rules if not isinstance(r, str))]
+            if len(keywords) > MAX_SUBSTRING_KEYWORDS:
+                self._tiers.append((priority, (), re.compile(_trie_regex(keywords)), patterns))
+            else:
+                self._tiers.append((priority, keywords, None, patterns))
+
+    def classify(self, text):
+        """(priority, luật khớp) cho 1 dòng; (default, None) nếu không luật nào khớp"""
+        text_lower = text.lower()
+        for priority, keywords, keyword_regex, patterns in self._tiers:
+            for keyword in keywords:
+                if keyword in text_lower:
+                    return priority, keyword
+            if keyword_regex is not None:
+                m = keyword_regex.search(text_lower)
+                if m:
+                    return priority, m.group(0)
+            for name, pattern in patterns:
+                if pattern.search(text_lower):
+                    return priority, name
+        return self.default, None
+
+    def classify_batch(self, lines):
+        """Phân loại nhiều dòng, giữ nguyên thứ tự"""
+        classify = self.classify
+        return [classify(line) for line in lines]
+
+
+FINAL_CLASSIFIER = PriorityClassifier(FINAL_RULES)
+STRICT_CLASSIFIER = PriorityClassifier(STRICT_RULES)
+SITUATION_CLASSIFIER = PriorityClassifier(SITUATION_RULES, default=None)
@@ -0,0 +1,160 @@
+import json
+import time
+import pstats
+import cProfile
+import platform
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+# Các hàm nóng luôn được đưa vào báo cáo (nếu có trong profile), dù không lọt top
+WATCHED_FUNCTIONS = (
+    'parse_line', 'parse_row', 'extract_phones', 'extract_location_strict',
+    'extract_address_core', 'lookup', 'classify', 'case_features',
+    'is_duplicate_features', 'is_similar', 'signature', 'candidates', 'dump',
+)
+
+
+class PipelineProfiler:
+    """
+    Đo từng stage của pipeline: thời gian (perf_counter) và các bộ đếm (VD: số lần
+    is_duplicate, số cặp bị chỉ mục loại). Tùy chọn, vì làm chậm mọi stage nhiều lần:
+    - functions=True: số lần gọi / thời gian từng hàm (cProfile)
+    - memory=True: bộ nhớ cấp phát theo stage (tracemalloc)
+    Chỉ thấy được code chạy trong process chính: với --workers > 1 phần parse
+    trong các process con không có trong thống kê hàm.
+    """
+
+    def __init__(self, top=15, functions=False, memory=False):
+        self.top = top
+        self.memory = memory
+        self.stages = []
+        self.counters = {}
+        self.total_seconds = 0.0
+        self._profile = cProfile.Profile() if functions else None
+        self._stats = None
+
+    @contextmanager
+    def session(self):
+        """Bao toàn bộ lần chạy: bật tracemalloc / cProfile nếu được yêu cầu"""
+        started_tracing = self.memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        start = time.perf_counter()
+        if self._profile:
+            self._profile.enable()
+        try:
+            yield self
+        finally:
+            if self._profile:
+                self._profile.disable()
+                self._stats = pstats.Stats(self._profile)
+            self.total_seconds = time.perf_counter() - start
+            if started_tracing:
+                tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name):
+        """Đo 1 stage: thời gian thực, bộ nhớ tăng thêm và đỉnh bộ nhớ trong stage (nếu memory)"""
+        tracing = self.memory and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            current, peak = tracemalloc.get_traced_memory() if tracing else (0, 0)
+            self.stages.append({
+                'stage': name,
+                'seconds': seconds,
+                'alloc_net_bytes': current - before if tracing else None,
+                'alloc_peak_bytes': peak - before if tracing else None,
+            })
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def counted(self, name, func, hits=None):
+        """Bọc func để đếm số lần gọi (và số lần trả về True nếu có hits)"""
+        def wrapper(*args, **kwargs):
+            self.count(name)
+            result = func(*args, **kwargs)
+            if hits and result:
+                self.count(hits)
+            return result
+        return wrapper
+
+    def functions(self):
+        """Top hàm theo thời gian tự thân, cộng các hàm trong WATCHED_FUNCTIONS"""
+        if self._stats is None:
+            return []
+        rows = []
+        for (filename, line, name), (cc, nc, tt, ct, _) in self._stats.stats.items():
+            rows.append({
+                'function': name,
+                'location': f"{filename.rsplit('/', 1)[-1]}:{line}",
+                'calls': nc,
+                'tottime': tt,
+                'cumtime': ct,
+            })
+        rows.sort(key=lambda r: r['tottime'], reverse=True)
+        top = rows[:self.top]
+        watched = [r for r in rows[self.top:] if r['function'] in WATCHED_FUNCTIONS
+                   and r['location'].split(':')[0] != '~']
+        return top + watched
+
+    def dump_stats(self, path):
+        """Ghi file pstats (xem bằng python -m pstats hoặc snakeviz)"""
+        self._profile.dump_stats(path)
+
+    def to_dict(self, **meta):
+        return {
+            **meta,
+            'python': platform.python_version(),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'total_seconds': self.total_seconds,
+            'stages': self.stages,
+            'counters': self.counters,
+            'functions': self.functions(),
+        }
+
+    def write_json(self, path, **meta):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(**meta), f, ensure_ascii=False, indent=2)
+
+    def print_report(self):
+        total = self.total_seconds or sum(s['seconds'] for s in self.stages) or 1.0
+        print("\n⏱️ PROFILE theo stage:")
+        print(f"  {'stage':<12} {'giây':>9} {'%':>6} {'cấp phát':>11} {'đỉnh':>11}")
+        for s in self.stages:
+            print(f"  {s['stage']:<12} {s['seconds']:9.3f} {s['seconds'] / total * 100:5.1f}%"
+                  f" {_format_bytes(s['alloc_net_bytes']):>11} {_format_bytes(s['alloc_peak_bytes']):>11}")
+        print(f"  {'tổng':<12} {self.total_seconds:9.3f}")
+
+        if self.counters:
+            print("\n🔢 Bộ đếm:")
+            for name, value in self.counters.items():
+                print(f"  {name:<28} {value:>10}")
+
+        functions = self.functions()
+        if functions:
+            print("\n🔥 Hàm (theo thời gian tự thân):")
+            print(f"  {'hàm':<32} {'số lần':>9} {'tự thân':>9} {'tích lũy':>9}  vị trí")
+            for r in functions:
+                print(f"  {r['function'][:32]:<32} {r['calls']:>9} {r['tottime']:9.3f} {r['cumtime']:9.3f}  {r['location']}")
+
+
+def _format_bytes(n):
+    if n is None:
+        return '-'
+    for unit in ('B', 'KB', 'MB'):
+        if abs(n) < 1024:
+            return f"{n:.0f} {unit}" if unit == 'B' else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+def stage_of(profiler, name):
+    """Context đo stage, hoặc không làm gì nếu không profile"""
+    return profiler.stage(name) if profiler else nullcontext()
@@ -0,0 +1,89 @@
+def z_array(text):
+    """z[i] = độ dài tiền tố chung dài nhất của text và text[i:] (thuật toán Z, O(n))"""
+    n = len(text)
+    z = [0] * n
+    if n:
+        z[0] = n
+    left = right = 0
+    for i in range(1, n):
+        if i < right:
+            z[i] = min(right - i, z[i - left])
+        while i + z[i] < n and text[z[i]] == text[i + z[i]]:
+            z[i] += 1
+        if i + z[i] > right:
+            left, right = i, i + z[i]
+    return z
+
+
+# Quá nhiều lần xuất hiện của đoạn đầu (chuỗi tuần hoàn kiểu "aaaa...") -> dùng Z-array
+MAX_CANDIDATES = 8
+
+
+def _repeated_prefix_z(text, min_length):
+    n = len(text)
+    z = z_array(text)
+    # Phần còn lại sau khi strip() phải chứa trọn bản lặp
+    end = len(text.rstrip())
+
+    # skip[i] = vị trí ký tự không phải khoảng trắng đầu tiên từ i
+    skip = [n] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        skip[i] = skip[i + 1] if text[i].isspace() else i
+
+    for length in range(min_length, n // 2 + 1):
+        # rest.startswith(substr)
+        if z[length] >= length:
+            return length
+        # rest.strip().startswith(substr)
+        j = skip[length]
+        if j < end and j + length <= end and z[j] >= length:
+            return length
+    return None
+
+
+def repeated_prefix_length(text, min_length=10):
+    """
+    Độ dài L nhỏ nhất (min_length <= L <= n/2) sao cho text[:L] lặp lại ngay sau nó,
+    có thể cách vài khoảng trắng (VD: "398/15 Lê Đại Cương398/15 LĐC"). None nếu không có.
+
+    Bản lặp phải bắt đầu tại 1 lần xuất hiện p của text[:min_length], với L = p
+    hoặc text[L:p] toàn khoảng trắng. Các lần xuất hiện tìm bằng str.find và mỗi
+    ứng viên kiểm tra bằng startswith (đều chạy trong C); chuỗi có quá nhiều lần
+    xuất hiện thì chuyển sang Z-array. Tổng cộng O(n), cùng kết quả với vòng lặp cũ.
+    """
+    n = len(text)
+    if n < 2 * min_length:
+        return None
+    head = text[:min_length]
+    half = n // 2
+    end = len(text.rstrip())
+    lead_is_space = text[0].isspace()
+
+    p = text.find(head, min_length)
+    for _ in range(MAX_CANDIDATES):
+        if p == -1:
+            return None
+        # Các L ứng với lần xuất hiện p nằm trong [low, p]; low tăng dần theo p,
+        # nên lần xuất hiện đầu tiên có L hợp lệ cho L nhỏ nhất
+        low = p
+        if not lead_is_space:
+            while low > min_length and text[low - 1].isspace():
+                low -= 1
+        if low > half:
+            return None
+        # L < p, text[L:p] là khoảng trắng: rest.strip().startswith(substr)
+        if not lead_is_space:
+            for length in range(low, min(p, half + 1)):
+                if p + length <= end and text.startswith(text[:length], p):
+                    return length
+        # L = p: rest.startswith(substr)
+        if p <= half and text.startswith(text[:p], p):
+            return p
+        p = text.find(head, p + 1)
+    return None if p == -1 else _repeated_prefix_z(text, min_length)
+
+
+def cut_repeated_prefix(text, min_length=10):
+    """Bỏ phần lặp do dán ô: giữ lại đoạn đầu nếu nó lặp ngay sau nó"""
+    length = repeated_prefix_length(text, min_length)
+    return text if length is None else text[:length]
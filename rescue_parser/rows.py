@@ -0,0 +1,220 @@
+import re
+import json
+import argparse
+
+from .fuzzy import lookup_area
+from .gazetteer import AREA_GAZETTEER
+from .pdf_extract import read_input_lines
+from .phones import tokenize
+from .text import strip_note
+
+# Bảng gốc có 5 cột: Mức độ ưu tiên | Chi tiết khu vực | Số người | Địa chỉ | Số điện thoại.
+# pdf-parse dán liền các ô, VD: "Khẩn cấp398/15 Lê Đại Cương398/15 LĐC (bé ngộ độc)(chưa có)".
+
+PRIORITY_COLUMN = {'khẩn cấp': 'CRITICAL', 'ưu tiên cao': 'HIGH', 'thường': 'MEDIUM'}
+PRIORITY_PREFIX = re.compile(r'(Khẩn cấp|Ưu tiên cao|Thường)', re.IGNORECASE)
+
+# Dòng tiêu đề, không thuộc bản ghi nào (ghi chú của người nhập: text.strip_note)
+NOISE_MARKERS = ('Mức độ ưu tiên',)
+
+# Ô "Chi tiết khu vực" ngắn; điểm dán xa hơn thế là nằm trong địa chỉ
+MAX_DETAIL_LENGTH = 60
+
+# Bắt đầu cột SĐT: số điện thoại, số dạng float của bảng tính (905006857.0), hoặc ghi chú "không có số"
+PHONE_START = re.compile(
+    r'(?<!\d)(?:0[\d \.]{8,}|\d{9,10}\.0(?!\d))'
+    r'|\(?không có sđt|\(không cung cấp số\)|\(chưa có\)|\(không ghi số\)|sđt bị ẩn',
+    re.IGNORECASE,
+)
+
+# Số người được nhắc lại trong địa chỉ, dùng để tách ô Số người bị dán vào số nhà (VD: "1568 Ấp" + "15 người")
+PEOPLE_WORD = r'\s*(?:người|ng\b|hộ|em|bé|trẻ|cháu|đứa|con|lớn)'
+PEOPLE_HINT = re.compile(r'(?<!\d)(\d{1,3})' + PEOPLE_WORD, re.IGNORECASE)
+STARTS_WITH_PEOPLE = re.compile(PEOPLE_WORD, re.IGNORECASE)
+LEADING_COUNT = re.compile(r'\d+|Nhiều(?=\S)')
+
+
+def iter_records(lines):
+    """
+    Ghép các dòng thành bản ghi: dòng bắt đầu bằng tiền tố ưu tiên mở bản ghi mới,
+    dòng khác là phần tràn của bản ghi trước. Sinh (số dòng bắt đầu, text).
+    Ghép liền không thêm khoảng trắng vì pdf-parse xuống dòng ở ranh giới ô.
+    """
+    start, parts = None, []
+    for line_no, line in enumerate(lines, 1):
+        line = strip_note(line.rstrip('\r\n'))
+        if not line.strip() or any(m in line for m in NOISE_MARKERS):
+            continue
+        if PRIORITY_PREFIX.match(line):
+            if parts:
+                yield start, ''.join(parts)
+            start, parts = line_no, [line]
+        elif parts:
+            parts.append(line)
+    if parts:
+        yield start, ''.join(parts)
+
+
+def _glue_point(text, limit):
+    """
+    Vị trí 2 ô bị dán liền: chữ thường liền chữ hoa/số (ThạchThôn, Cương398)
+    hoặc số liền chữ hoa (8Sau). Dùng islower/isupper vì dải Unicode tiếng Việt
+    xen kẽ hoa - thường, không viết gọn được bằng [a-z] trong regex.
+    """
+    for i in range(1, min(len(text), limit)):
+        prev, ch = text[i - 1], text[i]
+        if (prev.islower() and (ch.isupper() or ch.isdigit())) or (prev.isdigit() and ch.isupper()):
+            return i
+    return None
+
+
+def _repeat_point(text):
+    """Ô địa chỉ lặp lại đầu ô khu vực, dán liền không dấu cách (VD: "Cồn Dêcồn dê ...")"""
+    head = text[:4].lower()
+    if len(head) < 4:
+        return None
+    p = text.lower().find(head, 1, MAX_DETAIL_LENGTH + len(head))
+    if p > 0 and not text[p - 1].isspace():
+        return p
+    return None
+
+
+def _split_detail(text):
+    """
+    Vị trí kết thúc ô Chi tiết khu vực: điểm dán đầu tiên; không có thì địa danh
+    đầu dòng trong gazetteer; cuối cùng là chỗ địa chỉ lặp lại đầu ô khu vực.
+    """
+    i = _glue_point(text, MAX_DETAIL_LENGTH)
+    if i is not None:
+        return i
+    keyword = AREA_GAZETTEER.match_prefix(text)
+    if keyword:
+        return len(keyword)
+    i = _repeat_point(text)
+    return 0 if i is None else i
+
+
+def _split_people(text):
+    """
+    Tách ô Số người ở đầu text. Trả về (số người, độ dài đã dùng).
+    Số dính liền chữ (2Số, 4Khu) là cả ô; số lặp đôi trước "người" (1818 người)
+    là ô + địa chỉ bắt đầu bằng cùng con số; số dính vào số nhà chỉ tách khi
+    phần mô tả phía sau nhắc lại đúng con số đó.
+    """
+    m = LEADING_COUNT.match(text)
+    if not m:
+        return None, 0
+    digits = m.group(0)
+    if digits == 'Nhiều':
+        return digits, m.end()
+    after = text[m.end():m.end() + 1]
+    if len(digits) <= 3 and after.isalpha():
+        return int(digits), m.end()
+
+    half = len(digits) // 2
+    if len(digits) % 2 == 0 and digits[:half] == digits[half:] and STARTS_WITH_PEOPLE.match(text, m.end()):
+        return int(digits[:half]), half
+
+    hints = {int(h) for h in PEOPLE_HINT.findall(text, m.end())}
+    for k in range(min(3, len(digits) - 1), 0, -1):
+        if int(digits[:k]) in hints:
+            return int(digits[:k]), k
+    return None, 0
+
+
+def split_people_count(text):
+    """
+    (ô Chi tiết khu vực, ô Số người) ở đầu 1 bản ghi pdf-parse (có hoặc không có tiền tố
+    ưu tiên), cùng cách tách với split_row. Ô Số người là chuỗi đúng như trong text,
+    '' nếu không tách được.
+    """
+    m = PRIORITY_PREFIX.match(text)
+    body = text[m.end():] if m else text
+    detail_end = _split_detail(body)
+    _, used = _split_people(body[detail_end:])
+    return body[:detail_end], body[detail_end:detail_end + used]
+
+
+def drop_people_count(text, record=None):
+    """
+    Bỏ ô Số người bị dán giữa ô Chi tiết khu vực và số nhà ở đầu text
+    ("Cầu Bè548/1 Cầu Bè ... 5 người" -> "Cầu Bè 48/1 Cầu Bè ..."). record: bản ghi gốc
+    để tách ô, mặc định chính text (địa chỉ strict đã mất phần mô tả nhắc lại số người).
+    """
+    detail, count = split_people_count(text if record is None else record)
+    if not detail or not count:
+        return text
+    prefix = PRIORITY_PREFIX.match(text)
+    start = prefix.end() if prefix else 0
+    m = re.compile(re.escape(detail) + r'\s*' + re.escape(count)).match(text, start)
+    if m is None:
+        return text
+    return text[:start] + detail + ' ' + text[m.end():]
+
+
+def parse_phones(text):
+    """Các SĐT (chỉ chữ số, đã chuẩn hóa) trong ô Số điện thoại"""
+    phones, _ = tokenize(text)
+    return phones
+
+
+def split_row(text):
+    """Tách 1 bản ghi đã ghép thành các cột có kiểu, 1 lượt quét từ trái sang phải"""
+    m = PRIORITY_PREFIX.match(text)
+    label = m.group(1) if m else ''
+    body = text[m.end():] if m else text
+
+    phone_match = PHONE_START.search(body)
+    phone_at = phone_match.start() if phone_match else len(body)
+    cells, phone_text = body[:phone_at], body[phone_at:]
+
+    detail_end = _split_detail(cells)
+    detail = cells[:detail_end]
+    people, used = _split_people(cells[detail_end:])
+    address = cells[detail_end + used:]
+
+    area_source = detail or address
+    return {
+        'priority': PRIORITY_COLUMN.get(label.lower(), 'MEDIUM'),
+        'area_detail': detail.strip(),
+        'area': lookup_area(area_source),
+        'people': people,
+        'address': address.strip(),
+        'phone_text': phone_text.strip(),
+        'phones': parse_phones(phone_text),
+    }
+
+
+def reconstruct_rows(lines):
+    """Sinh các bản ghi đã tách cột từ stream dòng của pdf_content.txt (text pdf-parse)"""
+    for line_no, text in iter_records(lines):
+        row = split_row(text)
+        row['line'] = line_no
+        row['raw'] = text
+        yield row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dựng lại các dòng của bảng cứu hộ thành cột có kiểu")
+    parser.add_argument('input', nargs='?', default='pdf_content.txt')
+    parser.add_argument('--output', help="Ghi các dòng ra file JSON (mặc định chỉ in thống kê)")
+    args = parser.parse_args()
+    if args.input.lower().endswith('.pdf'):
+        parser.error("chỉ hỗ trợ pdf_content.txt (pdf-parse): pypdf tách ô bằng dấu cách, không dán liền")
+
+    rows = list(reconstruct_rows(read_input_lines(args.input)))
+    with_people = sum(1 for r in rows if r['people'] is not None)
+    with_phones = sum(1 for r in rows if r['phones'])
+    print(f"✅ {len(rows)} bản ghi | có số người: {with_people} | có SĐT: {with_phones}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+        print(f"💾 Saved to {args.output}")
+    else:
+        for row in rows[:10]:
+            print(f"  [{row['priority']}] {row['area_detail']} | {row['people']} | {row['address'][:50]} | {row['phones']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import os
+import json
+import hashlib
+
+from .changes import atomic_write
+from .formats import SUFFIXES, decode, encode
+from .text import slugify
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+
+def shard_name(area, fmt='pretty'):
+    """
+    Tên file cố định theo area: slug dễ đọc + 6 ký tự băm tên gốc
+    (tránh trùng khi 2 area chỉ khác dấu, VD: 'Diên An' / 'Điện An')
+    """
+    digest = hashlib.sha1(area.encode('utf-8')).hexdigest()[:6]
+    return f"{slugify(area) or 'area'}-{digest}{SUFFIXES[fmt]}"
+
+
+def _counts(cases, key):
+    counts = {}
+    for case in cases:
+        counts[case[key]] = counts.get(case[key], 0) + 1
+    return counts
+
+
+def load_manifest(directory):
+    path = os.path.join(directory, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    return manifest if manifest.get('version') == MANIFEST_VERSION else None
+
+
+def export_shards(cases, directory, fmt='pretty'):
+    """
+    Ghi mỗi area một file + manifest.json (số case theo area / priority, tên file,
+    sha256 nội dung). Shard chỉ được ghi lại khi nội dung đổi; shard của area
+    không còn case bị xóa. Trả về (số shard ghi mới, giữ nguyên, xóa).
+    """
+    os.makedirs(directory, exist_ok=True)
+    previous = load_manifest(directory) or {'shards': []}
+    old_hashes = {s['file']: s['sha256'] for s in previous['shards']}
+
+    by_area = {}
+    for case in cases:
+        by_area.setdefault(case['area'], []).append(case)
+
+    shards = []
+    written = unchanged = 0
+    for area in sorted(by_area):
+        area_cases = by_area[area]
+        data = encode(area_cases, fmt).encode('utf-8')
+        name = shard_name(area, fmt)
+        digest = hashlib.sha256(data).hexdigest()
+        path = os.path.join(directory, name)
+        if old_hashes.get(name) == digest and os.path.exists(path):
+            unchanged += 1
+        else:
+            atomic_write(path, data)
+            written += 1
+        shards.append({
+            'area': area,
+            'file': name,
+            'count': len(area_cases),
+            'priorities': _counts(area_cases, 'priority'),
+            'bytes': len(data),
+            'sha256': digest,
+        })
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'format': fmt,
+        'total': len(cases),
+        'priorities': _counts(cases, 'priority'),
+        'shards': shards,
+    }
+    # Manifest ghi sau các shard mới: client đọc manifest luôn thấy các shard đã ghi xong
+    atomic_write(os.path.join(directory, MANIFEST_NAME),
+                 json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'))
+
+    # Shard cũ chỉ xóa khi manifest mới đã thay manifest cũ (manifest cũ còn trỏ tới chúng)
+    current = {s['file'] for s in shards}
+    removed = 0
+    for name in old_hashes:
+        if name not in current and os.path.exists(os.path.join(directory, name)):
+            os.remove(os.path.join(directory, name))
+            removed += 1
+    return written, unchanged, removed
+
+
+def load_shards(directory, areas=None):
+    """Đọc lại case của các area cần (None = tất cả), kiểm tra sha256 theo manifest"""
+    manifest = load_manifest(directory)
+    if manifest is None:
+        raise ValueError(f"Không có manifest hợp lệ trong {directory}")
+    cases = []
+    for shard in manifest['shards']:
+        if areas is not None and shard['area'] not in areas:
+            continue
+        with open(os.path.join(directory, shard['file']), 'rb') as f:
+            data = f.read()
+        if hashlib.sha256(data).hexdigest() != shard['sha256']:
+            raise ValueError(f"Shard {shard['file']} không khớp sha256 trong manifest")
+        cases.extend(decode(data.decode('utf-8')))
+    return cases
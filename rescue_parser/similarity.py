@@ -0,0 +1,106 @@
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+from .dedup_index import char_ngrams
+
+# Các backend đều có dạng f(a, b, threshold) -> bool và dừng sớm ngay khi
+# ngưỡng chắc chắn không đạt được. Điểm của mỗi backend có thang khác nhau,
+# nên ngưỡng phải được chọn theo từng backend.
+
+
+def sequence_at_least(a, b, threshold):
+    """
+    SequenceMatcher.ratio() >= threshold, lọc trước bằng các cận trên rẻ:
+    độ dài (real_quick_ratio) rồi bội ký tự chung (quick_ratio).
+    """
+    la, lb = len(a), len(b)
+    if not la + lb:
+        return threshold <= 1.0
+    # Cận trên theo độ dài: ratio = 2M/(la+lb) <= 2*min(la, lb)/(la+lb)
+    if 2.0 * min(la, lb) / (la + lb) < threshold:
+        return False
+    matcher = SequenceMatcher(None, a, b)
+    if matcher.quick_ratio() < threshold:
+        return False
+    return matcher.ratio() >= threshold
+
+
+def levenshtein_bounded(a, b, max_dist):
+    """
+    Khoảng cách Levenshtein dạng bit-parallel (Myers/Hyyrö), O(len) phép toán số nguyên.
+    Trả về max_dist + 1 ngay khi khoảng cách chắc chắn vượt max_dist.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    n, m = len(a), len(b)
+    if n - m > max_dist:
+        return max_dist + 1
+    if not m:
+        return n
+
+    # Bit vector vị trí của từng ký tự trong chuỗi ngắn (pattern)
+    peq = {}
+    for i, ch in enumerate(b):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv, mv, score = full, 0, m
+
+    for j, ch in enumerate(a):
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        # Mỗi ký tự còn lại giảm khoảng cách được tối đa 1
+        if score - (n - j - 1) > max_dist:
+            return max_dist + 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+    return score
+
+
+def levenshtein_at_least(a, b, threshold):
+    """1 - d / max(len) >= threshold, với d tính có giới hạn"""
+    longest = max(len(a), len(b))
+    if not longest:
+        return threshold <= 1.0
+    max_dist = int((1.0 - threshold) * longest + 1e-9)
+    return levenshtein_bounded(a, b, max_dist) <= max_dist
+
+
+@lru_cache(maxsize=65536)
+def _trigrams(text):
+    return frozenset(char_ngrams(text, 3))
+
+
+def trigram_at_least(a, b, threshold):
+    """Jaccard trên tập trigram ký tự >= threshold (tập trigram được cache theo chuỗi)"""
+    ga, gb = _trigrams(a), _trigrams(b)
+    small, large = sorted((len(ga), len(gb)))
+    if not large:
+        return threshold <= 1.0
+    # Cận trên: |A∩B| / |A∪B| <= min(|A|, |B|) / max(|A|, |B|)
+    if small / large < threshold:
+        return False
+    inter = len(ga & gb)
+    return inter / (len(ga) + len(gb) - inter) >= threshold
+
+
+BACKENDS = {
+    'sequencematcher': sequence_at_least,
+    'levenshtein': levenshtein_at_least,
+    'trigram': trigram_at_least,
+}
+DEFAULT_BACKEND = 'sequencematcher'
+
+
+def is_similar(a, b, threshold, backend=DEFAULT_BACKEND):
+    """Hai chuỗi (đã chuẩn hóa) có độ tương đồng >= threshold theo backend đã chọn"""
+    return BACKENDS[backend](a, b, threshold)
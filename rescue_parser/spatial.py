@@ -0,0 +1,221 @@
+import os
+import json
+import math
+import heapq
+
+from .changes import atomic_write
+
+INDEX_VERSION = 1
+DEFAULT_CELL_KM = 1.0
+KM_PER_DEGREE = 111.32
+
+
+class SpatialIndex:
+    """
+    Chỉ mục lưới đều trên các case đã có toạ độ (case['location']).
+    Toạ độ được chiếu phẳng quanh vĩ độ trung bình (sai số không đáng kể ở quy mô
+    một tỉnh), mỗi ô cell_km x cell_km giữ danh sách chỉ số điểm trong ô.
+    Mỗi cặp (priority, isRescued) có lưới riêng, nên truy vấn có lọc chỉ duyệt
+    đúng các điểm thỏa điều kiện. Truy vấn trả về [(id, khoảng cách km)].
+    """
+
+    def __init__(self, ids, lats, lngs, priorities, rescued, cell_km=DEFAULT_CELL_KM, ref_lat=None):
+        self.ids = list(ids)
+        self.lats = list(lats)
+        self.lngs = list(lngs)
+        self.priorities = list(priorities)
+        self.rescued = list(rescued)
+        self.cell_km = cell_km
+        if ref_lat is None:
+            ref_lat = sum(self.lats) / len(self.lats) if self.lats else 0.0
+        self.ref_lat = ref_lat
+        self._kx = KM_PER_DEGREE * math.cos(math.radians(ref_lat))
+        self.xs = [lng * self._kx for lng in self.lngs]
+        self.ys = [lat * KM_PER_DEGREE for lat in self.lats]
+        # (priority, isRescued) -> ô -> các chỉ số điểm; sizes: số điểm của từng lưới
+        self.grids = {}
+        self.sizes = {}
+        for i, (x, y) in enumerate(zip(self.xs, self.ys)):
+            key = (self.priorities[i], self.rescued[i])
+            self.grids.setdefault(key, {}).setdefault(self._cell(x, y), []).append(i)
+            self.sizes[key] = self.sizes.get(key, 0) + 1
+        cells = {cell for grid in self.grids.values() for cell in grid}
+        if cells:
+            self._bounds = (min(c[0] for c in cells), max(c[0] for c in cells),
+                            min(c[1] for c in cells), max(c[1] for c in cells))
+
+    @classmethod
+    def from_cases(cls, cases, cell_km=DEFAULT_CELL_KM):
+        """Dựng từ các case đã geocode (bỏ qua case chưa có location)"""
+        located = [c for c in cases if c.get('location')]
+        return cls(
+            [c['id'] for c in located],
+            [c['location']['lat'] for c in located],
+            [c['location']['lng'] for c in located],
+            [c['priority'] for c in located],
+            [bool(c.get('isRescued')) for c in located],
+            cell_km,
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _cell(self, x, y):
+        return (math.floor(x / self.cell_km), math.floor(y / self.cell_km))
+
+    def _project(self, lat, lng):
+        return lng * self._kx, lat * KM_PER_DEGREE
+
+    def _keys(self, priorities, rescued):
+        """Khóa (priority, isRescued) của các lưới con thỏa bộ lọc (None = không lọc)"""
+        return [(priority, is_rescued) for priority, is_rescued in self.grids
+                if (priorities is None or priority in priorities)
+                and (rescued is None or is_rescued == rescued)]
+
+    def _grids(self, priorities, rescued):
+        """Các lưới con thỏa bộ lọc priority / isRescued"""
+        return [self.grids[key] for key in self._keys(priorities, rescued)]
+
+    def _accept(self, i, priorities, rescued):
+        if priorities is not None and self.priorities[i] not in priorities:
+            return False
+        return rescued is None or self.rescued[i] == rescued
+
+    def within_radius(self, lat, lng, radius_km, priorities=None, rescued=None):
+        """Các case trong bán kính radius_km, gần nhất trước"""
+        x, y = self._project(lat, lng)
+        cx0, cy0 = self._cell(x - radius_km, y - radius_km)
+        cx1, cy1 = self._cell(x + radius_km, y + radius_km)
+        r2 = radius_km * radius_km
+        found = []
+        xs, ys = self.xs, self.ys
+        for grid in self._grids(priorities, rescued):
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    for i in grid.get((cx, cy), ()):
+                        d2 = (xs[i] - x) ** 2 + (ys[i] - y) ** 2
+                        if d2 <= r2:
+                            found.append((d2, i))
+        found.sort()
+        return [(self.ids[i], math.sqrt(d2)) for d2, i in found]
+
+    def bbox(self, min_lat, min_lng, max_lat, max_lng, priorities=None, rescued=None):
+        """Id các case nằm trong khung toạ độ (theo thứ tự chỉ số)"""
+        x0, y0 = self._project(min_lat, min_lng)
+        x1, y1 = self._project(max_lat, max_lng)
+        cx0, cy0 = self._cell(x0, y0)
+        cx1, cy1 = self._cell(x1, y1)
+        found = []
+        lats, lngs = self.lats, self.lngs
+        for grid in self._grids(priorities, rescued):
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    members = grid.get((cx, cy), ())
+                    if cx0 < cx < cx1 and cy0 < cy < cy1:
+                        # Ô nằm trọn trong khung: không cần so từng điểm
+                        found.extend(members)
+                        continue
+                    for i in members:
+                        if min_lat <= lats[i] <= max_lat and min_lng <= lngs[i] <= max_lng:
+                            found.append(i)
+        found.sort()
+        return [self.ids[i] for i in found]
+
+    def nearest(self, lat, lng, k=1, priorities=None, rescued=None, max_km=None):
+        """
+        k case gần nhất: duyệt các vòng ô quanh điểm truy vấn (chỉ phần nằm trong khung
+        dữ liệu), dừng khi k điểm tốt nhất đều gần hơn khoảng cách chắc chắn đã phủ hết
+        (ring * cell_km). Số ô đã duyệt vượt số điểm thỏa lọc (dữ liệu thưa, điểm truy vấn
+        ở xa) thì quét thẳng các điểm, không duyệt tiếp các vòng ô rỗng.
+        """
+        keys = self._keys(priorities, rescued)
+        if not keys or k <= 0:
+            return []
+        grids = [self.grids[key] for key in keys]
+        points = sum(self.sizes[key] for key in keys)
+        x, y = self._project(lat, lng)
+        cx, cy = self._cell(x, y)
+        min_cx, max_cx, min_cy, max_cy = self._bounds
+        # Số vòng tối đa để phủ hết lưới từ ô truy vấn
+        max_ring = max(abs(cx - min_cx), abs(cx - max_cx), abs(cy - min_cy), abs(cy - max_cy))
+        if max_km is not None:
+            max_ring = min(max_ring, int(max_km / self.cell_km) + 1)
+
+        heap = []  # max-heap theo khoảng cách (lưu -d2)
+        xs, ys = self.xs, self.ys
+        visited = 0
+        for ring in range(max_ring + 1):
+            for cell in _ring_cells(cx, cy, ring, self._bounds):
+                visited += 1
+                for i in (i for grid in grids for i in grid.get(cell, ())):
+                    d2 = (xs[i] - x) ** 2 + (ys[i] - y) ** 2
+                    if len(heap) < k:
+                        heapq.heappush(heap, (-d2, i))
+                    elif d2 < -heap[0][0]:
+                        heapq.heapreplace(heap, (-d2, i))
+            # Mọi điểm chưa duyệt cách ít nhất ring * cell_km
+            covered = ring * self.cell_km
+            if len(heap) == k and -heap[0][0] <= covered * covered:
+                break
+            if visited > points and ring < max_ring:
+                heap = [(-d2, i) for d2, i in self._scan(x, y, k, priorities, rescued)]
+                break
+
+        result = sorted((-d2, i) for d2, i in heap)
+        if max_km is not None:
+            result = [(d2, i) for d2, i in result if d2 <= max_km * max_km]
+        return [(self.ids[i], math.sqrt(d2)) for d2, i in result]
+
+    def _scan(self, x, y, k, priorities, rescued):
+        """k điểm gần nhất thỏa lọc bằng cách so với mọi điểm: [(d2, chỉ số)]"""
+        xs, ys = self.xs, self.ys
+        return heapq.nsmallest(k, (((xs[i] - x) ** 2 + (ys[i] - y) ** 2, i)
+                                   for i in range(len(xs)) if self._accept(i, priorities, rescued)))
+
+    def to_dict(self):
+        return {
+            'version': INDEX_VERSION,
+            'cell_km': self.cell_km,
+            'ref_lat': self.ref_lat,
+            'ids': self.ids,
+            'lat': self.lats,
+            'lng': self.lngs,
+            'priority': self.priorities,
+            'isRescued': self.rescued,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('version') != INDEX_VERSION:
+            raise ValueError(f"Phiên bản spatial index không hỗ trợ: {data.get('version')}")
+        return cls(data['ids'], data['lat'], data['lng'], data['priority'], data['isRescued'],
+                   data['cell_km'], data['ref_lat'])
+
+    def save(self, path):
+        """Ghi dạng cột (các ô lưới dựng lại khi load, nhanh hơn đọc từ JSON)"""
+        atomic_write(path, json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def _ring_cells(cx, cy, ring, bounds):
+    """Các ô nằm đúng trên vòng vuông thứ ring quanh (cx, cy), trong khung bounds"""
+    min_cx, max_cx, min_cy, max_cy = bounds
+    x0, x1 = max(cx - ring, min_cx), min(cx + ring, max_cx)
+    for cell_y in sorted({cy - ring, cy + ring}):
+        if min_cy <= cell_y <= max_cy:
+            for cell_x in range(x0, x1 + 1):
+                yield (cell_x, cell_y)
+    y0, y1 = max(cy - ring + 1, min_cy), min(cy + ring - 1, max_cy)
+    for cell_x in sorted({cx - ring, cx + ring}) if ring else ():
+        if min_cx <= cell_x <= max_cx:
+            for cell_y in range(y0, y1 + 1):
+                yield (cell_x, cell_y)
+
+
+def index_path(output):
+    """data.json -> data.spatial.json"""
+    return os.path.splitext(output)[0] + '.spatial.json'
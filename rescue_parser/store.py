@@ -0,0 +1,232 @@
+import json
+import sqlite3
+
+from .formats import write_cases
+from .normalize import fold, fold_batch
+from .phones import normalize_number
+from .text import normalize_phone
+
+STORE_VERSION = 1
+# Số id mỗi câu SELECT ... IN (...) (dưới giới hạn tham số của SQLite)
+QUERY_CHUNK = 500
+
+# cases: mỗi case 1 dòng, data = JSON nguyên bản (đúng shape data.json), các cột còn lại
+# tách ra để lọc qua index. folded = content đã gấp dấu, nguồn của bảng FTS5.
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS cases (
+    pk INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    position INTEGER NOT NULL,
+    area TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    is_rescued INTEGER NOT NULL,
+    folded TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cases_area ON cases (area, priority);
+CREATE INDEX IF NOT EXISTS cases_priority ON cases (priority, is_rescued);
+CREATE INDEX IF NOT EXISTS cases_rescued ON cases (is_rescued);
+CREATE INDEX IF NOT EXISTS cases_position ON cases (position);
+
+CREATE TABLE IF NOT EXISTS phones (
+    phone TEXT NOT NULL,
+    case_id TEXT NOT NULL REFERENCES cases (id) ON DELETE CASCADE,
+    PRIMARY KEY (phone, case_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS phones_case ON phones (case_id);
+
+-- FTS5 external content: chỉ lưu chỉ mục, text lấy từ cases.folded. Sửa / xóa đồng bộ
+-- qua trigger; dòng mới được CaseStore đánh chỉ mục 1 lượt sau mỗi lần ghi (trigger
+-- INSERT từng dòng chậm hơn vài lần khi nạp hàng loạt)
+CREATE VIRTUAL TABLE IF NOT EXISTS cases_fts USING fts5 (folded, content='cases', content_rowid='pk');
+CREATE TRIGGER IF NOT EXISTS cases_fts_delete AFTER DELETE ON cases BEGIN
+    INSERT INTO cases_fts (cases_fts, rowid, folded) VALUES ('delete', old.pk, old.folded);
+END;
+CREATE TRIGGER IF NOT EXISTS cases_fts_update AFTER UPDATE OF folded ON cases BEGIN
+    INSERT INTO cases_fts (cases_fts, rowid, folded) VALUES ('delete', old.pk, old.folded);
+    INSERT INTO cases_fts (rowid, folded) VALUES (new.pk, new.folded);
+END;
+'''
+
+# is_rescued do người cứu hộ đánh dấu (set_rescued), pipeline không ghi đè khi cập nhật
+UPSERT = '''
+INSERT INTO cases (id, position, area, priority, is_rescued, folded, data) VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    area = excluded.area, priority = excluded.priority, folded = excluded.folded, data = excluded.data
+WHERE cases.data IS NOT excluded.data
+'''
+
+
+def phone_key(phone):
+    """Khóa tra SĐT: chữ số đã chuẩn hóa ('+84 905...' / '0905 ...' -> '0905...')"""
+    digits = normalize_phone(phone)
+    return normalize_number(digits) or digits
+
+
+def fts_query(text, prefix=False):
+    """Câu truy vấn FTS5 từ text tự do: các từ đã gấp dấu, AND với nhau (prefix: từ cuối khớp tiền tố)"""
+    tokens = [f'"{token}"' for token in fold(text).split()]
+    if prefix and tokens:
+        tokens[-1] += '*'
+    return ' '.join(tokens)
+
+
+class CaseStore:
+    """
+    Kho case trên SQLite (WAL) thay cho việc đọc / ghi lại cả data.json: lọc theo
+    area / priority / isRescued và tra SĐT qua index, tìm text qua FTS5 trên content
+    đã gấp dấu. data.json vẫn xuất được từ kho (export) cho rescue-app.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        # WAL: đọc không chặn ghi (app tra cứu trong lúc pipeline đang cập nhật)
+        self.conn.execute('PRAGMA journal_mode = WAL')
+        self.conn.execute('PRAGMA synchronous = NORMAL')
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, STORE_VERSION):
+            raise ValueError(f"Phiên bản kho không hỗ trợ: {version}")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+            self.conn.execute(f'PRAGMA user_version = {STORE_VERSION}')
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.conn.execute('SELECT COUNT(*) FROM cases').fetchone()[0]
+
+    def _changed(self, cases):
+        """
+        {id: (case, JSON)} của các case mới / khác với bản trong kho. Case đã có trong kho
+        giữ isRescued của kho (xem set_rescued), không lấy giá trị của pipeline.
+        """
+        cases = {str(case['id']): case for case in cases}
+        rows = {}
+        ids = list(cases)
+        for i in range(0, len(ids), QUERY_CHUNK):
+            chunk = ids[i:i + QUERY_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            for case_id, rescued, data in self.conn.execute(
+                    f'SELECT id, is_rescued, data FROM cases WHERE id IN ({placeholders})', chunk):
+                case = cases.pop(case_id)
+                if bool(case.get('isRescued')) != bool(rescued):
+                    case = dict(case, isRescued=bool(rescued))
+                row = json.dumps(case, ensure_ascii=False)
+                if row != data:
+                    rows[case_id] = (case, row)
+        rows.update((case_id, (case, json.dumps(case, ensure_ascii=False))) for case_id, case in cases.items())
+        return rows
+
+    def _write(self, cases):
+        """
+        Ghi hàng loạt (trong transaction của caller), trả về số case ghi / đổi. Case không
+        đổi được bỏ qua hẳn (không gấp dấu, không đánh lại FTS / SĐT); case mới xếp sau cùng.
+        """
+        rows = self._changed(cases)
+        if not rows:
+            return 0
+        position, last_pk = self.conn.execute(
+            'SELECT COALESCE(MAX(position), -1) + 1, COALESCE(MAX(pk), 0) FROM cases').fetchone()
+        folded = fold_batch(case['content'] for case, _ in rows.values())
+        self.conn.executemany(UPSERT, [
+            (case_id, position + i, case['area'], case['priority'], int(bool(case.get('isRescued'))), text, data)
+            for i, ((case_id, (case, data)), text) in enumerate(zip(rows.items(), folded))
+        ])
+        # Dòng mới nhận pk lớn hơn mọi pk cũ
+        self.conn.execute('INSERT INTO cases_fts (rowid, folded) SELECT pk, folded FROM cases WHERE pk > ?', (last_pk,))
+        self.conn.executemany('DELETE FROM phones WHERE case_id = ?', [(case_id,) for case_id in rows])
+        self.conn.executemany('INSERT OR IGNORE INTO phones (phone, case_id) VALUES (?, ?)', [
+            (phone_key(phone), case_id) for case_id, (case, _) in rows.items() for phone in case['phones']
+        ])
+        return len(rows)
+
+    def upsert(self, cases):
+        """Thêm / cập nhật các case theo id trong 1 transaction, không xóa case nào"""
+        cases = list(cases)
+        with self.conn:
+            return self._write(cases)
+
+    def sync(self, cases):
+        """
+        Kho = đúng danh sách cases (như ghi lại data.json): upsert, xóa case không còn,
+        thứ tự export theo thứ tự cases. Trả về (số case ghi / đổi, số case xóa).
+        """
+        cases = list(cases)
+        with self.conn:
+            written = self._write(cases)
+            self.conn.execute('CREATE TEMP TABLE IF NOT EXISTS keep (id TEXT PRIMARY KEY, position INTEGER)')
+            self.conn.execute('DELETE FROM temp.keep')
+            self.conn.executemany('INSERT OR REPLACE INTO temp.keep VALUES (?, ?)',
+                                  [(str(case['id']), i) for i, case in enumerate(cases)])
+            removed = self.conn.execute('DELETE FROM cases WHERE id NOT IN (SELECT id FROM temp.keep)').rowcount
+            # Subquery tương quan thay cho UPDATE ... FROM (chỉ có từ SQLite 3.33)
+            self.conn.execute('''
+                UPDATE cases SET position = (SELECT position FROM temp.keep WHERE keep.id = cases.id)
+                WHERE position != (SELECT position FROM temp.keep WHERE keep.id = cases.id)
+            ''')
+        return written, removed
+
+    def set_rescued(self, case_id, value=True):
+        """Đánh dấu case đã / chưa cứu (giữ qua các lần sync / upsert sau); False nếu không có case"""
+        case = self.get(case_id)
+        if case is None:
+            return False
+        case['isRescued'] = bool(value)
+        with self.conn:
+            self.conn.execute('UPDATE cases SET is_rescued = ?, data = ? WHERE id = ?',
+                              (int(bool(value)), json.dumps(case, ensure_ascii=False), str(case_id)))
+        return True
+
+    def _cases(self, sql, params=()):
+        return [json.loads(data) for data, in self.conn.execute(sql, params)]
+
+    def cases(self):
+        """Mọi case theo thứ tự export"""
+        return self._cases('SELECT data FROM cases ORDER BY position')
+
+    def get(self, case_id):
+        row = self.conn.execute('SELECT data FROM cases WHERE id = ?', (str(case_id),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def by_phone(self, phone):
+        """Case có SĐT này (chấp nhận mọi cách viết: có dấu cách, +84...)"""
+        return self._cases('''
+            SELECT c.data FROM phones p JOIN cases c ON c.id = p.case_id
+            WHERE p.phone = ? ORDER BY c.position
+        ''', (phone_key(phone),))
+
+    def by_area(self, area, priority=None, rescued=None):
+        """Case của 1 area, lọc thêm priority / isRescued nếu có"""
+        sql = 'SELECT data FROM cases WHERE area = ?'
+        params = [area]
+        if priority is not None:
+            sql += ' AND priority = ?'
+            params.append(priority)
+        if rescued is not None:
+            sql += ' AND is_rescued = ?'
+            params.append(int(rescued))
+        return self._cases(sql + ' ORDER BY position', params)
+
+    def search(self, text, limit=50, prefix=False):
+        """Tìm theo nội dung, không phân biệt dấu ('dien phu' khớp 'Diên Phú'), xếp theo bm25"""
+        query = fts_query(text, prefix)
+        if not query:
+            return []
+        return self._cases('''
+            SELECT c.data FROM cases_fts f JOIN cases c ON c.pk = f.rowid
+            WHERE cases_fts MATCH ? ORDER BY f.rank LIMIT ?
+        ''', (query, limit))
+
+    def export(self, output, formats=('pretty',)):
+        """Ghi lại data.json (và các định dạng khác, xem formats.py) từ kho; trả về các file đã ghi"""
+        cases = self.cases()
+        return [write_cases(cases, output, fmt) for fmt in formats]
@@ -0,0 +1,231 @@
+import re
+import math
+from .dedup_index import CaseFeatures, DedupIndex
+from .fuzzy import AREA_FUZZY, lookup_area
+from .gazetteer import AREA_GAZETTEER
+from .priority import STRICT_CLASSIFIER
+from .repeats import cut_repeated_prefix
+from .rows import PEOPLE_HINT, drop_people_count, split_people_count
+from .similarity import DEFAULT_BACKEND, is_similar
+from .text import extract_phones, format_phone, normalize_phone, normalize_text, strip_note
+
+# Chiến lược "strict": content chỉ là địa chỉ đã làm sạch, dòng gốc giữ ở original_content
+
+# Ngưỡng cao hơn chiến lược full vì address đã sạch. Backend so sánh >=, lấy số float
+# ngay sau 0.85 để giữ đúng phép so sánh > 0.85 trước đây
+ADDRESS_THRESHOLD = math.nextafter(0.85, 1.0)
+PRIORITY_ORDER = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
+
+def case_features(case):
+    """Đặc trưng so sánh của case (content đã là địa chỉ strict), tính 1 lần"""
+    # Cách đọc số nhà thứ 2: bỏ ô Số người bị pdf-parse dán vào, tách ô trên dòng gốc vì
+    # địa chỉ strict đã mất phần mô tả nhắc lại số người (parse_row: ô Địa chỉ đã tách sẵn)
+    other_keys = ()
+    record = case.get('original_content')
+    content = drop_people_count(case['content'], record)
+    if content != case['content']:
+        other_keys = (normalize_text(content),)
+    # Địa chỉ chỉ gồm ô Chi tiết khu vực + số người ("Diên Khánh55 người"): chưa biết địa
+    # chỉ, không so giống nhau được (vẫn gộp qua SĐT)
+    address = case['content']
+    detail, _ = split_people_count(record or address)
+    if detail and content.startswith(detail) and not PEOPLE_HINT.sub('', content[len(detail):]).strip(' ,.-'):
+        address = ''
+    return CaseFeatures([normalize_phone(p) for p in case['phones']], address,
+                        normalize_text(case['content']), other_keys)
+
+def is_duplicate_features(f1, f2, address_threshold=ADDRESS_THRESHOLD, backend=DEFAULT_BACKEND):
+    """Kiểm tra trùng lặp trên đặc trưng đã tính sẵn"""
+    # Khác số nhà -> 2 hộ khác nhau, trừ khi chung SĐT mà địa chỉ vẫn giống nhau
+    # (gửi lại của cùng 1 hộ, số nhà bị gõ / dán khác đi)
+    if f1.distinct_address(f2):
+        return bool(f1.phones & f2.phones) and _similar_address(f1, f2, address_threshold, backend)
+
+    # Check phones
+    if f1.phones & f2.phones:
+        return True
+
+    # Check address similarity
+    return _similar_address(f1, f2, address_threshold, backend)
+
+def _similar_address(f1, f2, address_threshold, backend):
+    return len(f1.address) > 5 and len(f2.address) > 5 and \
+        is_similar(*f1.compare_keys(f2), address_threshold, backend)
+
+def is_duplicate(case1, case2):
+    """Kiểm tra trùng lặp"""
+    return is_duplicate_features(case_features(case1), case_features(case2))
+
+def new_index():
+    """
+    Chỉ mục blocking cho bước lọc trùng. Ngưỡng 0.85 trên địa chỉ đã sạch
+    -> đòi hỏi ước lượng Jaccard cao hơn mặc định
+    """
+    return DedupIndex(min_agreement=0.4)
+
+def merge_group(dups):
+    """Gộp 1 nhóm trùng: giữ case có priority cao nhất, gộp SĐT"""
+    best = min(dups, key=lambda x: PRIORITY_ORDER[x['priority']])
+    all_phones = set()
+    for d in dups: all_phones.update(d['phones'])
+    best['phones'] = sorted(all_phones)
+    return best
+
+def extract_location_strict(text, repair_glue=True):
+    """
+    Trích xuất địa điểm theo quy tắc nghiêm ngặt (V2 - Enhanced).
+    repair_glue=False khi text đã là ô Địa chỉ tách bởi rows.py (bỏ bước 4).
+    """
+    # 0. Pre-clean: Tách số dính liền với chữ (VD: Thọ13Hẻm -> Thọ 13 Hẻm)
+    # Nhưng cẩn thận với địa chỉ số (VD: 23/10, 14 đường)
+    # Logic: Nếu số nằm giữa 2 ký tự thường/hoa -> khả năng cao là lỗi dính
+    text = re.sub(r'([a-zA-Z])(\d+)([a-zA-Z])', r'\1 \2 \3', text)
+    
+    # 1. Loại bỏ tiền tố Priority
+    text = re.sub(r'^(Khẩn cấp|Ưu tiên cao|Thường)\s*[-:]?\s*', '', text, flags=re.IGNORECASE)
+    
+    # 2. Cắt tại dấu phân cách MẠNH
+    for sep in ['.', '(', ':']:
+        if sep in text: text = text.split(sep)[0]
+        
+    # 3. Xử lý dấu gạch ngang (-) và phẩy (,)
+    # Tách thành các phần, chỉ giữ lại phần KHÔNG PHẢI là mô tả
+    parts = re.split(r'\s*[-–,]\s*', text)
+    valid_parts = []
+    
+    desc_keywords = [
+        'nhà', 'có', 'nước', 'bị', 'kẹt', 'ngập', 'cần', 'người', 'bé', 'trẻ', 
+        'ông', 'bà', 'mẹ', 'bố', 'gia đình', 'khu', 'dãy', 'hẻm trọ', 'phòng trọ',
+        'tình trạng', 'sđt', 'liên hệ', 'gấp', 'khẩn', 'mất', 'không', 'từ', 'sau',
+        'cạnh', 'kế', 'đối diện', 'gần', 'tại', 'ngay', 'chỗ'
+    ]
+    
+    for i, part in enumerate(parts):
+        part = part.strip()
+        if not part: continue
+        
+        # Nếu part bắt đầu bằng số lượng (VD: 13 người, 3 trẻ em) -> Dừng
+        if re.match(r'^\d+\s+(người|bé|trẻ|em|con|bà|ông|gia đình)', part.lower()):
+            break
+            
+        # Nếu part chứa từ khóa mô tả ở đầu -> Dừng
+        # Trừ trường hợp là chỉ dẫn địa lý hợp lệ (VD: Gần cầu...)
+        is_desc = False
+        part_lower = part.lower()
+        
+        # Check keywords
+        for k in desc_keywords:
+            if part_lower.startswith(k):
+                # Exception: "Gần" + Tên riêng (Viết hoa) -> Có thể là địa chỉ
+                if k == 'gần' and i == 0: 
+                    is_desc = False
+                else:
+                    is_desc = True
+                break
+        
+        if is_desc: break
+        valid_parts.append(part)
+        
+    text = ', '.join(valid_parts)
+    
+    # 4. Xử lý lặp từ (VD: 398/15 Lê Đại Cương398/15 LĐC)
+    # Cắt tại đoạn đầu ngắn nhất (>= 10 ký tự) lặp lại ngay sau nó (Z-array, O(n))
+    if repair_glue:
+        text = cut_repeated_prefix(text)
+
+    # 5. Cleanup cuối cùng
+    text = re.sub(r'\d{9,11}', '', text) # Xóa SĐT
+    text = text.strip()
+    text = text.strip('-,.')
+    
+    # 6. Validation: Địa chỉ quá ngắn hoặc chỉ toàn số -> Bỏ
+    if len(text) < 4 or text.isdigit():
+        return ""
+        
+    return text
+
+def parse_line(line):
+    """Parse 1 dòng thành case với địa chỉ nghiêm ngặt (chưa có id), None nếu bỏ qua"""
+    line = strip_note(line.strip())
+    if not line or 'Mức độ ưu tiên' in line: return None
+
+    # 1. Parse Priority
+    priority, _ = STRICT_CLASSIFIER.classify(line)
+
+    # 2. Extract Phones (content gốc đã bỏ SĐT, cùng 1 lượt quét)
+    phones, content_for_extract = extract_phones(line)
+
+    # 3. STRICT LOCATION EXTRACTION
+    # Áp dụng hàm trích xuất
+    strict_address = extract_location_strict(content_for_extract)
+
+    if len(strict_address) < 3: return None # Quá ngắn -> Bỏ
+
+    # 4. Determine Area
+    area = AREA_GAZETTEER.lookup(strict_address) # Check trên địa chỉ đã clean
+
+    # Fallback area check
+    if area == 'Khác':
+        match = re.search(r'(xã|thôn|phường)\s+([A-ZĐ][a-zà-ỹ]+)', strict_address)
+        if match:
+            # Logic map thêm nếu cần
+            pass
+
+    # Fallback cuối: địa danh gõ sai / viết tắt (LĐC)
+    if area == 'Khác':
+        area = AREA_FUZZY.lookup(strict_address)
+
+    return {
+        "content": strict_address, # LƯU ĐỊA CHỈ ĐÃ CLEAN
+        "original_content": content_for_extract.strip(), # Lưu lại gốc để tham khảo nếu cần
+        "phones": phones,
+        "area": area,
+        "priority": priority,
+        "isRescued": False
+    }
+
+def extract_location_lenient(text):
+    """
+    Ô Địa chỉ mở đầu bằng mô tả ("6 người (...), nước ngập, 48/1 Cầu Bè"): bỏ ngoặc,
+    thử từng câu, bỏ dần các đoạn mô tả ở đầu câu, lấy địa chỉ đầu tiên trích được.
+    """
+    text = re.sub(r'\(.*?\)', ' ', text)
+    for sentence in re.split(r'[.:;]|\s[-–]\s', text):
+        parts = re.split(r'\s*[-–,]\s*', sentence)
+        for i in range(len(parts)):
+            address = extract_location_strict(', '.join(parts[i:]), repair_glue=False)
+            if len(address) >= 3:
+                return address
+    return ""
+
+def parse_row(row):
+    """
+    Như parse_line nhưng trên bản ghi đã tách cột (rows.py), không cần sửa lỗi dán ô.
+    Ô Địa chỉ không trích được địa chỉ: bỏ mô tả ở đầu ô, rồi cả bản ghi (như parse_line);
+    không có địa chỉ nào thì giữ nguyên ô (case vẫn cần cứu, không bỏ)
+    """
+    priority, _ = STRICT_CLASSIFIER.classify(row['raw'])
+    phones = [format_phone(p) for p in row['phones']]
+
+    strict_address = extract_location_strict(row['address'], repair_glue=False)
+    if len(strict_address) < 3:
+        strict_address = extract_location_lenient(row['address'])
+    if len(strict_address) < 3:
+        _, body = extract_phones(row['raw'])
+        strict_address = extract_location_strict(body)
+    if len(strict_address) < 3:
+        strict_address = row['address'] or row['area_detail'] or row['raw']
+
+    # Ô Chi tiết khu vực là nguồn chính (rows.split_row), không khớp mới tra trên địa chỉ
+    area = row['area']
+    if area == 'Khác':
+        area = lookup_area(strict_address)
+
+    return {
+        "content": strict_address,
+        "original_content": row['address'],
+        "phones": phones,
+        "area": area,
+        "priority": priority,
+        "isRescued": False
+    }
@@ -0,0 +1,226 @@
+import json
+import random
+import argparse
+
+from .gazetteer import AREA_KEYWORDS
+
+HEADER = 'Mức độ ưu tiênChi tiết khu vựcSố ngườiĐịa chỉSố điện thoại'
+
+# Tỉ lệ xấp xỉ file thật (pdf_content.txt)
+PRIORITY_WEIGHTS = [('Ưu tiên cao', 68), ('Thường', 19), ('Khẩn cấp', 8)]
+DEFAULT_DUP_RATE = 0.45
+
+# Tên đường và dạng viết tắt hay gặp trong tin nhắn
+STREETS = [
+    ('Lương Định Của', 'LĐC'), ('Lê Đại Cương', 'LĐC'), ('Trần Phú', 'Trần Phú'),
+    ('Lạc Long Quân', 'LLQ'), ('Nguyễn Khuyến', 'Ng Khuyến'), ('Đồng Khởi', 'Đồng Khởi'),
+    ('Lý Thái Tổ', 'LTT'), ('Hùng Vương', 'Hùng Vương'), ('2 Tháng 4', '2/4'),
+    ('Lê Hồng Phong', 'LHP'), ('Phong Châu', 'Phong Châu'), ('Võ Văn Ký', 'VVK'),
+    ('Nguyễn Trãi', 'Ng Trãi'), ('Đường Đập Đá', 'Đập Đá'),
+]
+# Ghép họ + đệm + tên để có đủ nhiều tên đường khác nhau cho corpus lớn
+STREET_PARTS = (
+    ['Nguyễn', 'Trần', 'Lê', 'Phạm', 'Hoàng', 'Võ', 'Đặng', 'Bùi', 'Đỗ', 'Huỳnh', 'Ngô', 'Lý'],
+    ['Văn', 'Thị', 'Đình', 'Hữu', 'Công', 'Minh', 'Quang', 'Đức'],
+    ['Cừ', 'Trỗi', 'Huệ', 'Tri Phương', 'Khoái', 'Cảnh', 'Thái', 'Trứ', 'Lợi', 'Du', 'Bảo', 'Tộ'],
+)
+STREETS_PER_AREA = 30
+UNKNOWN_PLACES = ['Hòn Rớ', 'Xóm Cồn', 'Thôn Đắc Lộc', 'Gò Dưa', 'Xóm Bóng', 'Rọc Trầu']
+SITUATIONS = [
+    'Nước ngập tới mái nhà.', 'Có người già và trẻ nhỏ, cần cứu hộ gấp.', 'Mất liên lạc.',
+    'Thiếu lương thực, nước uống.', 'Bà bầu sắp sinh.', 'Nước lên cao, đang trụ trên gác.',
+    'Cần áo phao.', 'Nhà ngập sâu.', 'Người bệnh cần đi viện.', 'Bị cô lập từ tối qua.',
+    'Nước ngập tới ngực, pin điện thoại sắp hết.', 'Có bé dưới 1 tuổi.',
+]
+LANDMARKS = [
+    'gần trường mẫu giáo {}', 'đối diện chợ {}', 'cuối hẻm nhà ông {}', 'kế bên tiệm tạp hóa {}',
+    'sau nhà thờ {}', 'gần cầu {}', 'đi thẳng từ UBND xã {} vào', 'cạnh quán cà phê {}',
+]
+LANDMARK_NAMES = ['Hoa Phượng', 'Nga', 'Ba Tư', 'Sơn Ca', 'Út Hiền', 'Bảy Lộc', 'Thanh Bình', 'Mười Tâm',
+                  'Kim Ngân', 'Hai Lúa', 'Phước Lộc', 'Tư Sang']
+NAMES = ['Chí', 'Huy', 'Mai', 'Bình', 'Tuấn', 'Lan', 'SĐT Mẹ', 'Con gái']
+NO_PHONE = ['(chưa có)', 'Không có SĐT trong tin nhắn', '(Không có SĐT liên hệ trực tiếp)']
+CARRIER_PREFIXES = [
+    '090', '093', '089', '070', '079', '077', '076', '078', '098', '097', '096', '086',
+    '032', '033', '034', '035', '036', '037', '038', '039', '081', '082', '083', '084',
+    '085', '088', '091', '094', '056', '058',
+]
+
+
+def parse_size(text):
+    """'10k' -> 10000, '1M' -> 1000000"""
+    text = text.strip().lower()
+    scale = {'k': 1000, 'm': 1000000}.get(text[-1:], 1)
+    return int(float(text.rstrip('km')) * scale)
+
+
+def _area_weights(rng):
+    """Phân bố khu vực lệch kiểu Zipf: vài khu vực chiếm phần lớn số tin"""
+    keywords = sorted(AREA_KEYWORDS)
+    rng.shuffle(keywords)
+    return keywords, [1 / (rank + 1) ** 0.8 for rank in range(len(keywords))]
+
+
+def _area_streets(rng, places):
+    """Mỗi địa danh một nhóm đường riêng: vài đường thật + đường ghép tên"""
+    streets = {}
+    for place in places:
+        chosen = rng.sample(STREETS, 3)
+        for _ in range(STREETS_PER_AREA - len(chosen)):
+            parts = [rng.choice(group) for group in STREET_PARTS]
+            full = ' '.join(parts)
+            short = parts[-1] if rng.random() < 0.5 else ''.join(w[0] for w in full.split())
+            chosen.append((full, short))
+        streets[place] = chosen
+    return streets
+
+
+def _new_phone(rng):
+    return rng.choice(CARRIER_PREFIXES) + ''.join(rng.choice('0123456789') for _ in range(7))
+
+
+def _format_phone(rng, digits):
+    """Một trong các kiểu ghi SĐT gặp trong file gốc"""
+    r = rng.random()
+    if r < 0.5:
+        text = digits
+    elif r < 0.65:
+        text = f"{digits[:3]} {digits[3:]}"
+    elif r < 0.75:
+        text = f"{digits[:4]} {digits[4:7]} {digits[7:]}"
+    else:
+        # Excel làm mất số 0 đầu và thêm .0
+        text = f"{digits[1:]}.0"
+    if rng.random() < 0.2:
+        text += f" ({rng.choice(NAMES)})"
+    return text
+
+
+def _situation(rng):
+    """Mô tả tình hình: mốc nhận diện + 1-2 câu tình trạng, có số liệu ngẫu nhiên"""
+    parts = []
+    if rng.random() < 0.6:
+        parts.append('(' + rng.choice(LANDMARKS).format(rng.choice(LANDMARK_NAMES)) + ')')
+    if rng.random() < 0.4:
+        parts.append(f"Nước ngập {rng.randint(1, 3)}m{rng.choice(['', '5'])}.")
+    parts.extend(rng.sample(SITUATIONS, rng.randint(1, 2)))
+    return ' '.join(parts)
+
+
+def _new_case(rng, keywords, weights, streets):
+    r = rng.random()
+    if r < 0.07:
+        keyword, area_detail = rng.choice(UNKNOWN_PLACES), ''
+    else:
+        keyword = rng.choices(keywords, weights)[0]
+        area_detail = AREA_KEYWORDS[keyword] if rng.random() < 0.8 else ''
+    street = rng.choice(streets[keyword])
+    number = f"{rng.randint(1, 500)}"
+    if rng.random() < 0.4:
+        number += f"/{rng.randint(1, 80)}"
+    people = rng.randint(1, 15) if rng.random() < 0.5 else None
+    n_phones = 0 if rng.random() < 0.08 else rng.choice([1, 1, 1, 2, 2, 3])
+    return {
+        'priority': rng.choices([p for p, _ in PRIORITY_WEIGHTS], [w for _, w in PRIORITY_WEIGHTS])[0],
+        'area_detail': area_detail,
+        'people': people,
+        'number': number,
+        'street': street,
+        'keyword': keyword,
+        'situation': _situation(rng),
+        'phones': [_new_phone(rng) for _ in range(n_phones)],
+    }
+
+
+def _mutate(rng, case):
+    """Tin nhắn gửi lại của cùng một case: đổi cách ghi SĐT / địa chỉ, thêm tình hình"""
+    dup = dict(case, phones=list(case['phones']))
+    if rng.random() < 0.3:
+        dup['priority'] = rng.choices([p for p, _ in PRIORITY_WEIGHTS], [w for _, w in PRIORITY_WEIGHTS])[0]
+    if dup['phones'] and rng.random() < 0.2:
+        dup['phones'].pop()
+    elif rng.random() < 0.1:
+        dup['phones'].append(_new_phone(rng))
+    if rng.random() < 0.3:
+        dup['situation'] = case['situation'] + ' ' + rng.choice(SITUATIONS)
+    dup['abbreviate'] = rng.random() < 0.4
+    dup['drop_keyword'] = rng.random() < 0.15
+    return dup
+
+
+def format_row(rng, case):
+    """Ghép 5 cột dính liền như output của pdf-parse"""
+    street_full, street_short = case['street']
+    street = street_short if case.get('abbreviate') else street_full
+    address = f"{case['number']} {street}"
+    if not case.get('drop_keyword'):
+        address += f", {case['keyword']}"
+    people = case['people']
+    if people and rng.random() < 0.5:
+        address += f". Có {people} người"
+    address += f". {case['situation']}"
+    if case['phones']:
+        phone_text = ', '.join(_format_phone(rng, p) for p in case['phones'])
+    else:
+        phone_text = rng.choice(NO_PHONE)
+    people_text = str(people) if people else ''
+    return f"{case['priority']}{case['area_detail']}{people_text}{address}{phone_text}"
+
+
+def generate_rows(n, seed=0, dup_rate=DEFAULT_DUP_RATE):
+    """
+    Sinh n dòng giả lập file cứu hộ (tất định theo seed).
+    Yield (dòng, cluster): cluster là id case gốc (các dòng trùng nhau có cùng
+    cluster), None với dòng tiêu đề / dòng rác.
+    """
+    rng = random.Random(seed)
+    keywords, weights = _area_weights(rng)
+    streets = _area_streets(rng, keywords + UNKNOWN_PLACES)
+    originals = []
+    for i in range(n):
+        if i % 500 == 0:
+            yield HEADER, None
+            continue
+        r = rng.random()
+        if r < 0.01:
+            yield 'CHỖ NÀO CHƯA ỔN M.N HỖ TRỢ CHỈNH GIÚP EM, THANK M.N', None
+            continue
+        if originals and r < 0.01 + dup_rate:
+            # Tin gửi lại thường ở gần tin gốc
+            cluster = max(0, len(originals) - 1 - int(rng.expovariate(1 / 100)))
+            case = _mutate(rng, originals[cluster])
+        else:
+            cluster = len(originals)
+            case = _new_case(rng, keywords, weights, streets)
+            originals.append(case)
+        yield format_row(rng, case), cluster
+
+
+def write_corpus(path, n, seed=0, dup_rate=DEFAULT_DUP_RATE, labels_path=None):
+    """Ghi corpus ra file (và nhãn cluster theo số dòng, nếu cần), trả về số dòng"""
+    labels = []
+    with open(path, 'w', encoding='utf-8') as f:
+        for line, cluster in generate_rows(n, seed, dup_rate):
+            f.write(line + '\n')
+            labels.append(cluster)
+    if labels_path:
+        with open(labels_path, 'w', encoding='utf-8') as f:
+            json.dump({'seed': seed, 'dup_rate': dup_rate, 'clusters': labels}, f)
+    return len(labels)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sinh corpus cứu hộ giả lập cho benchmark")
+    parser.add_argument('size', help="Số dòng, VD: 10k, 100k, 1M")
+    parser.add_argument('--output', required=True)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--dup-rate', type=float, default=DEFAULT_DUP_RATE)
+    parser.add_argument('--labels', help="Ghi nhãn cluster (JSON) theo từng dòng")
+    args = parser.parse_args()
+
+    n = write_corpus(args.output, parse_size(args.size), args.seed, args.dup_rate, args.labels)
+    print(f"✅ {n} dòng -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import re
+
+from .normalize import fold_chars
+from .phones import tokenize
+
+
+def normalize_text(text):
+    """
+    Chuẩn hóa text (giữ dấu) cho id ổn định (changes.content_id), đổi hàm này là đổi id.
+    So khớp địa chỉ / địa danh dùng normalize.fold (không dấu).
+    """
+    text = text.lower()
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'[^\w\s]', '', text)
+    return text.strip()
+
+
+# Ghi chú của người nhập bảng, không thuộc bản ghi nào. pdf-parse để riêng 1 dòng,
+# pypdf dán vào cuối bản ghi "732 LĐC (tai biến)" nên phải cắt bỏ chứ không bỏ cả dòng
+EDITOR_NOTE = 'CHỖ NÀO'
+
+
+def strip_note(line):
+    """Cắt ghi chú của người nhập (từ 'CHỖ NÀO ...' đến hết dòng)"""
+    i = line.find(EDITOR_NOTE)
+    return line if i < 0 else line[:i].rstrip()
+
+
+def normalize_phone(phone):
+    """Chuẩn hóa số điện thoại"""
+    return re.sub(r'\D', '', phone)
+
+
+def format_phone(digits):
+    """0xxx xxx xxx cho số 10 chữ số, còn lại giữ nguyên"""
+    if len(digits) == 10:
+        return f"{digits[:4]} {digits[4:7]} {digits[7:]}"
+    return digits
+
+
+def extract_phones(line):
+    """
+    SĐT (đã chuẩn hóa + format) trong dòng và phần text còn lại sau khi bỏ SĐT,
+    trong 1 lượt quét (xem phones.tokenize).
+    """
+    phones, rest = tokenize(line)
+    return [format_phone(p) for p in phones], rest
+
+
+def slugify(text):
+    """'Vĩnh Ngọc' -> 'vinh-ngoc' (bỏ dấu, chỉ giữ a-z0-9)"""
+    return re.sub(r'[^a-z0-9]+', '-', fold_chars(text)).strip('-')
@@ -0,0 +1,44 @@
+"""Lọc trùng trên các cặp bản ghi thật trong pdf_content.txt"""
+import pytest
+
+from rescue_parser.pipeline import STRATEGIES
+
+SAME_HOUSEHOLD = [
+    # Ô Số người bị dán vào số nhà: "5" + "48/1"
+    ('Ưu tiên caoCầu Bè55 người (người già, trẻ nhỏ), nước đã qua người, 48/1 Cầu Bè.905006857.0',
+     'Ưu tiên caoCầu Bè548/1 Cầu Bè. 5 người (người già và trẻ nhỏ). Nước đã qua người, cần cứu trợ gấp.905006857.0'),
+    # Cùng nhà, 2 lần báo khác số người
+    ('Ưu tiên caoDiên An2Góc đường Bà Đề và Võ Nguyên Giáp, Diên An – 2 người lớn, 1 người già362329698.0',
+     'Ưu tiên caoDiên An3Góc đường Bà Đề và Võ Nguyên Giáp (Diên An). 3 người (2 người lớn, 1 người già lớn tuổi).362329698.0'),
+    ('ThườngVĩnh Ngọc241 Liên Hoa, Xuân Lạc, Vĩnh Ngọc (gần bờ kè). 2 người (Thảo, Bình).977610367.0',
+     'ThườngVĩnh Ngọc41 Liên Hoa, Xuân Lạc, Vĩnh Ngọc: Tên Thảo, tên Bình (gần bờ kè).977610367.0'),
+    # Số lượng người ("3 trẻ nhỏ", "6 lớn") không phải số nhà
+    ('Ưu tiên caoDiên Điền66 người (3 trẻ nhỏ, 6 người lớn), nước ngập gần đến mái nhà, 43 đường Bưu Điện, '
+     'Tổ 2 Thôn 3, xã Diên Điền (Diên Phú cũ).0339606131',
+     'Ưu tiên caoDiên Điền99 người (3 trẻ nhỏ, 6 lớn), nước xiết, ngập gần đến mái, 43 đường Bưu Điện, '
+     'Diên Điền (Diên Phú cũ).0339606131 / 0986107788'),
+]
+
+DISTINCT_HOUSEHOLDS = [
+    ('ThườngLương Đình Của505/16 LĐC(chưa có)', 'ThườngLương Đình Của505/71 LĐC(chưa có)'),
+    ('Khẩn cấpLương Định Của624/67 Lương Định Của. (6 người: 2 phụ nữ, 2 đàn ông)(chưa có)',
+     'Khẩn cấpLương Định Của585/362 Lương Định Của. (6 người: 2 phụ nữ, 2 đàn ông)(chưa có)'),
+]
+
+
+def _is_duplicate(strategy, line1, line2):
+    cases = [strategy.parse_line(line) for line in (line1, line2)]
+    assert all(cases)
+    return strategy.is_duplicate_features(*(strategy.case_features(case) for case in cases))
+
+
+@pytest.mark.parametrize('name', ['full', 'strict'])
+@pytest.mark.parametrize('line1, line2', SAME_HOUSEHOLD)
+def test_same_household_merged(name, line1, line2):
+    assert _is_duplicate(STRATEGIES[name], line1, line2)
+
+
+@pytest.mark.parametrize('name', ['full', 'strict'])
+@pytest.mark.parametrize('line1, line2', DISTINCT_HOUSEHOLDS)
+def test_distinct_households_kept(name, line1, line2):
+    assert not _is_duplicate(STRATEGIES[name], line1, line2)
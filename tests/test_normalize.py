@@ -0,0 +1,24 @@
+"""Gấp dấu / tra khu vực với văn bản NFD (chữ + dấu rời)"""
+import unicodedata
+
+from rescue_parser.gazetteer import AREA_GAZETTEER
+from rescue_parser.normalize import fold, fold_batch, fold_chars
+
+
+def nfd(text):
+    return unicodedata.normalize('NFD', text)
+
+
+def test_fold_nfd_same_as_nfc():
+    assert fold(nfd('Diên Phú')) == fold('Diên Phú') == 'dien phu'
+    assert fold_chars(nfd('Diên Phú, 23/10')) == 'dien phu  23 10'
+
+
+def test_fold_batch_keeps_nul():
+    assert fold_batch(['a\x00b', nfd('Đà Nẵng'), '']) == [fold('a\x00b'), 'da nang', '']
+
+
+def test_gazetteer_nfd():
+    assert AREA_GAZETTEER.lookup(nfd('Diên Phú, thôn 3')) == AREA_GAZETTEER.lookup('Diên Phú, thôn 3') != 'Khác'
+    assert AREA_GAZETTEER.find(nfd('xã Cầu Kênh')) == AREA_GAZETTEER.find('xã Cầu Kênh')
+    assert AREA_GAZETTEER.match_prefix(nfd('Diên Phú23')) == 'Diên Phú'
@@ -0,0 +1,25 @@
+"""Kho SQLite: isRescued đánh dấu trong kho không bị pipeline ghi đè"""
+from rescue_parser.store import CaseStore
+
+
+def make_case(case_id, content, rescued=False):
+    return {'id': case_id, 'area': 'Diên Phú', 'priority': 'HIGH', 'content': content,
+            'phones': ['0905 006 857'], 'isRescued': rescued}
+
+
+def test_sync_keeps_rescued(tmp_path):
+    with CaseStore(str(tmp_path / 'cases.db')) as store:
+        store.sync([make_case('a', 'Thôn 1'), make_case('b', 'Thôn 2')])
+        assert store.set_rescued('a')
+        assert not store.set_rescued('missing')
+
+        written, removed = store.sync([make_case('b', 'Thôn 2'), make_case('a', 'Thôn 1, nước lên')])
+        assert (written, removed) == (1, 0)
+        assert store.get('a') == make_case('a', 'Thôn 1, nước lên', rescued=True)
+        assert [case['id'] for case in store.by_area('Diên Phú', rescued=True)] == ['a']
+        assert [case['id'] for case in store.cases()] == ['b', 'a']
+
+        # Không đổi gì: case đã cứu không bị ghi lại với isRescued của pipeline
+        assert store.upsert([make_case('a', 'Thôn 1, nước lên')]) == 0
+        store.set_rescued('a', False)
+        assert store.by_area('Diên Phú', rescued=True) == []